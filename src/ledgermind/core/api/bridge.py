@@ -1,10 +1,11 @@
 import os
 import re
 import logging
+import numpy as np
 from typing import List, Optional, Dict, Any
 from ledgermind.core.core.schemas import MemoryDecision
 from ledgermind.core.api.memory import Memory
-from ledgermind.core.stores.semantic_store.loader import MemoryLoader
+from ledgermind.core.stores.semantic_store.cache import PromptCache
 
 logger = logging.getLogger(__name__)
 
@@ -14,16 +15,28 @@ class IntegrationBridge:
     Provides streamlined methods for context injection and interaction recording.
     """
     
-    def __init__(self, memory_path: str = ".ledgermind", relevance_threshold: float = 0.35, retention_turns: int = 5):
-        self.memory_path = os.path.abspath(memory_path)
-        try:
-            self._memory = Memory(storage_path=self.memory_path)
-        except Exception as e:
-            logger.critical(f"Failed to initialize LedgerMind Core: {e}")
-            raise RuntimeError(f"Memory initialization failed. Check permissions for {memory_path}")
+    def __init__(self, memory_path: str = ".ledgermind", relevance_threshold: float = 0.35, retention_turns: int = 5,
+                 memory: Optional[Memory] = None, prompt_cache_size: int = 64, prompt_cache_threshold: float = 0.95):
+        """
+        Opens the memory at `memory_path`, or wraps an already-open `memory`
+        (e.g. the MCP server's) so no stores are re-initialised.
+        Prompts within `prompt_cache_threshold` cosine similarity of a recent
+        one reuse its retrieved memories while the store is unchanged.
+        """
+        if memory is not None:
+            self.memory_path = os.path.abspath(memory.storage_path)
+            self._memory = memory
+        else:
+            self.memory_path = os.path.abspath(memory_path)
+            try:
+                self._memory = Memory(storage_path=self.memory_path)
+            except Exception as e:
+                logger.critical(f"Failed to initialize LedgerMind Core: {e}")
+                raise RuntimeError(f"Memory initialization failed. Check permissions for {memory_path}")
             
         self.relevance_threshold = relevance_threshold
         self.retention_turns = retention_turns
+        self.prompt_cache = PromptCache(max_entries=prompt_cache_size, threshold=prompt_cache_threshold)
         # Maps decision_id -> turn_number when it was last injected
         self._active_context_ids: Dict[str, int] = {}
         self._turn_counter = 0
@@ -36,27 +49,45 @@ class IntegrationBridge:
     def _find_relevant_memories(self, prompt: str, limit: int = 3, exclude_ids: Optional[set[str]] = None) -> List[Dict[str, Any]]:
         """Helper to find memories with exclusion logic."""
         try:
-            results = self._memory.search_decisions(prompt, limit=limit, mode="balanced")
-            memories = []
             exclude = exclude_ids or set()
-            
-            for item in results:
-                fid = item.get('id')
-                if fid in exclude:
-                    continue
-                    
-                score = item.get('score', 0)
-                if score >= self.relevance_threshold:
-                    memories.append({
-                        "id": fid,
-                        "title": item.get('title'),
-                        "content": item.get('preview')
-                    })
-            return memories
+            return [m for m in self._retrieve(prompt, limit) if m["id"] not in exclude]
         except Exception as e:
             logger.error(f"Error searching memories: {e}")
             return []
 
+    def _embed_prompt(self, prompt: str) -> Optional[np.ndarray]:
+        if self.prompt_cache.max_entries <= 0:
+            return None
+        try:
+            embedding = self._memory.vector.encode_query(prompt)
+        except Exception:
+            return None
+        return embedding if isinstance(embedding, np.ndarray) else None
+
+    def _retrieve(self, prompt: str, limit: int) -> List[Dict[str, Any]]:
+        """Relevant memories for a prompt, served from the prompt cache for near-duplicates."""
+        embedding = self._embed_prompt(prompt)
+        generation = self._memory.semantic.generation
+        if embedding is not None:
+            cached = self.prompt_cache.get(embedding, (limit,), generation)
+            if cached is not None:
+                for m in cached:
+                    self._memory.semantic.meta.increment_hit(m["id"])
+                return cached
+
+        memories = []
+        for item in self._memory.search_decisions(prompt, limit=limit, mode="balanced"):
+            score = item.get('score', 0)
+            if score >= self.relevance_threshold:
+                memories.append({
+                    "id": item.get('id'),
+                    "title": item.get('title'),
+                    "content": item.get('preview')
+                })
+        if embedding is not None:
+            self.prompt_cache.put(embedding, (limit,), generation, memories)
+        return memories
+
     def check_health(self) -> Dict[str, Any]:
         """
         Runs a full health check on the memory system.
@@ -327,6 +358,7 @@ class IntegrationBridge:
                 "episodic_count": self._memory.episodic.count_events() if hasattr(self._memory.episodic, 'count_events') else "unknown",
                 "semantic_count": semantic_count,
                 "vector_count": len(self._memory.vector._doc_ids) if self._memory.vector else 0,
+                "prompt_cache": self.prompt_cache.stats(),
                 "health": self.check_health()
             }
         except Exception as e:
@@ -340,18 +372,16 @@ class IntegrationBridge:
             return None
             
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                data, body = MemoryLoader.parse(content)
-                ctx = data.get("context", {})
-                title = ctx.get("title", "Document")
-                rationale = ctx.get("rationale", "")
-                
-                formatted = f"### {title}\n"
-                if rationale:
-                    formatted += f"**Rationale:** {rationale}\n"
-                formatted += body.strip()
-                return formatted
+            data, body = self._memory.semantic.parse_cache.get(fid)
+            ctx = data.get("context", {})
+            title = ctx.get("title", "Document")
+            rationale = ctx.get("rationale", "")
+            
+            formatted = f"### {title}\n"
+            if rationale:
+                formatted += f"**Rationale:** {rationale}\n"
+            formatted += body.strip()
+            return formatted
         except Exception as e:
             logger.warning(f"Failed to load decision {fid}: {e}")
             return None
@@ -3,8 +3,12 @@ import yaml
 import logging
 import shutil
 import subprocess
+import time
+import threading
+import numpy as np
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeout
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Union, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -17,11 +21,12 @@ from ledgermind.core.core.schemas import (
 from ledgermind.core.core.exceptions import InvariantViolation, ConflictError
 from ledgermind.core.stores.episodic import EpisodicStore
 from ledgermind.core.stores.semantic import SemanticStore
+from ledgermind.core.stores.semantic_store.cache import SearchCache
 from ledgermind.core.stores.interfaces import MetadataStore, EpisodicProvider, AuditProvider
 from ledgermind.core.reasoning.conflict import ConflictEngine
 from ledgermind.core.reasoning.resolution import ResolutionEngine
 from ledgermind.core.reasoning.decay import DecayEngine, DecayReport
-from ledgermind.core.reasoning.reflection import ReflectionEngine
+from ledgermind.core.reasoning.reflection import ReflectionEngine, REFLECTION_BACKLOG
 from ledgermind.core.reasoning.git_indexer import GitIndexer
 from ledgermind.core.stores.vector import VectorStore
 from ledgermind.core.core.targets import TargetRegistry
@@ -32,6 +37,9 @@ class Memory:
     Provides methods for processing events, recording decisions, and managing knowledge decay.
     """
     _git_available: Optional[bool] = None
+    # (probe time, whether user.name and user.email are set)
+    _git_identity: Optional[Tuple[float, Optional[bool]]] = None
+    ENV_PROBE_TTL = 300.0
 
     def __init__(self, 
                  storage_path: Optional[str] = None, 
@@ -44,9 +52,12 @@ class Memory:
                  meta_store_provider: Optional[MetadataStore] = None,
                  audit_store_provider: Optional[AuditProvider] = None,
                  vector_model: Optional[str] = None,
-                 vector_workers: Optional[int] = None):
+                 vector_workers: Optional[int] = None,
+                 read_only: bool = False):
         """
         Initialize the memory system.
+        With `read_only` (or `config.read_only`), an existing store is opened for
+        queries only, skipping all mutating startup work; writes raise PermissionError.
         """
         if config:
             self.config = config
@@ -57,36 +68,57 @@ class Memory:
                 trust_boundary=trust_boundary or TrustBoundary.AGENT_WITH_INTENT,
                 namespace=namespace or "default",
                 vector_model=vector_model or "all-MiniLM-L6-v2",
-                vector_workers=vector_workers if vector_workers is not None else 0
+                vector_workers=vector_workers if vector_workers is not None else 0,
+                read_only=read_only
             )
 
         self.storage_path = os.path.abspath(self.config.storage_path)
         self.trust_boundary = self.config.trust_boundary
         self.namespace = self.config.namespace
+        self.read_only = read_only or self.config.read_only
+        self._search_pool: Optional[ThreadPoolExecutor] = None
+        self._search_pool_lock = threading.Lock()
+        # Retriever calls still running after their deadline, by retriever name
+        self._abandoned_retrievers: Dict[str, Future] = {}
+        self.search_cache = SearchCache(
+            max_entries=self.config.search_cache_entries,
+            ttl_seconds=self.config.search_cache_ttl_ms / 1000.0
+        )
         
-        try:
-            if not os.path.exists(self.storage_path):
-                os.makedirs(self.storage_path, exist_ok=True)
-        except PermissionError:
-            raise ValueError(f"No permission to create storage path: {self.storage_path}")
+        if self.read_only:
+            if not os.path.isdir(self.storage_path):
+                raise ValueError(f"No memory store at {self.storage_path}")
+        else:
+            try:
+                if not os.path.exists(self.storage_path):
+                    os.makedirs(self.storage_path, exist_ok=True)
+            except PermissionError:
+                raise ValueError(f"No permission to create storage path: {self.storage_path}")
             
         # Pluggable Storage Logic
         if semantic_store:
             self.semantic = semantic_store
-            self.episodic: Union[EpisodicStore, EpisodicProvider] = episodic_store or EpisodicStore(os.path.join(self.storage_path, "episodic.db"))
+            self.episodic: Union[EpisodicStore, EpisodicProvider] = episodic_store or EpisodicStore(os.path.join(self.storage_path, "episodic.db"), read_only=self.read_only)
         else:
             self.semantic = SemanticStore(
                 os.path.join(self.storage_path, "semantic"), 
                 trust_boundary=self.trust_boundary,
                 meta_store=meta_store_provider,
-                audit_store=audit_store_provider
+                audit_store=audit_store_provider,
+                parse_cache_bytes=self.config.parse_cache_mb * 1024 * 1024,
+                frontmatter_format=self.config.frontmatter_format,
+                group_commit_ms=self.config.git_group_commit_ms,
+                audit_backend=self.config.audit_backend,
+                async_audit=self.config.async_audit,
+                read_only=self.read_only
             )
-            self.episodic: Union[EpisodicStore, EpisodicProvider] = episodic_store or EpisodicStore(os.path.join(self.storage_path, "episodic.db"))
+            self.episodic: Union[EpisodicStore, EpisodicProvider] = episodic_store or EpisodicStore(os.path.join(self.storage_path, "episodic.db"), read_only=self.read_only)
 
         self.vector = VectorStore(
             os.path.join(self.storage_path, "vector_index"),
             model_name=self.config.vector_model,
-            workers=self.config.vector_workers
+            workers=self.config.vector_workers,
+            read_only=self.read_only
         )
         self.vector.load()
 
@@ -102,8 +134,13 @@ class Memory:
         
         self.targets = TargetRegistry(self.semantic.repo_path)
         
-        # Immediate environment check
-        self.check_environment()
+        # Immediate environment check (read-only opens leave Git alone)
+        if not self.read_only:
+            self.check_environment()
+
+    def _ensure_writable(self):
+        if self.read_only:
+            raise PermissionError("Memory is open read-only")
 
     def check_environment(self) -> Dict[str, Any]:
         """
@@ -153,16 +190,19 @@ class Memory:
         if not results["git_available"]:
             results["errors"].append("Git is not installed or not in PATH. Semantic storage will fail.")
         else:
-            # Check git config
-            try:
-                name = subprocess.run(["git", "config", "user.name"], capture_output=True, text=True).stdout.strip()
-                email = subprocess.run(["git", "config", "user.email"], capture_output=True, text=True).stdout.strip()
-                if name and email:
-                    results["git_configured"] = True
-                else:
-                    results["warnings"].append("Git user.name or user.email not configured. Commits will use defaults.")
-            except Exception:
-                pass
+            # Check git config (re-probed at most every ENV_PROBE_TTL seconds)
+            now = time.monotonic()
+            if Memory._git_identity is None or now - Memory._git_identity[0] >= self.ENV_PROBE_TTL:
+                try:
+                    name = subprocess.run(["git", "config", "user.name"], capture_output=True, text=True).stdout.strip()
+                    email = subprocess.run(["git", "config", "user.email"], capture_output=True, text=True).stdout.strip()
+                    Memory._git_identity = (now, bool(name and email))
+                except Exception:
+                    Memory._git_identity = (now, None)
+            if Memory._git_identity[1]:
+                results["git_configured"] = True
+            elif Memory._git_identity[1] is False:
+                results["warnings"].append("Git user.name or user.email not configured. Commits will use defaults.")
             
         # 2. Check Storage Permissions and Disk Space
         if os.path.exists(self.storage_path):
@@ -189,11 +229,11 @@ class Memory:
             except Exception as e:
                 results["errors"].append(f"Failed to create storage path: {e}")
                 
-        # 3. Check Repo Health (if audit is git)
-        from ledgermind.core.stores.audit_git import GitAuditProvider
-        if isinstance(self.semantic.audit, GitAuditProvider):
+        # 3. Check Repo Health (if audit is git, possibly behind the async queue)
+        git = self.semantic._git
+        if git is not None:
             try:
-                self.semantic.audit.initialize()
+                git.initialize()
                 results["repo_healthy"] = True
             except Exception as e:
                 results["errors"].append(f"Git repository initialization failed: {e}")
@@ -214,6 +254,7 @@ class Memory:
         """
         Process an incoming event and decide whether to persist it.
         """
+        self._ensure_writable()
         if (self.trust_boundary == TrustBoundary.HUMAN_ONLY and 
             source == "agent" and 
             kind == KIND_DECISION):
@@ -253,8 +294,9 @@ class Memory:
         
         if decision.should_persist:
             if decision.store_type == "episodic":
-                ev_id = self.episodic.append(event)
-                decision.metadata["event_id"] = ev_id
+                def log_event():
+                    decision.metadata["event_id"] = self.episodic.append(event)
+                self.semantic.after_commit(log_event)
             elif decision.store_type == "semantic":
                 # Use Transaction for atomic save + status updates
                 with self.semantic.transaction():
@@ -283,26 +325,30 @@ class Memory:
                     new_fid = self.semantic.save(event)
                     decision.metadata["file_id"] = new_fid
                     
-                    # 3.5: Index in VectorStore
-                    try:
-                        # Combine content with rationale for better grounded search
-                        indexed_content = event.content
-                        ctx = event.context
-                        rationale = ""
-                        if isinstance(ctx, dict):
-                            rationale = ctx.get('rationale', '')
-                        elif hasattr(ctx, 'rationale'):
-                            rationale = getattr(ctx, 'rationale', '')
-                        
-                        if rationale:
-                            indexed_content = f"{event.content}\n{rationale}"
-
-                        self.vector.add_documents([{
-                            "id": new_fid,
-                            "content": indexed_content
-                        }])
-                    except Exception as ve:
-                        logger.warning(f"Vector indexing failed for {new_fid}: {ve}")
+                    # 3.5: Index in VectorStore and add the Immortal Link once the
+                    # decision is committed, so a rolled-back save leaves neither behind
+                    def index_and_link():
+                        try:
+                            # Combine content with rationale for better grounded search
+                            indexed_content = event.content
+                            ctx = event.context
+                            rationale = ""
+                            if isinstance(ctx, dict):
+                                rationale = ctx.get('rationale', '')
+                            elif hasattr(ctx, 'rationale'):
+                                rationale = getattr(ctx, 'rationale', '')
+
+                            if rationale:
+                                indexed_content = f"{event.content}\n{rationale}"
+
+                            self.vector.add_documents([{
+                                "id": new_fid,
+                                "content": indexed_content
+                            }])
+                        except Exception as ve:
+                            logger.warning(f"Vector indexing failed for {new_fid}: {ve}")
+                        decision.metadata["event_id"] = self.episodic.append(event, linked_id=new_fid)
+                    self.semantic.after_commit(index_and_link)
 
                     # 4. Now that we have new_fid, update back-links properly
                     if intent and intent.resolution_type == "supersede":
@@ -313,10 +359,6 @@ class Memory:
                                 commit_msg=f"Superseded by {new_fid}"
                             )
 
-                # Immortal Link (after transaction success)
-                ev_id = self.episodic.append(event, linked_id=new_fid)
-                decision.metadata["event_id"] = ev_id
-                
         return decision
 
 
@@ -326,12 +368,42 @@ class Memory:
         """
         return self.semantic.list_decisions()
 
-    def get_decision_history(self, decision_id: str) -> List[Dict[str, Any]]:
+    def get_decision_history(self, decision_id: str, limit: int = 50, before: Optional[int] = None) -> List[Dict[str, Any]]:
         """
-        Retrieve the full version history of a specific decision from the audit log.
+        Retrieve the version history of a specific decision, newest first.
+        Served from the metadata history table; pass the `id` of the last entry
+        as `before` to fetch the next page. Falls back to the Git audit log for
+        metadata stores without a history table.
         """
         self.semantic._validate_fid(decision_id)
-        return self.semantic.audit.get_history(decision_id)
+        if hasattr(self.semantic.meta, "get_history"):
+            return self.semantic.meta.get_history(decision_id, limit=limit, before=before)
+        return self.semantic.audit.get_history(decision_id)[:limit]
+
+    def get_decision_as_of(self, decision_id: str, as_of: Union[datetime, str]) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve the version of a decision that was current at `as_of`
+        (a datetime or ISO-8601 string, local time), or None if it did not exist yet.
+        """
+        self.semantic._validate_fid(decision_id)
+        if isinstance(as_of, datetime):
+            as_of = as_of.isoformat()
+        return self.semantic.meta.get_as_of(decision_id, as_of)
+
+    def get_target_timeline(self, target: str, limit: int = 50, before: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Retrieve every recorded version of every decision about `target`,
+        newest first, with the same keyset pagination as get_decision_history.
+        """
+        return self.semantic.meta.get_target_timeline(target, limit=limit, before=before)
+
+    def rebuild_history(self) -> int:
+        """
+        Rebuild the decision history table from the Git audit log.
+        Returns the number of versions restored.
+        """
+        self._ensure_writable()
+        return self.semantic.rebuild_history()
 
     def get_recent_events(self, limit: int = 10, include_archived: bool = False) -> List[Dict[str, Any]]:
         """
@@ -344,59 +416,112 @@ class Memory:
         """
         Manually link an episodic event to a semantic record.
         """
+        self._ensure_writable()
         self.episodic.link_to_semantic(event_id, semantic_id)
+        # Evidence counts feed the search ranking
+        self.semantic.bump_generation()
 
     def update_decision(self, decision_id: str, updates: Dict[str, Any], commit_msg: str) -> bool:
         """
         Coordinates updates to a semantic record across all stores.
         """
+        self._ensure_writable()
         self.semantic._validate_fid(decision_id)
         
         # 1. Update Semantic Store (Filesystem + Metadata DB)
         self.semantic.update_decision(decision_id, updates, commit_msg)
-        
-        # 2. Update Vector Index if content/rationale changed
-        if "content" in updates or "rationale" in updates:
-            meta = self.semantic.meta.get_by_fid(decision_id)
-            if meta:
-                indexed_content = meta.get('content', '')
+        meta = self.semantic.meta.get_by_fid(decision_id)
+        if not meta:
+            return True
+
+        def index_and_log():
+            # 2. Update Vector Index if content/rationale changed
+            if "content" in updates or "rationale" in updates:
                 try:
                     self.vector.add_documents([{
                         "id": decision_id,
-                        "content": indexed_content
+                        "content": meta.get('content', '')
                     }])
+                    self.semantic.bump_generation()
                 except Exception as ve:
                     logger.warning(f"Vector re-indexing failed for {decision_id}: {ve}")
-        
-        # 3. Create episodic event to log the update
-        meta = self.semantic.meta.get_by_fid(decision_id)
-        if meta:
-            event = MemoryEvent(
-                source="system",
-                kind="commit_change",
-                content=f"Updated {meta.get('kind')}: {meta.get('title')}",
-                context={
-                    "original_kind": meta.get('kind', 'decision'),
-                    "updates": updates,
-                    "target": meta.get('target'),
-                    "rationale": commit_msg
-                }
-            )
-            self.episodic.append(event, linked_id=decision_id)
-            
+
+            # 3. Create episodic event to log the update
+            self.episodic.append(self._update_event(meta, updates, commit_msg), linked_id=decision_id)
+
+        # Deferred while a transaction is open, so a rollback leaves nothing behind
+        self.semantic.after_commit(index_and_log)
         return True
 
+    @staticmethod
+    def _update_event(meta: Dict[str, Any], updates: Dict[str, Any], commit_msg: str) -> MemoryEvent:
+        """Episodic record of an update applied to a semantic record."""
+        return MemoryEvent(
+            source="system",
+            kind="commit_change",
+            content=f"Updated {meta.get('kind')}: {meta.get('title')}",
+            context={
+                "original_kind": meta.get('kind', 'decision'),
+                "updates": updates,
+                "target": meta.get('target'),
+                "rationale": commit_msg
+            }
+        )
+
+    def update_decisions(self, updates: Dict[str, Dict[str, Any]], commit_msg: str,
+                         messages: Optional[Dict[str, str]] = None) -> List[str]:
+        """
+        Bulk form of `update_decision`: applies all updates in one semantic
+        transaction and one audit commit, re-indexes changed content in one
+        batch and logs the episodic events in one insert. `messages` optionally
+        gives a per-record message in place of `commit_msg`.
+        """
+        self._ensure_writable()
+        if not updates:
+            return []
+        messages = messages or {}
+        self.semantic.update_many(updates, commit_msg, messages=messages)
+
+        metas = {fid: self.semantic.meta.get_by_fid(fid) for fid in updates}
+        reindex = [
+            {"id": fid, "content": metas[fid].get('content', '')}
+            for fid, changes in updates.items()
+            if metas[fid] and ("content" in changes or "rationale" in changes)
+        ]
+
+        def index_and_log():
+            if reindex:
+                try:
+                    self.vector.add_documents(reindex)
+                    self.semantic.bump_generation()
+                except Exception as ve:
+                    logger.warning(f"Vector re-indexing failed for {len(reindex)} records: {ve}")
+
+            self.episodic.append_many([
+                (self._update_event(meta, updates[fid], messages.get(fid, commit_msg)), fid)
+                for fid, meta in metas.items() if meta
+            ])
+
+        self.semantic.after_commit(index_and_log)
+        return list(updates)
+
     def run_decay(self, dry_run: bool = False) -> DecayReport:
         """
         Execute the decay process for episodic and semantic memories.
         """
-        # 1. Episodic Decay
-        all_events = self.episodic.query(limit=20000, status=None)
-        to_archive, to_prune, retained = self.decay_engine.evaluate(all_events)
+        self._ensure_writable()
+        # 1. Episodic Decay (columnar: ids, epoch timestamps and masks straight from SQLite)
+        if hasattr(self.episodic, "decay_columns"):
+            cols = self.episodic.decay_columns()
+            archive_ids, prune_ids, retained = self.decay_engine.evaluate_columns(
+                cols["ids"], cols["timestamps"], cols["active"], cols["immortal"])
+            to_archive, to_prune = archive_ids.tolist(), prune_ids.tolist()
+        else:
+            all_events = self.episodic.query(limit=20000, status=None)
+            to_archive, to_prune, retained = self.decay_engine.evaluate(all_events)
         
         # 2. Semantic Decay
-        all_decisions = self.semantic.meta.list_all()
-        semantic_results = self.decay_engine.evaluate_semantic(all_decisions)
+        updates, forgotten = self._plan_semantic_decay()
         
         forgotten_count = 0
         if not dry_run:
@@ -404,65 +529,144 @@ class Memory:
             self.episodic.mark_archived(to_archive)
             self.episodic.physical_prune(to_prune)
             
-            # Apply Semantic changes
-            for fid, new_conf, should_forget in semantic_results:
-                if should_forget:
-                    logger.info(f"Semantic Decay: Forgetting {fid} (confidence dropped to {new_conf})")
-                    self.forget(fid)
-                    forgotten_count += 1
-                else:
-                    updates = {"confidence": new_conf}
-                    
-                    # Logic for deprecating stale decisions
-                    # Retrieve current metadata to check kind and status
-                    meta = self.semantic.meta.get_by_fid(fid)
-                    if meta and meta.get('kind') in ('decision', 'constraint') and meta.get('status') == 'active':
-                        if new_conf < 0.5:
-                            logger.info(f"Semantic Decay: Deprecating {fid} (confidence dropped to {new_conf})")
-                            updates["status"] = "deprecated"
-                    
-                    self.semantic.update_decision(fid, updates, 
-                                                  commit_msg=f"Decay: Reduced confidence to {new_conf}")
+            # Apply Semantic changes as one transaction and one audit commit
+            for fid in forgotten:
+                logger.info(f"Semantic Decay: Forgetting {fid}")
+            if updates or forgotten:
+                self.semantic.update_many(
+                    updates, purge=forgotten,
+                    commit_msg=f"Decay: Reduced confidence of {len(updates)} records, forgot {len(forgotten)}"
+                )
+                for fid in forgotten:
+                    self.vector.remove_id(fid)
+                if forgotten:
+                    self.semantic.bump_generation()
+                forgotten_count = len(forgotten)
             
         return DecayReport(len(to_archive), len(to_prune), retained, semantic_forgotten=forgotten_count)
 
-    def run_reflection(self) -> List[str]:
+    def _plan_semantic_decay(self) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+        """Returns the context updates and the fids to forget for a semantic decay pass."""
+        meta = self.semantic.meta
+        if not hasattr(meta, "decay_columns"):
+            updates, forgotten = {}, []
+            records = {d['fid']: d for d in meta.list_all()}
+            for fid, new_conf, should_forget in self.decay_engine.evaluate_semantic(list(records.values())):
+                if should_forget:
+                    forgotten.append(fid)
+                    continue
+                updates[fid] = {"confidence": new_conf}
+                rec = records[fid]
+                if new_conf < 0.5 and rec.get('kind') in ('decision', 'constraint') and rec.get('status') == 'active':
+                    updates[fid]["status"] = "deprecated"
+            return updates, forgotten
+
+        cols = meta.decay_columns()
+        decayed, new_conf, forget = self.decay_engine.evaluate_semantic_columns(
+            cols["last_active"], cols["confidence"],
+            np.isin(cols["kinds"], ("decision", "constraint", "assumption")))
+        # Stale active decisions and constraints are deprecated below 0.5
+        deprecate = decayed & ~forget & (new_conf < 0.5) & (cols["statuses"] == "active") \
+            & np.isin(cols["kinds"], ("decision", "constraint"))
+
+        updates = {}
+        for i in np.flatnonzero(decayed & ~forget):
+            updates[cols["fids"][i]] = {"confidence": float(new_conf[i])}
+            if deprecate[i]:
+                updates[cols["fids"][i]]["status"] = "deprecated"
+        return updates, cols["fids"][forget].tolist()
+
+    def run_reflection(self, budget_ms: Optional[int] = None) -> List[str]:
         """
         Execute the incremental reflection process to identify patterns.
         Uses a watermark stored in MetaStore to avoid double-processing.
+
+        The backlog present at the start of the call is drained in chunks of
+        `config.reflection_chunk_size` events until it is consumed or `budget_ms`
+        (default `config.reflection_budget_ms`) has elapsed; a started chunk is
+        always finished. Events written by reflection itself are left to the
+        next call. Each chunk commits together with its watermark, so a crash
+        loses at most the chunk in flight.
         """
-        # 1. Retrieve the last processed event ID
+        self._ensure_writable()
         watermark_key = "last_reflection_event_id"
-        last_id = self.semantic.meta.get_config(watermark_key)
-        after_id = int(last_id) if last_id is not None else None
-        
-        # 2. Run incremental cycle
-        proposal_ids, new_max_id = self.reflection_engine.run_cycle(after_id=after_id)
-        
-        # 3. Update watermark if we processed new events
-        if new_max_id is not None and (after_id is None or new_max_id > after_id):
-            # Protect with FS lock to be safe
-            if self.semantic._fs_lock.acquire(exclusive=True, timeout=5):
-                try:
-                    self.semantic.meta.set_config(watermark_key, new_max_id)
-                    logger.info(f"Reflection: Updated watermark to {new_max_id}")
-                finally:
-                    self.semantic._fs_lock.release()
-                
-        return proposal_ids
+        budget_ms = self.config.reflection_budget_ms if budget_ms is None else budget_ms
+        deadline = time.monotonic() + budget_ms / 1000.0
+        proposal_ids: Dict[str, None] = {}
+        latest = self.episodic.query(limit=1, status='active', order='DESC')
+        end_id = latest[0]['id'] if latest else None
+
+        while True:
+            last_id = self.semantic.meta.get_config(watermark_key)
+            after_id = int(last_id) if last_id is not None else None
+            ids, new_max_id = self.reflection_engine.run_cycle(
+                after_id=after_id, limit=self.config.reflection_chunk_size, watermark_key=watermark_key
+            )
+            proposal_ids.update(dict.fromkeys(ids))
+            if new_max_id is None or (after_id is not None and new_max_id <= after_id):
+                break
+            logger.info(f"Reflection: Updated watermark to {new_max_id}")
+            if time.monotonic() >= deadline or end_id is None or new_max_id >= end_id:
+                break
+
+        REFLECTION_BACKLOG.set(self.reflection_backlog())
+        return list(proposal_ids)
+
+    def reflection_backlog(self) -> int:
+        """Number of active events after the reflection watermark."""
+        last_id = self.semantic.meta.get_config("last_reflection_event_id")
+        return self.episodic.count_events_after(int(last_id) if last_id is not None else None)
+
+    def run_git_maintenance(self, should_stop: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
+        """
+        Packs the Git audit repository when loose objects or packs pile up.
+        Returns the object counts after maintenance and the actions taken.
+        """
+        self._ensure_writable()
+        git = self.semantic._git
+        if git is None:
+            return {"loose_objects": 0, "packs": 0, "actions": [], "skipped": "no-git"}
+        return git.maintain(should_stop=should_stop)
 
     def sync_git(self, repo_path: str = ".", limit: int = 20) -> int:
         """
         Syncs recent Git commits into episodic memory.
         """
+        self._ensure_writable()
         indexer = GitIndexer(repo_path)
         return indexer.index_to_memory(self, limit=limit)
 
+    def has_reflection_work(self) -> bool:
+        """True if episodic events were recorded after the reflection watermark."""
+        last_id = self.semantic.meta.get_config("last_reflection_event_id")
+        return self.episodic.has_events_after(int(last_id) if last_id is not None else None)
+
+    def has_decay_work(self) -> bool:
+        """True if some event is past its TTL or some record is past the decay inactivity window."""
+        now = datetime.now()
+        if self.episodic.has_expired((now - timedelta(days=self.decay_engine.ttl_days)).isoformat()):
+            return True
+        # evaluate_semantic decays records inactive for more than 7 whole days
+        return self.semantic.meta.has_inactive((now - timedelta(days=8)).isoformat())
+
+    def has_git_sync_work(self, repo_path: str = ".") -> bool:
+        """True if the Git HEAD at `repo_path` has moved past the last indexed commit."""
+        if not self._git_available:
+            return False
+        head = GitIndexer(repo_path).get_head_hash()
+        return head is not None and head != self.semantic.meta.get_config("last_indexed_commit_hash")
+
+    def has_git_maintenance_work(self) -> bool:
+        """True if the audit repository has crossed its repack thresholds."""
+        git = self.semantic._git
+        return git is not None and git.needs_maintenance()
+
     def record_decision(self, title: str, target: str, rationale: str, consequences: Optional[List[str]] = None) -> MemoryDecision:
         """
         Helper to record a new decision in semantic memory.
         Automatically resolves conflicts if content similarity > 0.85 (Knowledge Evolution).
         """
+        self._ensure_writable()
         if not title.strip(): raise ValueError("Title cannot be empty")
         if not target.strip(): raise ValueError("Target cannot be empty")
         if not rationale.strip(): raise ValueError("Rationale cannot be empty")
@@ -570,19 +774,118 @@ class Memory:
             
         return decision
 
+    def import_decisions(self, items: Iterable[Dict[str, Any]], chunk_size: int = 500) -> Dict[str, Any]:
+        """
+        Bulk-loads decisions, e.g. to seed a store from an existing knowledge base.
+        Each item is a dict with `title`, `target`, `rationale` and optionally
+        `consequences`; they are recorded with source "user".
+
+        Items that fail validation, or whose target already has an active decision
+        (in the store or earlier in the input), are skipped and reported by their
+        position in `items`. The rest are written `chunk_size` items at a time,
+        each chunk as one transaction with a single audit commit, and embedded in batch.
+        """
+        self._ensure_writable()
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        imported: List[str] = []
+        skipped: List[Dict[str, Any]] = []
+        seen_targets: Dict[str, int] = {}
+
+        chunk: List[Tuple[int, Any]] = []
+        for index, item in enumerate(items):
+            chunk.append((index, item))
+            if len(chunk) >= chunk_size:
+                imported.extend(self._import_chunk(chunk, seen_targets, skipped))
+                chunk = []
+        if chunk:
+            imported.extend(self._import_chunk(chunk, seen_targets, skipped))
+
+        return {"imported": len(imported), "ids": imported, "skipped": skipped}
+
+    def _import_chunk(self, chunk: List[Tuple[int, Any]], seen_targets: Dict[str, int],
+                      skipped: List[Dict[str, Any]]) -> List[str]:
+        """Validates and writes one chunk of `import_decisions`. Returns the new decision ids."""
+        items = [(i, item) for i, item in chunk if isinstance(item, dict)]
+        skipped.extend({"index": i, "reason": "Invalid decision: expected an object"} for i, item in chunk if not isinstance(item, dict))
+        targets = self.targets.normalize_many([str(item.get("target") or "") for _, item in items])
+
+        candidates: List[Tuple[int, MemoryEvent]] = []
+        for (index, item), target in zip(items, targets):
+            try:
+                event = MemoryEvent(
+                    source="user",
+                    kind=KIND_DECISION,
+                    content=item.get("title") or "",
+                    context={
+                        "title": item.get("title") or "",
+                        "target": target,
+                        "status": "active",
+                        "rationale": item.get("rationale") or "",
+                        "consequences": item.get("consequences") or []
+                    }
+                )
+            except (ValueError, TypeError) as e:
+                errors = e.errors() if hasattr(e, "errors") else None
+                detail = "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in errors) if errors else str(e)
+                skipped.append({"index": index, "reason": f"Invalid decision: {detail}"})
+                continue
+            # Case variants of a new target would be normalised to it once registered
+            if target.lower() in seen_targets:
+                skipped.append({"index": index, "reason": f"CONFLICT: Target '{target}' is also used by an earlier item"})
+                continue
+            seen_targets[target.lower()] = index
+            candidates.append((index, event))
+
+        def without_active(candidates: List[Tuple[int, MemoryEvent]]) -> List[Tuple[int, MemoryEvent]]:
+            active = self.semantic.meta.list_active_targets()
+            for index, event in candidates:
+                if event.context.target in active:
+                    skipped.append({"index": index, "reason": f"CONFLICT: Target '{event.context.target}' already has an active decision"})
+            return [(i, e) for i, e in candidates if e.context.target not in active]
+
+        events: List[MemoryEvent] = []
+        fids: List[str] = []
+        candidates = without_active(candidates)
+        if candidates:
+            with self.semantic.transaction(commit_msg=f"Import {len(candidates)} decisions"):
+                # Checked again under the lock, so concurrent writers cannot slip in between
+                events = [e for _, e in without_active(candidates)]
+                if events:
+                    fids = self.semantic.save_many(events, commit_msg=f"Import {len(events)} decisions")
+        skipped.sort(key=lambda s: s["index"])
+        if not fids:
+            return []
+
+        self.targets.register_many({e.context.target: e.context.title for e in events})
+
+        def index_and_link():
+            if hasattr(self.episodic, "append_many"):
+                self.episodic.append_many(list(zip(events, fids)))
+            else:
+                for event, fid in zip(events, fids):
+                    self.episodic.append(event, linked_id=fid)
+            try:
+                self.vector.add_documents([
+                    {"id": fid, "content": f"{e.content}\n{e.context.rationale}"} for e, fid in zip(events, fids)
+                ])
+            except Exception as ve:
+                logger.warning(f"Vector indexing failed for imported decisions: {ve}")
+
+        self.semantic.after_commit(index_and_link)
+        return fids
+
     def accept_proposal(self, proposal_id: str) -> MemoryDecision:
         """
         Converts a proposal into an active semantic decision.
         """
+        self._ensure_writable()
         self.semantic._validate_fid(proposal_id)
-        from ledgermind.core.stores.semantic_store.loader import MemoryLoader
         
-        file_path = os.path.join(self.semantic.repo_path, proposal_id)
-        if not os.path.exists(file_path):
+        try:
+            data, _ = self.semantic.parse_cache.get(proposal_id)
+        except OSError:
             raise FileNotFoundError(f"Proposal not found: {proposal_id}")
-            
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data, _ = MemoryLoader.parse(f.read())
         
         if data.get("kind") != "proposal":
             raise ValueError(f"File {proposal_id} is not a proposal")
@@ -625,6 +928,7 @@ class Memory:
         """
         Marks a proposal as rejected.
         """
+        self._ensure_writable()
         self.semantic._validate_fid(proposal_id)
         self.semantic.update_decision(
             proposal_id, 
@@ -632,34 +936,46 @@ class Memory:
             commit_msg=f"Rejected proposal: {reason}"
         )
 
-    def search_decisions(self, query: str, limit: int = 5, mode: str = "balanced") -> List[Dict[str, Any]]:
+    def search_decisions(self, query: str, limit: int = 5, mode: str = "balanced", bypass_cache: bool = False) -> List[Dict[str, Any]]:
         """
         Search with Recursive Truth Resolution and Hybrid Vector/Keyword ranking (RRF).
-        Uses Metadata Cache to avoid N+1 file reads.
+        Results are cached per (normalised query, limit, mode, namespace) until the
+        semantic store changes; `bypass_cache` forces a fresh search.
         """
+        key = (" ".join(query.lower().split()), limit, mode, self.namespace)
+        generation = self.semantic.generation
+        if bypass_cache:
+            self.search_cache.record_bypass()
+        else:
+            cached = self.search_cache.get(key, generation)
+            if cached is not None:
+                for item in cached:
+                    self.semantic.meta.increment_hit(item["id"])
+                return cached
+        results = self._search_decisions(query, limit, mode)
+        self.search_cache.put(key, generation, results)
+        return results
+
+    def _search_decisions(self, query: str, limit: int, mode: str) -> List[Dict[str, Any]]:
+        """Uncached search. Uses Metadata Cache to avoid N+1 file reads."""
         # 1. Execute Searches
         k = 60 # RRF constant
         search_limit = limit * 3
-        
-        # Vector Search
-        vec_results = []
-        try:
-            vec_results = self.vector.search(query, limit=search_limit)
-        except Exception: pass
-            
-        # Keyword Search (FTS)
-        kw_results = self.semantic.meta.keyword_search(query, limit=limit * 10)
+        vec_results, kw_results = self._run_retrievers(query, search_limit, limit * 10)
         
         # 2. RRF Fusion
         scores = {}
+        sources: Dict[str, List[str]] = {}
         
         for rank, item in enumerate(vec_results):
             fid = item['id']
             scores[fid] = scores.get(fid, 0.0) + (1.0 / (k + rank + 1))
+            sources.setdefault(fid, []).append("vector")
             
         for rank, item in enumerate(kw_results):
             fid = item['fid']
             scores[fid] = scores.get(fid, 0.0) + (1.0 / (k + rank + 1))
+            sources.setdefault(fid, []).append("keyword")
 
         # 3. Normalization (to bring RRF into 0-1 range roughly equivalent to similarity)
         # Theoretical max RRF with 2 sources at rank 0 is 2.0 / (k + 1.0)
@@ -698,7 +1014,8 @@ class Memory:
                 "preview": meta.get("content", "")[:200],
                 "kind": meta.get("kind"),
                 "is_active": (status == "active"),
-                "evidence_count": link_count
+                "evidence_count": link_count,
+                "retrievers": sources[fid]
             })
             seen_final_ids.add(final_id)
             self.semantic.meta.increment_hit(final_id)
@@ -708,6 +1025,58 @@ class Memory:
         return candidates
 
 
+    def _run_retrievers(self, query: str, vector_limit: int, keyword_limit: int) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Runs vector and keyword retrieval concurrently (both release the GIL) and
+        returns their results. A retriever that fails or misses
+        `search_deadline_ms` contributes nothing, so latency is bounded by the
+        slower retriever or the deadline, not their sum.
+
+        A call that misses the deadline keeps running, so its pool is retired
+        and later searches get fresh workers instead of queueing behind it.
+        Until it finishes, that retriever is skipped rather than started again.
+        """
+        meta = self.semantic.meta
+        if self.semantic._in_transaction or not hasattr(meta, "reader"):
+            # Uncommitted writes are only visible on the shared connection
+            keyword = lambda: meta.keyword_search(query, limit=keyword_limit)
+        else:
+            keyword = lambda: meta.keyword_search(query, limit=keyword_limit, conn=meta.reader())
+        retrievers = {"vector": lambda: self.vector.search(query, limit=vector_limit), "keyword": keyword}
+
+        with self._search_pool_lock:
+            if self._search_pool is None:
+                self._search_pool = ThreadPoolExecutor(max_workers=len(retrievers), thread_name_prefix="ledgermind-search")
+            pool = self._search_pool
+            stuck = {name for name, f in self._abandoned_retrievers.items() if not f.done()}
+            # Submitted under the lock so a concurrent search cannot retire the pool in between
+            futures = {name: pool.submit(fn) for name, fn in retrievers.items() if name not in stuck}
+        for name in stuck:
+            logger.warning(f"Search retriever '{name}' is still running past an earlier deadline; fusing without it.")
+
+        deadline = time.monotonic() + self.config.search_deadline_ms / 1000.0 if self.config.search_deadline_ms else None
+        results = {name: [] for name in retrievers}
+        for name, future in futures.items():
+            try:
+                timeout = max(0.0, deadline - time.monotonic()) if deadline else None
+                results[name] = future.result(timeout=timeout)
+            except FuturesTimeout:
+                logger.warning(f"Search retriever '{name}' missed the {self.config.search_deadline_ms}ms deadline; fusing without it.")
+                if not future.cancel():
+                    self._abandon_retriever(name, future, pool)
+            except Exception as e:
+                logger.debug(f"Search retriever '{name}' failed: {e}")
+        return results["vector"], results["keyword"]
+
+    def _abandon_retriever(self, name: str, future: Future, pool: ThreadPoolExecutor):
+        """Leaves a timed-out call to finish on its own and retires the pool it occupies."""
+        with self._search_pool_lock:
+            self._abandoned_retrievers[name] = future
+            if self._search_pool is pool:
+                self._search_pool = None
+        # Running calls complete; the retired pool's threads exit afterwards
+        pool.shutdown(wait=False)
+
     def _resolve_to_truth(self, doc_id: str, mode: str) -> Optional[Dict[str, Any]]:
         """Recursively follows 'superseded_by' links using Metadata Store."""
         self.semantic._validate_fid(doc_id)
@@ -735,16 +1104,30 @@ class Memory:
 
     def run_maintenance(self) -> Dict[str, Any]:
         """Runs periodic maintenance tasks: decay and merge analysis."""
+        self._ensure_writable()
         # 0. Deep Integrity Sync & Check
         from ledgermind.core.stores.semantic_store.integrity import IntegrityChecker
         self.semantic.sync_meta_index()
         integrity_status = "ok"
         try:
-            IntegrityChecker.validate(self.semantic.repo_path, force=True)
+            IntegrityChecker.validate(self.semantic.repo_path, force=True, cache=self.semantic.parse_cache)
         except Exception as ie:
             logger.error(f"Integrity Violation detected during maintenance: {ie}")
             integrity_status = f"violation: {str(ie)}"
 
+        # Cross-check the SQL fast path against the file-based source of truth
+        crosscheck = "ok"
+        if hasattr(self.semantic.meta, "find_violations"):
+            try:
+                IntegrityChecker.validate_meta(self.semantic.meta)
+                meta_ok = True
+            except Exception as me:
+                meta_ok = False
+                logger.warning(f"Metadata integrity check reported: {me}")
+            if meta_ok != (integrity_status == "ok"):
+                logger.warning("Metadata invariant check diverges from file-based check.")
+                crosscheck = "diverged"
+
         decay_report = self.run_decay()
         from ledgermind.core.reasoning.merging import MergeEngine
         merger = MergeEngine(self)
@@ -752,7 +1135,8 @@ class Memory:
         return {
             "decay": decay_report.__dict__,
             "merging": {"proposals_created": len(merges), "ids": merges},
-            "integrity": integrity_status
+            "integrity": integrity_status,
+            "integrity_crosscheck": crosscheck
         }
 
     def get_stats(self) -> Dict[str, Any]:
@@ -761,19 +1145,29 @@ class Memory:
         return {
             "semantic_decisions": active_semantic,
             "namespace": self.namespace,
-            "storage_path": self.storage_path
+            "storage_path": self.storage_path,
+            "search_cache": self.search_cache.stats()
         }
 
     def forget(self, decision_id: str):
         """Hard-deletes a memory from filesystem and metadata."""
+        self._ensure_writable()
         self.semantic._validate_fid(decision_id)
         self.semantic.purge_memory(decision_id)
         self.vector.remove_id(decision_id)
+        self.semantic.bump_generation()
         logger.info(f"Memory {decision_id} forgotten across systems.")
 
     def close(self):
         """Releases all resources held by the memory system."""
+        if self._search_pool is not None:
+            self._search_pool.shutdown(wait=False)
+            self._search_pool = None
         if hasattr(self, 'vector'):
             self.vector.close()
+        if hasattr(self.semantic.audit, "close"):
+            self.semantic.audit.close()
+        else:
+            self.semantic.audit.flush()
         logger.info("Memory system closed.")
 
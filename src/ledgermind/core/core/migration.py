@@ -1,7 +1,8 @@
 import os
-import yaml
+import json
 import logging
-from typing import Dict, Any, List
+from datetime import datetime
+from typing import Dict, Any, List, Optional
 from ledgermind.core.stores.semantic_store.loader import MemoryLoader
 
 logger = logging.getLogger("ledgermind-core.migration")
@@ -11,6 +12,8 @@ class MigrationEngine:
     Handles data format evolution and ensures backward compatibility
     between different versions of the memory system.
     """
+    CHECKPOINT_KEY = "migration_v1_22_checkpoint"
+    CHUNK_SIZE = 512
     
     def __init__(self, semantic_store):
         self.semantic = semantic_store
@@ -30,13 +33,19 @@ class MigrationEngine:
             if hasattr(self.semantic, "_fs_lock"):
                 self.semantic._fs_lock.release()
 
-    def migrate_to_v1_22(self):
+    def migrate_to_v1_22(self, workers: Optional[int] = None):
         """
         Migration to v1.22.0 standards:
         - Ensures 'target' length >= 3
         - Ensures 'kind' exists
         - Ensures 'namespace' exists
         - Fixes 'rationale' if too short
+
+        Files are processed in sorted order and in chunks: each chunk is parsed on a
+        process pool, committed, and then checkpointed in sys_config, so an
+        interrupted upgrade resumes after the last committed chunk. The chunk that
+        was in flight is staged as a whole on resume, since files it already
+        rewrote are no longer detected as needing migration.
         """
         all_files = []
         for root, _, filenames in os.walk(self.semantic.repo_path):
@@ -45,78 +54,93 @@ class MigrationEngine:
                 if f.endswith(".md"):
                     rel_path = os.path.relpath(os.path.join(root, f), self.semantic.repo_path)
                     all_files.append(rel_path)
+        all_files.sort()
+
+        checkpoint = self.semantic.meta.get_config(self.CHECKPOINT_KEY)
+        if checkpoint:
+            logger.info(f"Resuming migration after checkpoint {checkpoint}")
+            all_files = [f for f in all_files if f > checkpoint]
 
         modified_count = 0
         
-        for f in all_files:
-            file_path = os.path.join(self.semantic.repo_path, f)
-            try:
-                with open(file_path, 'r', encoding='utf-8') as stream:
-                    content = stream.read()
-                
-                data, body = MemoryLoader.parse(content)
-                if not data: continue
-                
-                changed = False
-                ctx = data.get("context", {})
-                
-                # 1. Fix Kind
-                if "kind" not in data:
-                    data["kind"] = "decision"
-                    changed = True
-                
-                # 2. Fix Target Length
-                target = ctx.get("target", "unknown")
-                if len(target) < 3:
-                    ctx["target"] = f"migrated_{target}"
-                    changed = True
-                
-                # 3. Fix Rationale Length
-                rationale = ctx.get("rationale", "")
-                if len(rationale) < 10:
-                    ctx["rationale"] = f"{rationale} (Migrated content)"
-                    changed = True
-                
-                # 4. Fix Namespace
-                if "namespace" not in ctx:
-                    ctx["namespace"] = "default"
-                    changed = True
-                
-                if changed:
-                    data["context"] = ctx
-                    new_content = MemoryLoader.stringify(data, body)
-                    with open(file_path, 'w', encoding='utf-8') as stream:
-                        stream.write(new_content)
-                    
-                    # Update metadata index immediately
-                    ts = data.get("timestamp")
-                    from datetime import datetime
-                    if isinstance(ts, str): ts = datetime.fromisoformat(ts)
-                    
-                    self.semantic.meta.upsert(
-                        fid=f,
-                        target=ctx["target"],
-                        title=ctx.get("title", ""),
-                        status=ctx.get("status", "active"),
-                        kind=data["kind"],
-                        timestamp=ts or datetime.now(),
-                        namespace=ctx["namespace"],
-                        superseded_by=ctx.get("superseded_by")
-                    )
+        for i in range(0, len(all_files), self.CHUNK_SIZE):
+            chunk = all_files[i:i + self.CHUNK_SIZE]
+            modified = []
+            for f, _, _, data, body, _ in MemoryLoader.parse_many(self.semantic.repo_path, chunk, workers=workers):
+                try:
+                    if self._migrate_file(f, data, body):
+                        modified.append(f)
+                except Exception as e:
+                    logger.error(f"Failed to migrate {f}: {e}")
 
-                    
-                    # Add to git staging
-                    if hasattr(self.semantic.audit, "run"):
-                        self.semantic.audit.run(["add", "--", f])
-                    
-                    modified_count += 1
-                    
-            except Exception as e:
-                logger.error(f"Failed to migrate {f}: {e}")
+            # The first chunk after a checkpoint may have been rewritten by the
+            # interrupted run without being committed: its files now look migrated,
+            # so stage the whole chunk rather than only what changed this time
+            to_stage = chunk if checkpoint and i == 0 else modified
+            if to_stage:
+                # Stage and commit before advancing the checkpoint
+                self.semantic.audit.stage_paths(to_stage)
+                self.semantic.audit.commit_transaction(f"System Migration: Normalized {len(modified)} files to v1.22.0")
+            self.semantic.meta.set_config(self.CHECKPOINT_KEY, chunk[-1])
+            modified_count += len(modified)
 
         if modified_count > 0:
             logger.info(f"Migration completed: {modified_count} files normalized to v1.22.0")
-            if hasattr(self.semantic.audit, "run"):
-                self.semantic.audit.commit_transaction(f"System Migration: Normalized {modified_count} files to v1.22.0")
         else:
             logger.debug("Memory format is already up to date.")
+        self.semantic.meta.set_config(self.CHECKPOINT_KEY, "")
+
+    def _migrate_file(self, f: str, data: Dict[str, Any], body: str) -> bool:
+        """Normalizes a single parsed file in place. Returns True if it was rewritten."""
+        if not data: return False
+        
+        changed = False
+        ctx = data.get("context", {})
+        
+        # 1. Fix Kind
+        if "kind" not in data:
+            data["kind"] = "decision"
+            changed = True
+        
+        # 2. Fix Target Length
+        target = ctx.get("target", "unknown")
+        if len(target) < 3:
+            ctx["target"] = f"migrated_{target}"
+            changed = True
+        
+        # 3. Fix Rationale Length
+        rationale = ctx.get("rationale", "")
+        if len(rationale) < 10:
+            ctx["rationale"] = f"{rationale} (Migrated content)"
+            changed = True
+        
+        # 4. Fix Namespace
+        if "namespace" not in ctx:
+            ctx["namespace"] = "default"
+            changed = True
+        
+        if not changed:
+            return False
+
+        data["context"] = ctx
+        fmt = getattr(self.semantic, "frontmatter_format", MemoryLoader.FORMAT_YAML)
+        new_content = MemoryLoader.stringify(data, body, fmt=fmt)
+        with open(os.path.join(self.semantic.repo_path, f), 'w', encoding='utf-8') as stream:
+            stream.write(new_content)
+        
+        # Update metadata index immediately
+        ts = data.get("timestamp")
+        if isinstance(ts, str): ts = datetime.fromisoformat(ts)
+        
+        self.semantic.meta.upsert(
+            fid=f,
+            target=ctx["target"],
+            title=ctx.get("title", ""),
+            status=ctx.get("status", "active"),
+            kind=data["kind"],
+            timestamp=ts or datetime.now(),
+            namespace=ctx["namespace"],
+            superseded_by=ctx.get("superseded_by"),
+            context_json=json.dumps(ctx)
+        )
+        return True
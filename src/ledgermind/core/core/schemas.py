@@ -134,4 +134,15 @@ class LedgermindConfig(BaseModel):
     vector_workers: int = Field(default=0, ge=0, description="Number of workers for multi-process encoding. 0 for auto-detection.")
     enable_git: bool = Field(default=True)
     relevance_threshold: float = Field(default=0.35, ge=0.0, le=1.0)
+    frontmatter_format: Literal["yaml", "json"] = Field(default="yaml", description="Encoding of new/updated decision frontmatter. 'json' is valid YAML and parses faster.")
+    parse_cache_mb: int = Field(default=16, ge=0, description="Byte budget (MiB) of the per-repo frontmatter parse cache. 0 disables caching.")
+    audit_backend: Literal["git", "fast-import"] = Field(default="git", description="Git audit implementation. 'fast-import' streams commits to a persistent git fast-import process.")
+    async_audit: bool = Field(default=False, description="Queue audit commits in SQLite and apply them to Git on a background committer thread.")
+    git_group_commit_ms: int = Field(default=0, ge=0, description="Window (ms) for coalescing Git audit commits. 0 commits every write synchronously.")
+    search_cache_entries: int = Field(default=256, ge=0, description="Maximum cached search_decisions results. 0 disables the cache.")
+    search_cache_ttl_ms: int = Field(default=60000, ge=0, description="Lifetime (ms) of a cached search result, on top of invalidation by writes.")
+    search_deadline_ms: int = Field(default=2000, ge=0, description="Per-retriever deadline (ms) for the concurrent vector/keyword search. Late retrievers are left out of the fusion. 0 waits indefinitely.")
+    reflection_chunk_size: int = Field(default=1000, ge=1, description="Episodic events processed per reflection chunk. Each chunk commits with its watermark.")
+    reflection_budget_ms: int = Field(default=10000, ge=0, description="Time (ms) after which run_reflection stops starting new chunks of the backlog. 0 runs a single chunk.")
+    read_only: bool = Field(default=False, description="Open an existing store for queries only: no locks, Git setup, migration or index sync, and writes raise PermissionError.")
 
@@ -62,6 +62,23 @@ class TargetRegistry:
             
         return name
 
+    def normalize_many(self, names: List[str]) -> List[str]:
+        """`normalize` for a batch of names, with the case-insensitive lookup built once."""
+        lowered = {a.lower(): canonical for a, canonical in reversed(list(self.aliases.items()))}
+        lowered.update({t.lower(): t for t in reversed(list(self.targets))})
+        result = []
+        for name in names:
+            name = name.strip()
+            if not name:
+                result.append("unknown")
+            elif name in self.targets:
+                result.append(name)
+            elif name in self.aliases:
+                result.append(self.aliases[name])
+            else:
+                result.append(lowered.get(name.lower(), name))
+        return result
+
     def register(self, name: str, description: str = "", aliases: List[str] = None):
         """Registers a new canonical target."""
         if name not in self.targets:
@@ -76,6 +93,14 @@ class TargetRegistry:
         
         self._save()
 
+    def register_many(self, targets: Dict[str, str]):
+        """Registers several canonical targets (name -> description) with a single save."""
+        created_at = str(os.path.getctime(self.file_path)) if os.path.exists(self.file_path) else None
+        for name, description in targets.items():
+            if name not in self.targets:
+                self.targets[name] = {"description": description, "created_at": created_at}
+        self._save()
+
     def suggest(self, query: str, limit: int = 3) -> List[str]:
         """Suggests existing targets similar to the query."""
         all_names = list(self.targets.keys())
@@ -1,5 +1,14 @@
+import calendar
+import numpy as np
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
+
+# Epoch seconds standing in for an unparseable timestamp: always past any TTL
+INVALID_EPOCH = np.iinfo(np.int64).min // 2
+
+def wall_clock_epoch(dt: datetime) -> float:
+    """Seconds since the epoch of a naive wall-clock time, read as UTC (as SQLite's strftime('%s') does)."""
+    return calendar.timegm(dt.timetuple()) + dt.microsecond / 1e6
 
 class DecayReport:
     """
@@ -116,3 +125,37 @@ class DecayEngine:
                     to_prune.append(ev['id'])
                     
         return to_archive, to_prune, retained_count
+
+    def evaluate_columns(self, ids: np.ndarray, timestamps: np.ndarray, active: np.ndarray,
+                         immortal: np.ndarray, now: Optional[datetime] = None) -> Tuple[np.ndarray, np.ndarray, int]:
+        """
+        Columnar form of `evaluate`. `timestamps` are wall-clock epoch seconds
+        (INVALID_EPOCH where unparseable), `active` and `immortal` boolean
+        masks. Returns (ids to archive, ids to prune, retained count).
+        """
+        now_s = wall_clock_epoch(now or datetime.now())
+        expired = (now_s - timestamps) > self.ttl_days * 86400
+        mortal_expired = expired & ~immortal
+        return ids[mortal_expired & active], ids[mortal_expired & ~active], int(np.count_nonzero(immortal))
+
+    def evaluate_semantic_columns(self, last_active: np.ndarray, confidence: np.ndarray, slow: np.ndarray,
+                                  now: Optional[datetime] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Columnar form of `evaluate_semantic` over active/deprecated records.
+        `last_active` holds wall-clock epoch seconds of the last hit (or
+        creation; INVALID_EPOCH where unparseable), `slow` marks kinds that
+        decay at a third of the rate. Returns (decayed mask, new confidence,
+        forget mask); the last two are only meaningful where decayed.
+        """
+        now_dt = now or datetime.now()
+        now_s = wall_clock_epoch(now_dt)
+        fallback = wall_clock_epoch(now_dt - timedelta(days=self.ttl_days))
+        last_active = np.where(last_active == INVALID_EPOCH, fallback, last_active)
+        days_inactive = np.floor((now_s - last_active) / 86400)
+        decayed = days_inactive > 7
+
+        rate = np.where(slow, self.semantic_decay_rate / 3.0, self.semantic_decay_rate)
+        new_conf = np.maximum(0.0, confidence - rate * (days_inactive // 7))
+        forget = decayed & (new_conf < self.forget_threshold)
+        return decayed, np.round(new_conf, 2), forget
+
@@ -56,6 +56,14 @@ class GitIndexer:
             # Не является git репозиторием или git не установлен
             return []
 
+    def get_head_hash(self) -> Optional[str]:
+        """Хэш HEAD репозитория или None, если это не git репозиторий."""
+        try:
+            res = subprocess.run(["git", "rev-parse", "HEAD"], cwd=self.repo_path, capture_output=True, text=True)
+        except OSError:
+            return None
+        return res.stdout.strip() if res.returncode == 0 else None
+
     def index_to_memory(self, memory_instance, limit: int = 20) -> int:
         """Сканирует Git и записывает новые коммиты в эпизодическую память."""
         # 1. Пытаемся найти хэш последнего проиндексированного коммита
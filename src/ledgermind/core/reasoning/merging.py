@@ -30,17 +30,8 @@ class MergeEngine:
         
         for fid in recent_ids:
             try:
-                # We need the text content to search
-                # Currently Memory doesn't expose 'get_content(fid)' easily without reading file
-                # But we can assume we have it via search or load.
-                
-                # Let's read the file to get content
-                import os
-                from ledgermind.core.stores.semantic_store.loader import MemoryLoader
-                
-                path = os.path.join(self.memory.semantic.repo_path, fid)
-                with open(path, 'r', encoding='utf-8') as f:
-                    data, _ = MemoryLoader.parse(f.read())
+                # We need the text content to search; served from the store's parse cache
+                data, _ = self.memory.semantic.parse_cache.get(fid)
                 
                 content = data.get("content") or data.get("context", {}).get("title")
                 if not content: continue
@@ -1,18 +1,22 @@
+import copy
 import logging
 import os
 import json
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
+from prometheus_client import Gauge
 from ledgermind.core.core.schemas import (
     MemoryEvent, KIND_PROPOSAL, ProposalContent, ProposalStatus, 
     KIND_RESULT, KIND_ERROR
 )
-from ledgermind.core.stores.episodic import EpisodicStore
+from ledgermind.core.stores.episodic import EpisodicStore, event_target
 from ledgermind.core.stores.semantic import SemanticStore
 from ledgermind.core.reasoning.distillation import DistillationEngine
 
 logger = logging.getLogger(__name__)
 
+REFLECTION_BACKLOG = Gauge("agent_memory_reflection_backlog_events", "Active episodic events after the reflection watermark")
+
 class ReflectionPolicy:
     def __init__(self, 
                  error_threshold: int = 1,
@@ -30,9 +34,45 @@ class ReflectionPolicy:
         self.ready_threshold = ready_threshold
         self.auto_accept_threshold = auto_accept_threshold
 
+class ProposalUpdates:
+    """
+    Proposal mutations staged during a reflection cycle. Updates to the same
+    fid are coalesced and applied to the in-memory draft, so later steps of
+    the cycle see them; `changed` drops fields that end up equal to the
+    stored values.
+    """
+    def __init__(self):
+        self.original: Dict[str, Dict[str, Any]] = {}
+        self.updates: Dict[str, Dict[str, Any]] = {}
+        self.messages: Dict[str, List[str]] = {}
+
+    def stage(self, fid: str, data: Dict[str, Any], updates: Dict[str, Any], commit_msg: str):
+        ctx = data['context']
+        self.original.setdefault(fid, copy.deepcopy(ctx))
+        ctx.update(updates)
+        self.updates.setdefault(fid, {}).update(updates)
+        msgs = self.messages.setdefault(fid, [])
+        if commit_msg not in msgs:
+            msgs.append(commit_msg)
+
+    def changed(self) -> Dict[str, Dict[str, Any]]:
+        result = {}
+        for fid, updates in self.updates.items():
+            original = self.original[fid]
+            diff = {k: v for k, v in updates.items() if k not in original or original[k] != v}
+            if diff:
+                result[fid] = diff
+        return result
+
+    def message(self, fid: str) -> str:
+        return " ".join(self.messages.get(fid, []))
+
 class ReflectionEngine:
     """
     Reflection Engine v4.3: Incremental Proactive Knowledge Discovery.
+
+    Proposal updates made during a cycle are staged in a ProposalUpdates and
+    flushed once at the end of the cycle, as a single batch.
     """
     BLACKLISTED_TARGETS = {"general", "general_development", "general_task", "unknown", "none", "null"}
 
@@ -46,9 +86,12 @@ class ReflectionEngine:
         if not self.processor:
             logger.warning("ReflectionEngine initialized without a high-level processor.")
 
-    def run_cycle(self, after_id: Optional[int] = None) -> Tuple[List[str], Optional[int]]:
+    def run_cycle(self, after_id: Optional[int] = None, limit: int = 1000,
+                  watermark_key: Optional[str] = None) -> Tuple[List[str], Optional[int]]:
         """
-        Runs an incremental reflection cycle.
+        Runs an incremental reflection cycle over at most `limit` active events after `after_id`.
+        With a `watermark_key`, the last processed event id is written to the meta config
+        inside the cycle's transaction, so it commits (or rolls back) together with the cycle.
         Returns (list of created/updated proposal IDs, last processed event ID).
         """
         logger.info(f"Starting incremental reflection cycle [after_id={after_id}]...")
@@ -59,10 +102,16 @@ class ReflectionEngine:
         result_ids = []
         max_id = after_id
         
-        with self.semantic.transaction():
+        # Distillation and aggregation see the same chunk of events (forward from after_id).
+        # An empty chunk opens no transaction, so an idle cycle makes no audit commit.
+        recent_events = self.episodic.query(limit=limit, status='active', after_id=after_id, order='ASC')
+        if not recent_events:
+            return result_ids, max_id
+
+        with self.semantic.transaction(commit_msg="Reflection cycle"):
             # 0. Distillation (Procedural Patterns)
             distiller = DistillationEngine(self.episodic)
-            procedural_proposals = distiller.distill_trajectories(after_id=after_id)
+            procedural_proposals = distiller.distill_trajectories(after_id=after_id, events=recent_events)
             
             for prop in procedural_proposals:
                 if prop.target in self.BLACKLISTED_TARGETS or prop.target.lower().startswith("general"):
@@ -77,17 +126,16 @@ class ReflectionEngine:
                 if decision.should_persist:
                     result_ids.append(decision.metadata.get("file_id"))
 
-            # 1. Evidence Aggregation (Forward from after_id)
-            recent_events = self.episodic.query(limit=1000, status='active', after_id=after_id, order='ASC')
-            if not recent_events:
-                return result_ids, max_id
-                
+            # 1. Evidence Aggregation
             max_id = max(e['id'] for e in recent_events)
-            evidence_clusters = self._cluster_evidence(recent_events)
+            if watermark_key:
+                self.semantic.meta.set_config(watermark_key, max_id, commit=False)
+            evidence_clusters = self._load_evidence(recent_events, after_id)
             
             all_drafts = self._get_all_draft_proposals()
             active_decisions = self._get_active_decision_targets()
             processed_fids = set()
+            staged = ProposalUpdates()
             
             # 2. Update existing hypotheses or discover new ones
             for target, stats in evidence_clusters.items():
@@ -97,7 +145,7 @@ class ReflectionEngine:
                 relevant_proposals = self._find_proposals_by_target(all_drafts, target)
                 
                 for fid, data in relevant_proposals:
-                    self._evaluate_hypothesis(fid, data, stats)
+                    self._evaluate_hypothesis(fid, data, stats, staged)
                     processed_fids.add(fid)
                     result_ids.append(fid)
                 
@@ -119,17 +167,42 @@ class ReflectionEngine:
 
             # 4. Decay and Automatic Readiness
             now = datetime.now()
+            to_accept = []
             for fid, data in all_drafts.items():
                 if fid not in processed_fids:
                     # Apply decay only if time passed (heuristic: check timestamp of draft)
-                    self._apply_decay(fid, data)
+                    self._apply_decay(fid, data, staged)
                 
                 # Check for Automatic Readiness & Acceptance
-                self._check_proposal_lifecycle(fid, data, now)
+                if self._check_proposal_lifecycle(fid, data, now, staged):
+                    to_accept.append(fid)
+
+            # 5. Flush all proposal updates at once, then accept (acceptance reads the files)
+            self._flush(staged)
+            for fid in to_accept:
+                logger.info(f"Reflection: Auto-Accepting proposal {fid}")
+                try:
+                    if hasattr(self.processor, 'accept_proposal'):
+                        self.processor.accept_proposal(fid)
+                except Exception as e:
+                    logger.error(f"Auto-acceptance failed: {e}")
                 
         return result_ids, max_id
 
-    def _check_proposal_lifecycle(self, fid: str, data: Dict[str, Any], now: datetime):
+    def _flush(self, staged: ProposalUpdates):
+        changed = staged.changed()
+        if not changed:
+            return
+        messages = {fid: staged.message(fid) for fid in changed}
+        if hasattr(self.processor, 'update_decisions'):
+            self.processor.update_decisions(changed, commit_msg=f"Reflection: Updated {len(changed)} proposals.",
+                                            messages=messages)
+        else:
+            for fid, updates in changed.items():
+                self.processor.update_decision(fid, updates, commit_msg=messages[fid])
+
+    def _check_proposal_lifecycle(self, fid: str, data: Dict[str, Any], now: datetime, staged: ProposalUpdates) -> bool:
+        """Stages the readiness flag when due. Returns True if the proposal should be auto-accepted."""
         ctx = data['context']
         if not ctx.get('ready_for_review'):
             try:
@@ -137,23 +210,15 @@ class ReflectionEngine:
                 if (now - first_seen) >= self.policy.observation_window:
                     if ctx.get('confidence', 0.0) >= self.policy.ready_threshold:
                         logger.info(f"Reflection: Proposal {fid} is now ready for review.")
-                        self.processor.update_decision(fid, {"ready_for_review": True}, 
-                                                    commit_msg="Reflection: Automatic readiness update.")
+                        staged.stage(fid, data, {"ready_for_review": True},
+                                     commit_msg="Reflection: Automatic readiness update.")
             except (ValueError, KeyError, TypeError): pass
 
-        meta = self.semantic.meta.get_by_fid(fid)
-        if meta:
-            curr_ctx = json.loads(meta.get('context_json', '{}'))
-            if (curr_ctx.get('ready_for_review') and 
-                curr_ctx.get('confidence', 0.0) >= self.policy.auto_accept_threshold and
-                not curr_ctx.get('objections')):
-                
-                logger.info(f"Reflection: Auto-Accepting proposal {fid}")
-                try:
-                    if hasattr(self.processor, 'accept_proposal'):
-                        self.processor.accept_proposal(fid)
-                except Exception as e:
-                    logger.error(f"Auto-acceptance failed: {e}")
+        # The draft's context already reflects everything staged this cycle
+        return bool(ctx.get('status', ProposalStatus.DRAFT) == ProposalStatus.DRAFT and
+                    ctx.get('ready_for_review') and
+                    ctx.get('confidence', 0.0) >= self.policy.auto_accept_threshold and
+                    not ctx.get('objections'))
 
     def _get_active_decision_targets(self) -> set:
         return self.semantic.meta.list_active_targets()
@@ -191,19 +256,41 @@ class ReflectionEngine:
              return decision.metadata.get("file_id") if decision.should_persist else ""
         return ""
 
+    def _load_evidence(self, events: List[Dict[str, Any]], after_id: Optional[int]) -> Dict[str, Dict[str, Any]]:
+        """
+        Evidence clusters of the chunk, read from the episodic store's target
+        statistics. Falls back to clustering the events when the store keeps no
+        statistics or its id rings do not cover the chunk.
+        """
+        stats = self.episodic.target_stats_since(after_id) if hasattr(self.episodic, 'target_stats_since') else None
+        if stats is None:
+            return self._cluster_evidence(events)
+
+        by_id = {ev['id']: ev for ev in events}
+        clusters = []
+        for target, row in stats.items():
+            if target in self.BLACKLISTED_TARGETS or target.lower().startswith("general"):
+                continue
+            # Rings may reach past the chunk; keep the ids that belong to it
+            chunk_ids = {col: [i for i in row[f"{col}_ids"] if i in by_id] for col in ("error", "success", "commit", "other")}
+            if not any(chunk_ids.values()):
+                continue
+            clusters.append((min(min(ids) for ids in chunk_ids.values() if ids), target, {
+                'errors': len(chunk_ids['error']),
+                'successes': len(chunk_ids['success']),
+                'commits': len(chunk_ids['commit']),
+                'error_events': [by_id[i] for i in chunk_ids['error']],
+                'success_events': [by_id[i] for i in chunk_ids['success']],
+                'commit_events': [by_id[i] for i in chunk_ids['commit']],
+                'last_seen': row['last_seen']
+            }))
+        # Same order as clustering the chunk: by first event
+        return {target: cluster for _, target, cluster in sorted(clusters, key=lambda c: c[0])}
+
     def _cluster_evidence(self, events: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
         clusters = {}
         for ev in events:
-            ctx = ev.get('context', {})
-            target = ctx.get('target')
-            
-            if ev['kind'] == 'commit_change':
-                msg = ev.get('content', '')
-                import re
-                match = re.search(r'\(([^)]+)\):', msg)
-                target = match.group(1) if match else "general_development"
-
-            target = target or "general"
+            target = event_target(ev['kind'], ev.get('content'), ev.get('context', {})) or "general"
             if target in self.BLACKLISTED_TARGETS or target.lower().startswith("general"):
                 continue
             
@@ -229,12 +316,12 @@ class ReflectionEngine:
             except (KeyError, TypeError): pass
         return clusters
 
-    def _evaluate_hypothesis(self, fid: str, data: Dict[str, Any], stats: Dict[str, Any]):
+    def _evaluate_hypothesis(self, fid: str, data: Dict[str, Any], stats: Dict[str, Any], staged: ProposalUpdates):
         ctx = data['context']
         new_errors = ctx.get('hit_count', 0) + stats['errors']
         new_successes = ctx.get('miss_count', 0) + stats['successes']
         
-        objections = list(set(ctx.get('objections', [])))
+        objections = sorted(set(ctx.get('objections', [])))
         if stats['successes'] > 0:
             objections.append(f"Falsification Signal: {stats['successes']} successes observed in target area.")
         
@@ -246,7 +333,7 @@ class ReflectionEngine:
         confidence = max(0.0, base_rate - epistemic_penalty)
         
         if confidence <= 0.05 and new_successes > new_errors:
-            self.processor.update_decision(fid, {
+            staged.stage(fid, data, {
                 "status": ProposalStatus.FALSIFIED,
                 "confidence": 0.0,
                 "objections": objections + ["Hypothesis failed to explain high success rate."]
@@ -264,13 +351,13 @@ class ReflectionEngine:
                  (last_seen - first_seen) >= self.policy.observation_window and
                  len(objections) < 2)
 
-        self.processor.update_decision(fid, {
+        staged.stage(fid, data, {
             "confidence": round(confidence, 2),
             "hit_count": new_errors,
             "miss_count": new_successes,
-            "objections": list(set(objections)),
+            "objections": sorted(set(objections)),
             "ready_for_review": ready,
-            "counter_evidence_event_ids": list(set(ctx.get('counter_evidence_event_ids', []) + [e['id'] for e in stats['success_events']]))
+            "counter_evidence_event_ids": sorted(set(ctx.get('counter_evidence_event_ids', []) + [e['id'] for e in stats['success_events']]))
         }, commit_msg=f"Reflection: Epistemic update. Confidence: {confidence:.2f}")
 
     def _generate_competing_hypotheses(self, target: str, stats: Dict[str, Any]) -> List[str]:
@@ -318,11 +405,11 @@ class ReflectionEngine:
     def _find_proposals_by_target(self, drafts: Dict[str, Dict[str, Any]], target: str) -> List[Tuple[str, Dict[str, Any]]]:
         return [(fid, data) for fid, data in drafts.items() if data.get('context', {}).get('target') == target]
 
-    def _apply_decay(self, fid: str, data: Dict[str, Any]):
+    def _apply_decay(self, fid: str, data: Dict[str, Any], staged: ProposalUpdates):
         ctx = data['context']
         new_conf = max(0.0, ctx.get('confidence', 0.0) - self.policy.decay_rate)
         if new_conf < self.policy.min_confidence:
-            self.processor.update_decision(fid, {"status": ProposalStatus.REJECTED, "confidence": new_conf}, 
-                                          commit_msg="Reflection: Hypothesis rejected (decay).")
+            staged.stage(fid, data, {"status": ProposalStatus.REJECTED, "confidence": new_conf},
+                         commit_msg="Reflection: Hypothesis rejected (decay).")
         else:
-            self.processor.update_decision(fid, {"confidence": new_conf}, commit_msg="Reflection: Applied decay.")
+            staged.stage(fid, data, {"confidence": new_conf}, commit_msg="Reflection: Applied decay.")
@@ -0,0 +1,195 @@
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+from prometheus_client import Gauge, Histogram
+
+from ledgermind.core.stores.interfaces import AuditProvider
+
+logger = logging.getLogger("ledgermind-core.audit.async")
+
+AUDIT_QUEUE_DEPTH = Gauge("agent_memory_audit_queue_depth", "Audit operations waiting for the committer")
+AUDIT_COMMIT_LAG = Histogram(
+    "agent_memory_audit_commit_lag_seconds", "Time from enqueue to audit commit",
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+)
+
+class AsyncAuditProvider(AuditProvider):
+    """
+    Moves audit commits off the request path. Operations are appended to the
+    `audit_queue` table of the metadata store, on the same connection and in the
+    same SQLite transaction as the metadata they describe, and a committer
+    thread applies them to the wrapped provider in order.
+
+    Each entry carries a snapshot of the file contents it commits, so the
+    committer never reads the working tree and does not need the store's FS
+    lock. It reads and acknowledges the queue on its own SQLite connection,
+    which only sees committed entries; the depth gauge is published from that
+    connection too, so an entry rolled back with its write is never counted.
+    Failed operations stay queued and are retried in order.
+
+    Applying is idempotent: each commit carries the entry's key in a
+    `Ledgermind-Audit-Id` trailer. Until an applied entry is acknowledged
+    (and once at startup), the next entry first checks whether HEAD already
+    carries its key, so a retry after a failed acknowledgement does not commit twice.
+    """
+    BATCH_SIZE = 64
+    TRAILER = "Ledgermind-Audit-Id"
+    commits_synchronously = False
+
+    def __init__(self, inner: AuditProvider, meta: Any, poll_interval: float = 1.0):
+        self.inner = inner
+        self.meta = meta
+        self.repo_path = getattr(inner, "repo_path", None)
+        self.poll_interval = poll_interval
+        self._staged: Dict[str, None] = {}
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._drain_lock = threading.Lock()
+        self._committer: Optional[threading.Thread] = None
+        self.committed = 0
+        self.last_lag: Optional[float] = None
+        # A previous run may have committed an entry it never acknowledged
+        self._check_head = True
+        self._conn = sqlite3.connect(meta.db_path, check_same_thread=False, timeout=30.0) if hasattr(meta, "db_path") else None
+
+    def initialize(self):
+        self.inner.initialize()
+        self._stopped.clear()
+        if self._committer is None or not self._committer.is_alive():
+            self._committer = threading.Thread(target=self._run, name="ledgermind-audit-committer", daemon=True)
+            self._committer.start()
+
+    def _enqueue(self, op: str, message: str, changes: Dict[str, Optional[str]]):
+        entry_id = self.meta.enqueue_audit(op, list(changes), message, json.dumps(changes))
+        if hasattr(self.meta, "stamp_history"):
+            # History rows written for this operation resolve to its commit once applied
+            self.meta.stamp_history(audit_id=entry_id)
+        self._wakeup.set()
+
+    def add_artifact(self, relative_path: str, content: str, commit_msg: str):
+        self._enqueue("add", commit_msg, {relative_path: content})
+
+    def update_artifact(self, relative_path: str, content: str, commit_msg: str):
+        self._enqueue("update", commit_msg, {relative_path: content})
+
+    def purge_artifact(self, relative_path: str):
+        self._enqueue("purge", f"Purge: {relative_path}", {relative_path: None})
+
+    def stage_paths(self, relative_paths: List[str]):
+        self._staged.update(dict.fromkeys(relative_paths))
+
+    def commit_transaction(self, message: str):
+        # Snapshot staged files now: the committer may run after later writes
+        staged, self._staged = list(self._staged), {}
+        self._enqueue("commit", message, {p: self._read(p) for p in staged})
+
+    def _read(self, relative_path: str) -> Optional[str]:
+        try:
+            with open(os.path.join(self.repo_path, relative_path), "r", encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def get_head_hash(self) -> Optional[str]:
+        return self.inner.get_head_hash()
+
+    def get_history(self, relative_path: str) -> List[Dict[str, Any]]:
+        """Committed history, preceded by queued entries for the path (newest first)."""
+        pending = [
+            {
+                "hash": None,
+                "author": "pending",
+                "timestamp": datetime.fromtimestamp(e["enqueued_at"]).astimezone().isoformat(),
+                "message": e["message"].split("\n", 1)[0],
+                "pending": True
+            }
+            for e in reversed(self.meta.pending_audit(limit=1000, path=relative_path))
+        ]
+        return pending + self.inner.get_history(relative_path)
+
+    @staticmethod
+    def _entry_key(entry: Dict[str, Any]) -> str:
+        # The enqueue time guards against ids restarting in a recreated metadata store
+        return f"{entry['id']}@{entry['enqueued_at']:.6f}"
+
+    def _head_carries(self, key: str) -> bool:
+        run = getattr(self.inner, "run", None)
+        if run is None or self.inner.get_head_hash() is None:
+            return False
+        trailers = run(["log", "-1", f"--format=%(trailers:key={self.TRAILER},valueonly)"]).stdout.decode()
+        return key in trailers.split()
+
+    def _apply(self, entry: Dict[str, Any]):
+        key = self._entry_key(entry)
+        if self._check_head and self._head_carries(key):
+            logger.info(f"Audit entry {entry['id']} is already committed; acknowledging it.")
+            return
+        changes = json.loads(entry["content"]) if entry["content"] else {}
+        self.inner.commit_snapshot(f"{entry['message']}\n\n{self.TRAILER}: {key}", changes)
+
+    def drain(self) -> int:
+        """Applies committed queue entries in order. Returns the number applied."""
+        applied = 0
+        with self._drain_lock:
+            if self._conn is not None:
+                AUDIT_QUEUE_DEPTH.set(self.meta.audit_queue_depth(conn=self._conn)["depth"])
+            while True:
+                entries = self.meta.pending_audit(limit=self.BATCH_SIZE, conn=self._conn)
+                if not entries:
+                    break
+                for entry in entries:
+                    self._apply(entry)
+                    # Until acknowledged, a retry must not apply the entry again
+                    self._check_head = True
+                    if hasattr(self.meta, "resolve_history"):
+                        self.meta.resolve_history(entry["id"], self.inner.get_head_hash(), conn=self._conn)
+                    self.meta.ack_audit(entry["id"], conn=self._conn)
+                    self._check_head = False
+                    self.last_lag = time.time() - entry["enqueued_at"]
+                    AUDIT_COMMIT_LAG.observe(self.last_lag)
+                    applied += 1
+            AUDIT_QUEUE_DEPTH.set(0)
+        self.committed += applied
+        return applied
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wakeup.wait(timeout=self.poll_interval)
+            self._wakeup.clear()
+            if self._stopped.is_set():
+                break
+            try:
+                self.drain()
+            except Exception as e:
+                logger.warning(f"Audit committer failed, will retry: {e}")
+                time.sleep(self.poll_interval)
+
+    def flush(self, acquire_lock: bool = True):
+        self.drain()
+        self.inner.flush(acquire_lock=acquire_lock)
+
+    def stats(self) -> Dict[str, Any]:
+        queue = self.meta.audit_queue_depth()
+        oldest = queue["oldest_enqueued_at"]
+        return {
+            "depth": queue["depth"],
+            "oldest_age_seconds": round(time.time() - oldest, 3) if oldest else 0.0,
+            "last_lag_seconds": round(self.last_lag, 3) if self.last_lag is not None else None,
+            "committed": self.committed
+        }
+
+    def close(self):
+        """Stops the committer after draining the queue."""
+        self._stopped.set()
+        self._wakeup.set()
+        self.flush()
+        if hasattr(self.inner, "close"):
+            self.inner.close()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
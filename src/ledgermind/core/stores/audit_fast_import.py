@@ -0,0 +1,198 @@
+import subprocess
+import os
+import time
+import logging
+import threading
+from typing import List, Optional, Dict
+from ledgermind.core.stores.audit_git import GitAuditProvider
+
+logger = logging.getLogger("ledgermind-core.audit.fast-import")
+
+class FastImportAuditProvider(GitAuditProvider):
+    """
+    Git audit provider that streams commits to a persistent `git fast-import`
+    process instead of spawning `git add` + `git commit` per write.
+
+    fast-import only publishes refs and objects at a checkpoint, so the branch
+    ref, the pack and the index are synchronised lazily: before any plain `git`
+    command issued through `run`, on `flush`, and every `CHECKPOINT_EVERY`
+    commits. Between checkpoints `get_head_hash` answers from the last mark.
+
+    Assumes a single writing process per repository: commits made elsewhere are
+    picked up at the next checkpoint boundary, not while commits are unpublished.
+    """
+    CHECKPOINT_EVERY = 256
+    # Commands that may move the branch behind fast-import's back
+    REF_MOVING_COMMANDS = {"commit", "reset", "merge", "rebase", "checkout", "pull", "cherry-pick", "revert", "am"}
+
+    def __init__(self, repo_path: str):
+        super().__init__(repo_path)
+        self._proc: Optional[subprocess.Popen] = None
+        self._io_lock = threading.RLock()
+        self._staged: Dict[str, None] = {}
+        self._mark = 0
+        self._head: Optional[str] = None
+        self._branch: Optional[str] = None
+        self._reparent = True # Next commit must name its parent explicitly
+        self._unsynced = 0
+        self._identity = None
+
+    def initialize(self):
+        if self._initialized:
+            return
+        super().initialize()
+        self._branch = self._read_symbolic_ref() or "refs/heads/master"
+        name = os.environ.get("GIT_AUTHOR_NAME") or self._git_config("user.name") or "ledgermind-core"
+        email = os.environ.get("GIT_AUTHOR_EMAIL") or self._git_config("user.email") or "agent@memory.local"
+        self._identity = f"{name} <{email}>".encode("utf-8")
+        # A previous process may have exited without realigning the index
+        super().run(["reset", "-q"])
+
+    def _git_config(self, key: str) -> Optional[str]:
+        res = subprocess.run(["git", "config", key], cwd=self.repo_path, capture_output=True, text=True)
+        return res.stdout.strip() if res.returncode == 0 else None
+
+    def _read_branch_tip(self) -> Optional[str]:
+        return self._read_ref(self._branch) or super().get_head_hash()
+
+    def _ensure_process(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                ["git", "fast-import", "--quiet"],
+                cwd=self.repo_path, stdin=subprocess.PIPE, stdout=subprocess.PIPE
+            )
+            self._reparent = True
+        return self._proc
+
+    def _commit(self, message: str, changes: Dict[str, Optional[bytes]]) -> str:
+        """
+        Streams one commit. `changes` maps paths to new content, or None for deletions.
+        Returns the new commit hash.
+        """
+        with self._io_lock:
+            proc = self._ensure_process()
+            self._mark += 1
+            msg = message.encode("utf-8")
+            parts = [
+                b"commit " + self._branch.encode("utf-8") + b"\n",
+                b"mark :%d\n" % self._mark,
+                b"committer " + self._identity + b" %d +0000\n" % int(time.time()),
+                b"data %d\n" % len(msg), msg, b"\n",
+            ]
+            parent = None
+            if self._unsynced == 0:
+                # Published state: cheap check whether another writer moved the branch
+                parent = self._read_branch_tip()
+                if parent != self._head:
+                    self._reparent = True
+            if self._reparent:
+                parent = parent or self._read_branch_tip()
+                if parent:
+                    parts.append(b"from " + parent.encode("ascii") + b"\n")
+            for path, content in changes.items():
+                quoted = path.replace(os.sep, "/").encode("utf-8")
+                if content is None:
+                    parts.append(b"D " + quoted + b"\n")
+                else:
+                    parts.append(b"M 100644 inline " + quoted + b"\n")
+                    parts.append(b"data %d\n" % len(content))
+                    parts.append(content)
+                    parts.append(b"\n")
+            parts.append(b"\nget-mark :%d\n" % self._mark)
+
+            try:
+                proc.stdin.write(b"".join(parts))
+                proc.stdin.flush()
+                head = proc.stdout.readline().decode("ascii").strip()
+            except (BrokenPipeError, OSError) as e:
+                self._proc = None
+                raise RuntimeError(f"git fast-import terminated: {e}")
+            if not head:
+                self._proc = None
+                raise RuntimeError("git fast-import terminated without acknowledging commit")
+
+            self._head = head
+            self._reparent = False
+            self._unsynced += 1
+            if self._unsynced >= self.CHECKPOINT_EVERY:
+                self._checkpoint()
+            return head
+
+    def _checkpoint(self):
+        """Publishes refs and objects written so far and realigns the index with HEAD."""
+        with self._io_lock:
+            if not self._unsynced:
+                return
+            if self._proc is not None and self._proc.poll() is None:
+                self._proc.stdin.write(b"checkpoint\nprogress synced\n")
+                self._proc.stdin.flush()
+                while True:
+                    line = self._proc.stdout.readline()
+                    if not line or line.startswith(b"progress synced"):
+                        break
+            self._unsynced = 0
+            # Mixed reset keeps the working tree but drops the stale index
+            super().run(["reset", "-q"])
+
+    def _read_file(self, relative_path: str) -> Optional[bytes]:
+        try:
+            with open(os.path.join(self.repo_path, relative_path), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def run(self, args: List[str], max_retries: int = 15, input: Optional[bytes] = None):
+        """Runs a plain git command after publishing pending fast-import state."""
+        with self._io_lock:
+            self._checkpoint()
+            result = super().run(args, max_retries=max_retries, input=input)
+            if args and args[0] in self.REF_MOVING_COMMANDS:
+                self._reparent = True
+                self._head = None
+            return result
+
+    def add_artifact(self, relative_path: str, content: str, commit_msg: str):
+        self._commit(commit_msg, {relative_path: content.encode("utf-8")})
+
+    def update_artifact(self, relative_path: str, content: str, commit_msg: str):
+        self._commit(commit_msg, {relative_path: content.encode("utf-8")})
+
+    def purge_artifact(self, relative_path: str):
+        try:
+            self._commit(f"Purge: {relative_path}", {relative_path: None})
+        except Exception as e:
+            logger.warning(f"Failed to purge {relative_path} from git: {e}")
+
+    def stage_paths(self, relative_paths: List[str]):
+        with self._io_lock:
+            self._staged.update(dict.fromkeys(relative_paths))
+
+    def commit_transaction(self, message: str):
+        with self._io_lock:
+            staged, self._staged = self._staged, {}
+            try:
+                self._commit(message, {p: self._read_file(p) for p in staged})
+            except Exception:
+                self._staged = {**staged, **self._staged}
+                raise
+
+    def commit_snapshot(self, message: str, changes: Dict[str, Optional[str]]):
+        self._commit(message, {p: c.encode("utf-8") if c is not None else None for p, c in changes.items()})
+
+    def get_head_hash(self) -> Optional[str]:
+        return self._head or super().get_head_hash()
+
+    def flush(self, acquire_lock: bool = True):
+        self._checkpoint()
+
+    def close(self):
+        """Finishes the fast-import stream, publishing everything written."""
+        with self._io_lock:
+            self._checkpoint()
+            if self._proc is not None:
+                try:
+                    self._proc.stdin.close()
+                    self._proc.wait(timeout=30)
+                except (OSError, subprocess.TimeoutExpired) as e:
+                    logger.warning(f"git fast-import did not exit cleanly: {e}")
+                self._proc = None
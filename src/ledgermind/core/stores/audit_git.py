@@ -1,24 +1,64 @@
 import subprocess
 import os
+import json
 import time
 import logging
-from typing import List, Optional
+import threading
+from typing import List, Optional, Tuple, Dict, Any, Callable
 from ledgermind.core.stores.interfaces import AuditProvider
+from ledgermind.core.stores.semantic_store.transactions import FileSystemLock, atomic_write
 
 logger = logging.getLogger("ledgermind-core.audit.git")
 
 class GitAuditProvider(AuditProvider):
-    def __init__(self, repo_path: str):
+    """
+    Audit provider backed by a local Git repository.
+
+    With `group_commit_ms > 0`, artifact writes are not committed immediately:
+    they are appended to a pending-commit journal in `.git` and a background
+    flusher folds everything that lands within the window into a single commit.
+    SQLite remains the synchronous durability point; entries still in the
+    journal after a crash are committed by the next `flush`. `on_commit`, when
+    set, is called with the new HEAD hash after each group commit, so records
+    written before the commit existed can be attributed to it. `close` stops
+    the flusher and commits what is left.
+
+    The HEAD hash is resolved from `.git/HEAD` and the ref files in-process and
+    cached until a stat of those files shows that HEAD or the branch moved, so
+    reading it after each write does not spawn `git rev-parse`.
+    """
+    PENDING_JOURNAL = "ledgermind-pending.jsonl"
+    # Maintenance thresholds (see `maintain`)
+    MAINTENANCE_LOOSE_OBJECTS = 1000
+    MAINTENANCE_PACKS = 20
+    PRUNE_EXPIRE = "2.weeks.ago"
+
+    def __init__(self, repo_path: str, group_commit_ms: int = 0):
         self.repo_path = repo_path
+        self.group_commit_ms = group_commit_ms
+        self.commits_synchronously = group_commit_ms <= 0
         self._initialized = False
+        self._pending: List[Tuple[List[str], str]] = []
+        self._pending_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        self.on_commit: Optional[Callable[[str], None]] = None
+        # (stat signature of HEAD, symbolic ref) and (stat signature of refs, hash)
+        self._head_ref: Tuple[Optional[tuple], Optional[str]] = (None, None)
+        self._head_cache: Tuple[Optional[tuple], Optional[str]] = (None, None)
 
-    def run(self, args: List[str], max_retries: int = 15):
+    @property
+    def _journal_path(self) -> str:
+        return os.path.join(self.repo_path, ".git", self.PENDING_JOURNAL)
+
+    def run(self, args: List[str], max_retries: int = 15, input: Optional[bytes] = None):
         last_error = ""
         # Ensure we always use --no-pager to avoid hanging in interactive environments
         cmd = ["git", "--no-pager"] + args
         for i in range(max_retries):
             try:
-                return subprocess.run(cmd, cwd=self.repo_path, check=True, capture_output=True)
+                return subprocess.run(cmd, cwd=self.repo_path, check=True, capture_output=True, input=input)
             except subprocess.CalledProcessError as e:
                 last_error = e.stderr.decode()
                 combined = last_error + "\n" + e.stdout.decode()
@@ -65,6 +105,7 @@ class GitAuditProvider(AuditProvider):
                 if not os.path.exists(os.path.join(self.repo_path, ".git")):
                     raise e
         
+        self._load_pending()
         self._initialized = True
 
     def is_healthy(self) -> bool:
@@ -76,22 +117,89 @@ class GitAuditProvider(AuditProvider):
             return False
 
     def add_artifact(self, relative_path: str, content: str, commit_msg: str):
+        if self.group_commit_ms > 0:
+            return self._enqueue([relative_path], commit_msg)
         self.run(["add", "--", relative_path])
         self.run(["commit", "-m", commit_msg, "--", relative_path])
 
     def update_artifact(self, relative_path: str, content: str, commit_msg: str):
+        if self.group_commit_ms > 0:
+            return self._enqueue([relative_path], commit_msg)
         self.run(["add", "--", relative_path])
         self.run(["commit", "-m", commit_msg, "--", relative_path])
 
-    def get_head_hash(self) -> Optional[str]:
+    def _git_path(self, *parts: str) -> str:
+        return os.path.join(self.repo_path, ".git", *parts)
+
+    @staticmethod
+    def _stat_key(path: str) -> Optional[tuple]:
+        # Git replaces refs via rename, so the inode changes on every update
         try:
-            res = subprocess.run(["git", "rev-parse", "HEAD"], cwd=self.repo_path, capture_output=True, text=True)
-            if res.returncode == 0:
-                return res.stdout.strip()
-        except Exception: pass
+            st = os.stat(path)
+            return (st.st_ino, st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+
+    def _read_symbolic_ref(self) -> Optional[str]:
+        """The ref HEAD points to (e.g. refs/heads/master), or None when detached."""
+        head_key = self._stat_key(self._git_path("HEAD"))
+        if head_key is not None and self._head_ref[0] == head_key:
+            return self._head_ref[1]
+        ref = None
+        try:
+            with open(self._git_path("HEAD"), "r", encoding="utf-8") as f:
+                head = f.read().strip()
+            if head.startswith("ref: "):
+                ref = head[5:]
+        except OSError: pass
+        self._head_ref = (head_key, ref)
+        return ref
+
+    def _read_ref(self, ref: str) -> Optional[str]:
+        """Resolves a ref from loose or packed refs without spawning git."""
+        try:
+            with open(self._git_path(*ref.split("/")), "r", encoding="utf-8") as f:
+                return f.read().strip() or None
+        except OSError: pass
+        try:
+            with open(self._git_path("packed-refs"), "r", encoding="utf-8") as f:
+                for line in f:
+                    parts = line.strip().split(" ")
+                    if len(parts) == 2 and parts[1] == ref:
+                        return parts[0]
+        except OSError: pass
         return None
 
+    def get_head_hash(self) -> Optional[str]:
+        ref = self._read_symbolic_ref()
+        signature = (
+            self._stat_key(self._git_path("HEAD")),
+            self._stat_key(self._git_path(*ref.split("/"))) if ref else None,
+            self._stat_key(self._git_path("packed-refs"))
+        )
+        cached_signature, cached_hash = self._head_cache
+        if cached_hash and cached_signature == signature:
+            return cached_hash
+
+        head = self._read_ref(ref) if ref else None
+        if ref is None:
+            try:
+                with open(self._git_path("HEAD"), "r", encoding="utf-8") as f:
+                    head = f.read().strip() or None # Detached HEAD holds the hash itself
+            except OSError: pass
+        if head is None:
+            # Unusual ref storage: let git resolve it
+            try:
+                res = subprocess.run(["git", "rev-parse", "HEAD"], cwd=self.repo_path, capture_output=True, text=True)
+                if res.returncode == 0:
+                    head = res.stdout.strip()
+            except Exception: pass
+        self._head_cache = (signature, head)
+        return head
+
     def purge_artifact(self, relative_path: str):
+        if self.group_commit_ms > 0:
+            return self._enqueue([relative_path], f"Purge: {relative_path}")
         try:
             self.run(["rm", "--cached", "--", relative_path])
             self.run(["commit", "-m", f"Purge: {relative_path}"])
@@ -99,11 +207,245 @@ class GitAuditProvider(AuditProvider):
             logger.warning(f"Failed to purge {relative_path} from git: {e}")
 
     def commit_transaction(self, message: str):
+        if self.group_commit_ms > 0:
+            # Paths were already staged in the index by the transaction
+            return self._enqueue([], message)
         self.run(["commit", "--allow-empty", "-m", message])
 
+    def stage_paths(self, relative_paths: List[str]):
+        present = [p for p in relative_paths if os.path.exists(os.path.join(self.repo_path, p))]
+        missing = [p for p in relative_paths if p not in present]
+        if present:
+            self.run(["add", "--"] + present)
+        if missing:
+            self.run(["rm", "-q", "--cached", "--ignore-unmatch", "--"] + missing)
+
+    def commit_snapshot(self, message: str, changes: Dict[str, Optional[str]]):
+        index_info = []
+        for path, content in changes.items():
+            if content is None:
+                index_info.append(f"0 {'0' * 40}\t{path}")
+            else:
+                sha = self.run(["hash-object", "-w", "--stdin"], input=content.encode("utf-8")).stdout.decode().strip()
+                index_info.append(f"100644 {sha}\t{path}")
+        if index_info:
+            self.run(["update-index", "--index-info"], input=("\n".join(index_info) + "\n").encode("utf-8"))
+        self.run(["commit", "--allow-empty", "-m", message])
+
+    def _load_pending(self):
+        """Reloads entries left in the journal by a previous process."""
+        if not os.path.exists(self._journal_path):
+            return
+        with open(self._journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue # Torn final line
+                self._pending.append((entry["paths"], entry["message"]))
+        if self._pending:
+            logger.info(f"Recovered {len(self._pending)} pending audit commits from journal.")
+
+    def _enqueue(self, paths: List[str], message: str):
+        with self._pending_lock:
+            self._pending.append((paths, message))
+            with open(self._journal_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"paths": paths, "message": message}) + "\n")
+            if self._flusher is None or not self._flusher.is_alive():
+                self._stopped.clear()
+                self._flusher = threading.Thread(target=self._flush_loop, name="ledgermind-group-commit", daemon=True)
+                self._flusher.start()
+        self._wakeup.set()
+
+    def _flush_loop(self):
+        while not self._stopped.is_set():
+            self._wakeup.wait()
+            # close() cuts the window short; its own flush commits the tail
+            if self._stopped.wait(self.group_commit_ms / 1000.0):
+                break
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.warning(f"Group commit failed, will retry: {e}")
+                self._wakeup.set()
+
+    def close(self):
+        """Stops the group-commit flusher and commits the pending tail."""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._flusher is not None:
+            self._flusher.join(timeout=30)
+            self._flusher = None
+        self.flush()
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def flush(self, acquire_lock: bool = True):
+        """
+        Commits all pending audit entries as one Git commit. Takes the store's
+        FS lock unless the caller already holds it, so a commit never captures
+        a half-staged transaction.
+        """
+        if not self._pending:
+            return
+        lock = FileSystemLock(os.path.join(self.repo_path, ".lock")) if acquire_lock else None
+        if lock: lock.acquire(exclusive=True)
+        try:
+            with self._pending_lock:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return
+            try:
+                self.stage_paths(list(dict.fromkeys(p for entry_paths, _ in batch for p in entry_paths)))
+
+                messages = [message for _, message in batch]
+                if len(messages) == 1:
+                    message = messages[0]
+                else:
+                    message = f"Group commit: {len(messages)} changes\n\n" + "\n".join(f"- {m}" for m in messages)
+                self.run(["commit", "--allow-empty", "-m", message])
+            except Exception:
+                with self._pending_lock:
+                    self._pending = batch + self._pending
+                raise
+
+            with self._pending_lock:
+                # Keep only entries that arrived while the commit was running
+                atomic_write(self._journal_path, "".join(
+                    json.dumps({"paths": p, "message": m}) + "\n" for p, m in self._pending
+                ))
+            if self.on_commit:
+                try:
+                    self.on_commit(self.get_head_hash())
+                except Exception as e:
+                    logger.warning(f"Group commit hook failed: {e}")
+        finally:
+            if lock: lock.release()
+
+    def object_stats(self) -> Dict[str, int]:
+        """Loose object and pack counts as reported by `git count-objects -v`."""
+        res = self.run(["count-objects", "-v"])
+        stats = {}
+        for line in res.stdout.decode().splitlines():
+            key, _, value = line.partition(":")
+            try:
+                stats[key.strip()] = int(value)
+            except ValueError: pass
+        return stats
+
+    def needs_maintenance(self) -> bool:
+        """True once loose objects or packs have crossed the `maintain` thresholds."""
+        stats = self.object_stats()
+        return stats.get("count", 0) >= self.MAINTENANCE_LOOSE_OBJECTS or stats.get("packs", 0) >= self.MAINTENANCE_PACKS
+
+    def maintain(self, loose_threshold: Optional[int] = None, pack_threshold: Optional[int] = None,
+                 should_stop: Optional[Callable[[], bool]] = None, lock_timeout: int = 0) -> Dict[str, Any]:
+        """
+        Packs the repository once it has accumulated `loose_threshold` loose
+        objects or `pack_threshold` packs: an incremental repack of loose
+        objects, a geometric repack of small packs, a split commit-graph write
+        and a prune of unreachable loose objects older than PRUNE_EXPIRE.
+
+        Each step runs under the store's FS lock, taken with `lock_timeout`
+        (by default the cycle is skipped if a writer holds it) and released
+        between steps, so writers wait for at most one step. `should_stop` is
+        polled between steps.
+        """
+        loose_threshold = self.MAINTENANCE_LOOSE_OBJECTS if loose_threshold is None else loose_threshold
+        pack_threshold = self.MAINTENANCE_PACKS if pack_threshold is None else pack_threshold
+        stats = self.object_stats()
+        report = {"loose_objects": stats.get("count", 0), "packs": stats.get("packs", 0), "actions": [], "skipped": None}
+
+        steps = []
+        if report["loose_objects"] >= loose_threshold:
+            steps.append(("repack", ["repack", "-d", "-q"]))
+        if report["packs"] >= pack_threshold:
+            steps.append(("geometric_repack", ["repack", "-d", "-q", "--geometric=2"]))
+        if not steps:
+            return report
+        steps.append(("commit_graph", ["commit-graph", "write", "--reachable", "--split"]))
+        steps.append(("prune", ["prune", f"--expire={self.PRUNE_EXPIRE}"]))
+
+        lock = FileSystemLock(os.path.join(self.repo_path, ".lock"))
+        for name, args in steps:
+            if should_stop and should_stop():
+                report["skipped"] = "stopped"
+                break
+            try:
+                acquired = lock.acquire(exclusive=True, timeout=lock_timeout)
+            except TimeoutError:
+                acquired = False
+            if not acquired:
+                report["skipped"] = "locked"
+                break
+            try:
+                try:
+                    self.run(args)
+                except subprocess.CalledProcessError:
+                    if name != "geometric_repack":
+                        raise
+                    # --geometric needs Git 2.33; consolidate all packs instead
+                    self.run(["repack", "-a", "-d", "-q"])
+                report["actions"].append(name)
+            finally:
+                lock.release()
+
+        if report["actions"]:
+            after = self.object_stats()
+            logger.info(f"Git maintenance ({', '.join(report['actions'])}): "
+                        f"{report['loose_objects']} -> {after.get('count', 0)} loose objects, "
+                        f"{report['packs']} -> {after.get('packs', 0)} packs")
+            report["loose_objects"], report["packs"] = after.get("count", 0), after.get("packs", 0)
+        return report
+
+    def list_file_versions(self, suffix: str = ".md", acquire_lock: bool = True) -> List[dict]:
+        """
+        Every committed version of files ending in `suffix`, oldest first, with
+        the commit hash, author, ISO timestamp, subject, path and file content.
+        Deletions are reported with content None. Pending group commits are
+        flushed first; pass `acquire_lock=False` when already holding the FS lock.
+        """
+        self.flush(acquire_lock=acquire_lock)
+        res = self.run(["-c", "core.quotepath=off", "log", "--reverse", "--no-renames",
+                        "--format=%x1e%H%x1f%an%x1f%aI%x1f%s", "--name-status"])
+        versions = []
+        for record in res.stdout.decode("utf-8", errors="replace").split("\x1e"):
+            lines = record.strip("\n").split("\n")
+            header = lines[0].split("\x1f")
+            if len(header) < 4: continue
+            for line in lines[1:]:
+                parts = line.split("\t")
+                if len(parts) != 2 or not parts[1].endswith(suffix): continue
+                versions.append({
+                    "hash": header[0], "author": header[1], "timestamp": header[2], "message": header[3],
+                    "path": parts[1], "content": None if parts[0] == "D" else ""
+                })
+
+        # Fetch all blobs in one pass: "<sha> blob <size>\n<content>\n" per request
+        wanted = [v for v in versions if v["content"] is not None]
+        if wanted:
+            batch = "".join(f"{v['hash']}:{v['path']}\n" for v in wanted).encode("utf-8")
+            out = self.run(["cat-file", "--batch"], input=batch).stdout
+            pos = 0
+            for v in wanted:
+                eol = out.index(b"\n", pos)
+                header = out[pos:eol].split(b" ")
+                pos = eol + 1
+                if len(header) < 3 or header[1] != b"blob":
+                    v["content"] = None # "missing"
+                    continue
+                size = int(header[2])
+                v["content"] = out[pos:pos + size].decode("utf-8", errors="replace")
+                pos += size + 1
+        return versions
+
     def get_history(self, relative_path: str) -> List[dict]:
         """Retrieves commit history for a specific file."""
         try:
+            self.flush()
             # Format: hash|author|date|message
             res = self.run(["log", "--format=%H|%an|%ai|%s", "--", relative_path])
             lines = res.stdout.decode().strip().split('\n')
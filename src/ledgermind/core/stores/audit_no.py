@@ -10,6 +10,8 @@ class NoAuditProvider(AuditProvider):
     Suitable for environments without Git installed.
     Only provides basic filesystem operations without versioning.
     """
+    commits_synchronously = False
+
     def __init__(self, repo_path: str):
         self.repo_path = repo_path
 
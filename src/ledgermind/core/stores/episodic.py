@@ -1,24 +1,66 @@
+import os
+import re
 import sqlite3
 import json
+import numpy as np
 from typing import List, Optional, Dict, Any, Tuple
 from contextlib import contextmanager
-from ledgermind.core.core.schemas import MemoryEvent
+from ledgermind.core.core.schemas import MemoryEvent, KIND_ERROR, KIND_RESULT
+from ledgermind.core.reasoning.decay import INVALID_EPOCH
+
+COMMIT_TARGET_PATTERN = re.compile(r'\(([^)]+)\):')
+# Wall-clock epoch seconds of `timestamp` (timezone suffix ignored); NULL if unparseable
+EPOCH_SQL = "CAST(strftime('%s', substr({ts}, 1, 19)) AS INTEGER)"
+# Counter / id-ring columns of target_stats per event kind; any other kind counts as 'other'
+TARGET_STAT_COLUMNS = {KIND_ERROR: "error", KIND_RESULT: "success", "commit_change": "commit"}
+
+def event_target(kind: str, content: Optional[str], context: Any) -> Optional[str]:
+    """
+    Target an event is evidence for: the scope of a conventional commit message
+    for `commit_change` events, `context['target']` otherwise.
+    """
+    if kind == 'commit_change':
+        match = COMMIT_TARGET_PATTERN.search(content or '')
+        return match.group(1) if match else None
+    if isinstance(context, dict):
+        return context.get('target') or None
+    return None
 
 class EpisodicStore:
-    def __init__(self, db_path: str):
+    """
+    SQLite event log. Alongside `events`, the `target_stats` table keeps per-target
+    evidence counters, the last seen timestamp and rings of the most recent
+    `TARGET_RING_SIZE` event ids per kind; it is updated in the same transaction
+    as every append. `events.epoch` mirrors `timestamp` as epoch seconds (kept
+    in step by triggers) so decay never has to parse timestamps.
+    """
+    TARGET_RING_SIZE = 256
+
+    def __init__(self, db_path: str, read_only: bool = False):
         self.db_path = db_path
-        self._init_db()
+        self.read_only = read_only
+        if not read_only:
+            self._init_db()
 
     @contextmanager
     def _get_conn(self):
-        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        if self.read_only:
+            from urllib.request import pathname2url
+            conn = sqlite3.connect(f"file:{pathname2url(os.path.abspath(self.db_path))}?mode=ro", uri=True, timeout=30.0)
+        else:
+            conn = sqlite3.connect(self.db_path, timeout=30.0)
         try:
-            conn.execute("PRAGMA journal_mode=WAL")
-            conn.execute("PRAGMA synchronous=NORMAL")
+            if not self.read_only:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
             yield conn
         finally:
             conn.close()
 
+    def _ensure_writable(self):
+        if self.read_only:
+            raise PermissionError("Episodic store is open read-only")
+
     def _init_db(self):
         with self._get_conn() as conn:
             with conn:
@@ -40,8 +82,124 @@ class EpisodicStore:
                     conn.execute("ALTER TABLE events ADD COLUMN link_strength REAL DEFAULT 1.0")
                 except sqlite3.OperationalError:
                     pass
+                # Migration: Add and backfill the epoch column
+                try:
+                    conn.execute("ALTER TABLE events ADD COLUMN epoch INTEGER")
+                    conn.execute(f"UPDATE events SET epoch = {EPOCH_SQL.format(ts='timestamp')}")  # nosec B608
+                except sqlite3.OperationalError:
+                    pass
+                for name, event in (("events_epoch_insert", "INSERT"), ("events_epoch_update", "UPDATE OF timestamp")):
+                    conn.execute(f"""
+                        CREATE TRIGGER IF NOT EXISTS {name} AFTER {event} ON events BEGIN
+                            UPDATE events SET epoch = {EPOCH_SQL.format(ts='NEW.timestamp')} WHERE id = NEW.id;
+                        END
+                    """)
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_events_timestamp ON events(timestamp)")
+                has_stats = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'target_stats'"
+                ).fetchone()
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS target_stats (
+                        target TEXT PRIMARY KEY,
+                        errors INTEGER DEFAULT 0,
+                        successes INTEGER DEFAULT 0,
+                        commits INTEGER DEFAULT 0,
+                        others INTEGER DEFAULT 0,
+                        last_seen TEXT,
+                        last_event_id INTEGER,
+                        error_ids TEXT DEFAULT '[]',
+                        success_ids TEXT DEFAULT '[]',
+                        commit_ids TEXT DEFAULT '[]',
+                        other_ids TEXT DEFAULT '[]'
+                    )
+                """)
+                # Migration: Backfill statistics for events logged before the table existed
+                if not has_stats:
+                    self._rebuild_target_stats(conn)
+
+    def _record_targets(self, conn: sqlite3.Connection, entries: List[Tuple[int, str, Optional[str], Any, str]]):
+        """Folds (id, kind, content, context, timestamp) entries into target_stats."""
+        pending: Dict[str, List[Tuple[int, str, str]]] = {}
+        for event_id, kind, content, context, timestamp in entries:
+            target = event_target(kind, content, context)
+            if target:
+                pending.setdefault(target, []).append((event_id, kind, timestamp))
+        for target, events in pending.items():
+            row = conn.execute(
+                "SELECT errors, successes, commits, others, last_seen, last_event_id, "
+                "error_ids, success_ids, commit_ids, other_ids FROM target_stats WHERE target = ?",
+                (target,)
+            ).fetchone()
+            counts = {"error": 0, "success": 0, "commit": 0, "other": 0}
+            rings: Dict[str, List[int]] = {k: [] for k in counts}
+            last_seen, last_event_id = None, None
+            if row:
+                counts = dict(zip(counts, row[0:4]))
+                last_seen, last_event_id = row[4], row[5]
+                rings = {k: json.loads(r) for k, r in zip(rings, row[6:10])}
+            for event_id, kind, timestamp in events:
+                col = TARGET_STAT_COLUMNS.get(kind, "other")
+                counts[col] += 1
+                rings[col].append(event_id)
+                last_seen = timestamp if last_seen is None else max(last_seen, timestamp)
+                last_event_id = event_id if last_event_id is None else max(last_event_id, event_id)
+            conn.execute(
+                "INSERT OR REPLACE INTO target_stats (target, errors, successes, commits, others, last_seen, "
+                "last_event_id, error_ids, success_ids, commit_ids, other_ids) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (target, counts["error"], counts["success"], counts["commit"], counts["other"], last_seen, last_event_id,
+                 *(json.dumps(rings[k][-self.TARGET_RING_SIZE:]) for k in ("error", "success", "commit", "other")))
+            )
+
+    def _rebuild_target_stats(self, conn: sqlite3.Connection):
+        conn.execute("DELETE FROM target_stats")
+        cursor = conn.execute("SELECT id, kind, content, context, timestamp FROM events ORDER BY id")
+        while True:
+            rows = cursor.fetchmany(10000)
+            if not rows:
+                break
+            entries = []
+            for event_id, kind, content, context, timestamp in rows:
+                try:
+                    ctx = json.loads(context) if context else {}
+                except ValueError:
+                    ctx = {}
+                entries.append((event_id, kind, content, ctx, timestamp))
+            self._record_targets(conn, entries)
+
+    def rebuild_target_stats(self):
+        """Recomputes target_stats from the events table."""
+        self._ensure_writable()
+        with self._get_conn() as conn:
+            with conn:
+                self._rebuild_target_stats(conn)
+
+    def target_stats_since(self, after_id: Optional[int]) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Evidence statistics of targets with events after `after_id`: cumulative
+        counters, `last_seen` and, per kind, the ids after `after_id`. Returns None
+        when a ring cannot show that it still holds every such id, i.e. it is full
+        and all of its ids are newer than `after_id`.
+        """
+        floor = after_id if after_id is not None else -1
+        result = {}
+        with self._get_conn() as conn:
+            rows = conn.execute(
+                "SELECT target, errors, successes, commits, others, last_seen, "
+                "error_ids, success_ids, commit_ids, other_ids FROM target_stats WHERE last_event_id > ?",
+                (floor,)
+            ).fetchall()
+        for row in rows:
+            stats = {"errors": row[1], "successes": row[2], "commits": row[3], "others": row[4], "last_seen": row[5]}
+            for col, total, ring in zip(("error", "success", "commit", "other"), row[1:5], row[6:10]):
+                ids = json.loads(ring)
+                if len(ids) < total and (not ids or ids[0] > floor):
+                    return None
+                stats[f"{col}_ids"] = [i for i in ids if i > floor]
+            result[row[0]] = stats
+        return result
 
     def append(self, event: MemoryEvent, linked_id: Optional[str] = None, link_strength: float = 1.0) -> int:
+        self._ensure_writable()
         with self._get_conn() as conn:
             # Handle context serialization for Pydantic models
             context_data = event.context
@@ -50,6 +208,7 @@ class EpisodicStore:
             else:
                 context_dict = context_data
                 
+            timestamp = event.timestamp.isoformat()
             with conn:
                 cursor = conn.execute(
                     "INSERT INTO events (source, kind, content, context, timestamp, linked_id, link_strength) VALUES (?, ?, ?, ?, ?, ?, ?)",
@@ -58,14 +217,40 @@ class EpisodicStore:
                         event.kind,
                         event.content,
                         json.dumps(context_dict),
-                        event.timestamp.isoformat(),
+                        timestamp,
                         linked_id,
                         link_strength
                     )
                 )
+                self._record_targets(conn, [(cursor.lastrowid, event.kind, event.content, context_dict, timestamp)])
                 return cursor.lastrowid
 
+    def append_many(self, events: List[Tuple[MemoryEvent, Optional[str]]]) -> List[int]:
+        """Appends (event, linked_id) pairs in one transaction. Returns the new event ids in order."""
+        self._ensure_writable()
+        rows, contexts = [], []
+        for event, linked_id in events:
+            context_data = event.context
+            context_dict = context_data.model_dump(mode='json') if hasattr(context_data, 'model_dump') else context_data
+            contexts.append(context_dict)
+            rows.append((event.source, event.kind, event.content, json.dumps(context_dict),
+                         event.timestamp.isoformat(), linked_id, 1.0))
+        with self._get_conn() as conn:
+            with conn:
+                # Hold the write lock before reading MAX(id): an append from another
+                # connection in between would otherwise be taken for one of ours
+                conn.execute("BEGIN IMMEDIATE")
+                last_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM events").fetchone()[0]
+                conn.executemany(
+                    "INSERT INTO events (source, kind, content, context, timestamp, linked_id, link_strength) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+                ids = [r[0] for r in conn.execute("SELECT id FROM events WHERE id > ? ORDER BY id", (last_id,))]
+                self._record_targets(conn, [(i, row[1], row[2], ctx, row[4]) for i, row, ctx in zip(ids, rows, contexts)])
+                return ids
+
     def link_to_semantic(self, event_id: int, semantic_id: str, strength: float = 1.0):
+        self._ensure_writable()
         with self._get_conn() as conn:
             with conn:
                 conn.execute("UPDATE events SET linked_id = ?, link_strength = ? WHERE id = ?", (semantic_id, strength, event_id))
@@ -115,12 +300,67 @@ class EpisodicStore:
             ).fetchone()
             return (row[0] or 0, row[1] or 0.0)
 
+    def has_events_after(self, event_id: Optional[int]) -> bool:
+        """True if an active event was appended after `event_id` (any active event if None)."""
+        with self._get_conn() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM events WHERE id > ? AND status = 'active' LIMIT 1",
+                (event_id if event_id is not None else -1,)
+            ).fetchone()
+            return row is not None
+
+    def count_events_after(self, event_id: Optional[int]) -> int:
+        """Number of active events appended after `event_id` (all active events if None)."""
+        with self._get_conn() as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM events WHERE id > ? AND status = 'active'",
+                (event_id if event_id is not None else -1,)
+            ).fetchone()[0]
+
+    def has_expired(self, cutoff: str) -> bool:
+        """True if an unlinked, mortal event is older than the ISO `cutoff` timestamp."""
+        with self._get_conn() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM events WHERE timestamp < ? AND linked_id IS NULL "
+                "AND kind NOT IN ('decision', 'constraint') LIMIT 1",
+                (cutoff,)
+            ).fetchone()
+            return row is not None
+
+    def decay_columns(self) -> Dict[str, np.ndarray]:
+        """
+        All events as columns for `DecayEngine.evaluate_columns`: ids, wall-clock
+        epoch timestamps (timezone suffix ignored), `active` and `immortal` masks.
+
+        Each column comes back as one comma-separated string parsed by NumPy, so
+        no Python object is built per event. The stored epoch and both masks
+        share a column: epoch * 8, plus 4 if the epoch is valid, 2 if immortal
+        and 1 if active.
+        """
+        with self._get_conn() as conn:
+            ids, packed = conn.execute("""
+                SELECT group_concat(id),
+                       group_concat(IFNULL(epoch * 8 + 4, 0)
+                                    + 2 * (IFNULL(linked_id, '') != '' OR IFNULL(kind, '') IN ('decision', 'constraint'))
+                                    + (IFNULL(status, '') = 'active'))
+                FROM events
+            """).fetchone()
+        ids = np.fromstring(ids or "", dtype=np.int64, sep=",")
+        packed = np.fromstring(packed or "", dtype=np.int64, sep=",")
+        return {
+            "ids": ids,
+            "timestamps": np.where(packed & 4 != 0, packed >> 3, INVALID_EPOCH),
+            "active": packed & 1 != 0,
+            "immortal": packed & 2 != 0
+        }
+
     def mark_archived(self, event_ids: List[int]):
+        self._ensure_writable()
         if not event_ids: return
-        placeholders = ','.join(['?'] * len(event_ids))
+        # One statement per id: a decay run can exceed SQLite's bound-variable limit
         with self._get_conn() as conn:
             with conn:
-                conn.execute(f"UPDATE events SET status = 'archived' WHERE id IN ({placeholders})", event_ids) # nosec B608
+                conn.executemany("UPDATE events SET status = 'archived' WHERE id = ?", ((i,) for i in event_ids))
 
     def find_duplicate(self, event: MemoryEvent) -> Optional[int]:
         """Checks if an identical event (source, kind, content) already exists."""
@@ -133,9 +373,9 @@ class EpisodicStore:
             return row[0] if row else None
 
     def physical_prune(self, event_ids: List[int]):
+        self._ensure_writable()
         if not event_ids: return
         # I2 Protection: Only prune if NOT linked
-        placeholders = ','.join(['?'] * len(event_ids))
         with self._get_conn() as conn:
             with conn:
-                conn.execute(f"DELETE FROM events WHERE id IN ({placeholders}) AND linked_id IS NULL", event_ids) # nosec B608
+                conn.executemany("DELETE FROM events WHERE id = ? AND linked_id IS NULL", ((i,) for i in event_ids))
@@ -26,6 +26,9 @@ class EpisodicProvider(ABC):
         pass
 
 class AuditProvider(ABC):
+    # True when get_head_hash() names the commit of the write that just returned
+    commits_synchronously = True
+
     @abstractmethod
     def initialize(self):
         pass
@@ -54,6 +57,23 @@ class AuditProvider(ABC):
     def get_history(self, relative_path: str) -> List[Dict[str, Any]]:
         pass
 
+    def stage_paths(self, relative_paths: List[str]):
+        """Marks working-tree paths (present or deleted) for the next `commit_transaction`."""
+        pass
+
+    def commit_snapshot(self, message: str, changes: Dict[str, Optional[str]]):
+        """
+        Commits the given file contents (None for deletions) regardless of what is
+        on disk now. Used to replay queued operations faithfully; the default
+        falls back to committing the current working-tree state.
+        """
+        self.stage_paths(list(changes))
+        self.commit_transaction(message)
+
+    def flush(self, acquire_lock: bool = True):
+        """Commits any deferred audit writes. Providers that commit synchronously need not override."""
+        pass
+
 class MetadataStore(ABC):
     @abstractmethod
     def upsert(self, fid: str, target: str, status: str, kind: str, timestamp: datetime, superseded_by: Optional[str] = None):
@@ -72,7 +92,7 @@ class MetadataStore(ABC):
         pass
 
     @abstractmethod
-    def delete(self, fid: str):
+    def delete(self, fid: str, purge_history: bool = False):
         pass
 
     @abstractmethod
@@ -1,19 +1,21 @@
 import os
-import yaml
+import copy
 import logging
 import sqlite3
 import uuid
-from typing import List, Optional, Any, Dict, Tuple
+from datetime import datetime
+from typing import Callable, Iterable, List, Optional, Any, Dict, Tuple
 from contextlib import contextmanager
 from ledgermind.core.core.schemas import MemoryEvent, TrustBoundary
 from ledgermind.core.stores.interfaces import MetadataStore, AuditProvider
 from ledgermind.core.stores.audit_git import GitAuditProvider
 from ledgermind.core.stores.semantic_store.integrity import IntegrityChecker
+from ledgermind.core.stores.semantic_store.cache import ParseCache
 
 from ledgermind.core.stores.semantic_store.transitions import TransitionValidator
 from ledgermind.core.stores.semantic_store.loader import MemoryLoader
 from ledgermind.core.stores.semantic_store.meta import SemanticMetaStore
-from ledgermind.core.stores.semantic_store.transactions import FileSystemLock
+from ledgermind.core.stores.semantic_store.transactions import FileSystemLock, TransactionManager, atomic_write
 
 # Setup structured logging
 logger = logging.getLogger("ledgermind-core.semantic")
@@ -25,14 +27,45 @@ class SemanticStore:
     """
     def __init__(self, repo_path: str, trust_boundary: TrustBoundary = TrustBoundary.AGENT_WITH_INTENT, 
                  meta_store: Optional[MetadataStore] = None,
-                 audit_store: Optional[AuditProvider] = None):
+                 audit_store: Optional[AuditProvider] = None,
+                 parse_cache_bytes: int = 16 * 1024 * 1024,
+                 frontmatter_format: str = MemoryLoader.FORMAT_YAML,
+                 group_commit_ms: int = 0,
+                 audit_backend: str = "git",
+                 async_audit: bool = False,
+                 read_only: bool = False):
+        """
+        With `read_only`, an existing store is opened without locks, Git setup,
+        migration, reconciliation or index sync, and every write raises
+        PermissionError.
+        """
         self.repo_path = repo_path
+        self.read_only = read_only
+        self.frontmatter_format = frontmatter_format
         self.trust_boundary = trust_boundary
         self.lock_file = os.path.join(repo_path, ".lock")
+        self.parse_cache = ParseCache(repo_path, max_bytes=parse_cache_bytes)
         
         self._fs_lock = FileSystemLock(self.lock_file)
         self._in_transaction = False
         self._current_tx = None
+        # Callbacks deferred by `after_commit`, one list per open transaction scope
+        self._after_commit: List[List[Callable[[], None]]] = []
+        self._generation = 0
+
+        if read_only:
+            if not os.path.isdir(self.repo_path):
+                raise FileNotFoundError(f"No semantic store at {self.repo_path}")
+            self.meta = meta_store or SemanticMetaStore(os.path.join(repo_path, "semantic_meta.db"), read_only=True)
+            # Not initialised: only read-side queries (HEAD, history) are used
+            if audit_store:
+                self.audit = audit_store
+            elif os.path.isdir(os.path.join(repo_path, ".git")):
+                self.audit = GitAuditProvider(repo_path)
+            else:
+                from ledgermind.core.stores.audit_no import NoAuditProvider
+                self.audit = NoAuditProvider(repo_path)
+            return
         
         if not os.path.exists(self.repo_path):
             os.makedirs(self.repo_path, exist_ok=True)
@@ -50,17 +83,30 @@ class SemanticStore:
 
         if audit_store:
             self.audit = audit_store
+        elif git_available and audit_backend == "fast-import":
+            from ledgermind.core.stores.audit_fast_import import FastImportAuditProvider
+            self.audit = FastImportAuditProvider(repo_path)
         elif git_available:
-            self.audit = GitAuditProvider(repo_path)
+            self.audit = GitAuditProvider(repo_path, group_commit_ms=group_commit_ms)
         else:
             from ledgermind.core.stores.audit_no import NoAuditProvider
             self.audit = NoAuditProvider(repo_path)
+        if async_audit:
+            from ledgermind.core.stores.audit_async import AsyncAuditProvider
+            self.audit = AsyncAuditProvider(self.audit, self.meta)
+        git = self._git
+        if git is not None and not git.commits_synchronously and hasattr(self.meta, "resolve_pending_history"):
+            # History rows written under group commit get their hash once it lands
+            git.on_commit = self.meta.resolve_pending_history
         
         self.audit.initialize()
         
         # Data Format Migration (Ensure backward compatibility)
         self._fs_lock.acquire(exclusive=True)
         try:
+            self._recover_interrupted_transaction()
+            # Drain audit commits deferred by group commit before the crash
+            self.audit.flush(acquire_lock=False)
             if self.meta.get_version() != "1.22.0":
                 from ledgermind.core.core.migration import MigrationEngine
                 migrator = MigrationEngine(self)
@@ -70,13 +116,125 @@ class SemanticStore:
             self._fs_lock.release()
         
         self.reconcile_untracked()
-        IntegrityChecker.validate(self.repo_path)
+        IntegrityChecker.validate(self.repo_path, cache=self.parse_cache)
         self.sync_meta_index()
+        self._backfill_history()
+
+    @property
+    def _git(self) -> Optional[GitAuditProvider]:
+        """The Git provider behind the audit chain, if any."""
+        audit = getattr(self.audit, "inner", self.audit)
+        return audit if isinstance(audit, GitAuditProvider) else None
+
+    def _ensure_writable(self):
+        if self.read_only:
+            raise PermissionError("Semantic store is open read-only")
+
+    def _commit_meta(self):
+        """Makes direct (non-transactional) metadata writes and queued audit ops durable."""
+        if not self._in_transaction and hasattr(self.meta, "commit"):
+            self.meta.commit()
+
+    @property
+    def generation(self) -> Tuple[int, int]:
+        """
+        Changes whenever decisions may have changed: writes through this store
+        bump a counter once they are visible, and commits by other connections
+        or processes change SQLite's data_version.
+        """
+        data_version = self.meta.data_version() if hasattr(self.meta, "data_version") else 0
+        return (self._generation, data_version)
+
+    def bump_generation(self):
+        self._generation += 1
+
+    def _stamp_history(self):
+        """Links history rows written since the last audit commit to that commit."""
+        if hasattr(self.meta, "stamp_history"):
+            head = self.audit.get_head_hash() if self.audit.commits_synchronously else None
+            self.meta.stamp_history(commit_hash=head)
+
+    def _backfill_history(self):
+        """One-time import of Git history for stores created before the history table."""
+        if not hasattr(self.meta, "has_history") or self.meta.get_config("history_backfilled"):
+            return
+        if not self.meta.has_history() and self.meta.list_all() and self._git:
+            try:
+                self.rebuild_history()
+            except Exception as e:
+                logger.warning(f"History backfill from Git failed: {e}")
+                return
+        self.meta.set_config("history_backfilled", "1")
+
+    def rebuild_history(self) -> int:
+        """
+        Rebuilds the history table from the Git audit log, which remains the
+        authoritative record. Versions of purged decisions are left out.
+        Returns the number of history rows written.
+        """
+        if not self._git:
+            raise RuntimeError("History can only be rebuilt from a Git audit log")
+        self._ensure_writable()
+        self._fs_lock.acquire(exclusive=True)
+        try:
+            versions = self._git.list_file_versions(acquire_lock=False)
+            live = {m['fid'] for m in self.meta.list_all()}
+            entries = []
+            for v in versions:
+                if v["content"] is None or v["path"] not in live:
+                    continue
+                try:
+                    data, _ = MemoryLoader.parse(v["content"])
+                except Exception:
+                    continue
+                ctx = data.get("context") or {}
+                ts = datetime.fromisoformat(v["timestamp"]).astimezone().replace(tzinfo=None)
+                entries.append({
+                    "fid": v["path"], "target": ctx.get("target"), "status": ctx.get("status"),
+                    "hash": v["hash"], "author": v["author"], "message": v["message"],
+                    "timestamp": ts.isoformat(), "context": ctx
+                })
+            self.meta.replace_history(entries)
+            return len(entries)
+        finally:
+            self._fs_lock.release()
+
+    def _recover_interrupted_transaction(self):
+        """
+        Rolls back files and Git index entries left behind by a crashed transaction.
+        If the crash came after its Git commit, that commit is reverted by a
+        recovery commit, so HEAD matches the restored files and metadata.
+        """
+        base_head = TransactionManager.journal_head(self.repo_path)
+        recovered = TransactionManager.recover(self.repo_path)
+        if recovered and self._git:
+            try:
+                self._git.stage_paths(recovered)
+                self._revert_landed_commit(recovered, base_head, "Recovery: Revert interrupted transaction")
+            except Exception as e:
+                logger.warning(f"Failed to realign Git after recovery: {e}")
+
+    def _revert_landed_commit(self, paths: List[str], base_head: Optional[str], message: str):
+        """
+        Commits the rolled-back `paths` (already staged) when HEAD moved past
+        `base_head`, i.e. the transaction's Git commit landed before it was undone.
+        """
+        git = self._git
+        if git is None or not base_head or git.get_head_hash() == base_head:
+            return
+        diff = git.run(["diff", "--cached", "--name-only", "-z", "HEAD", "--"] + paths).stdout.decode()
+        changed = [p for p in diff.split("\0") if p]
+        if changed:
+            logger.warning(f"Reverting {len(changed)} files committed by an undone transaction.")
+            git.run(["commit", "-q", "-m", message, "--"] + changed)
 
     def reconcile_untracked(self):
         """Finds files that are on disk but not in audit (Git) and adds them."""
+        self._ensure_writable()
+        git = self._git
+        if git is None:
+            return
         self._fs_lock.acquire(exclusive=True)
-        import subprocess
         try:
             disk_files = []
             for root, _, filenames in os.walk(self.repo_path):
@@ -86,24 +244,29 @@ class SemanticStore:
                         rel_path = os.path.relpath(os.path.join(root, f), self.repo_path)
                         disk_files.append(rel_path)
 
+            # One listing of tracked files instead of a `git ls-files` probe per file
+            try:
+                tracked = set(git.run(["ls-files", "-z"]).stdout.decode().split("\0"))
+            except Exception as e:
+                logger.warning(f"Skipping untracked file recovery: {e}")
+                return
             for f in disk_files:
-                # Check if file is tracked by git
-                if isinstance(self.audit, GitAuditProvider):
-                    res = subprocess.run(["git", "ls-files", "--error-unmatch", f], 
-                                         cwd=self.repo_path, capture_output=True)
-                    if res.returncode != 0:
-                        logger.info(f"Recovering untracked file: {f}")
-                        try:
-                            with open(os.path.join(self.repo_path, f), 'r', encoding='utf-8') as stream:
-                                content = stream.read()
-                            self.audit.add_artifact(f, content, f"Recovery: Auto-adding untracked file {f}")
-                        except Exception as e:
-                            logger.error(f"Failed to recover {f}: {e}")
+                if f not in tracked:
+                    logger.info(f"Recovering untracked file: {f}")
+                    try:
+                        with open(os.path.join(self.repo_path, f), 'r', encoding='utf-8') as stream:
+                            content = stream.read()
+                        self.audit.add_artifact(f, content, f"Recovery: Auto-adding untracked file {f}")
+                    except Exception as e:
+                        logger.error(f"Failed to recover {f}: {e}")
+            self._commit_meta()
         finally:
+            self.bump_generation()
             self._fs_lock.release()
 
     def sync_meta_index(self):
         """Ensures that the metadata index reflects the actual Markdown files on disk."""
+        self._ensure_writable()
         self._fs_lock.acquire(exclusive=True)
         from datetime import datetime
         try:
@@ -183,134 +346,288 @@ class SemanticStore:
                                 )
                     except Exception as e:
                         logger.error(f"Failed to index {f}: {e}")
+            self._commit_meta()
         finally:
+            self.bump_generation()
             self._fs_lock.release()
 
     @contextmanager
-    def transaction(self):
-        """Groups multiple operations into a single ACID transactional unit using TransactionManager."""
-        from ledgermind.core.stores.semantic_store.transactions import TransactionManager
-        
+    def transaction(self, commit_msg: str = "Atomic Transaction Commit"):
+        """
+        Groups multiple operations into a single ACID transactional unit using TransactionManager.
+        Re-entrant: a nested call opens a savepoint in the running transaction, and
+        only the outermost call locks, validates invariants and commits to Git
+        (with its `commit_msg`). Callbacks registered with `after_commit` run
+        once the outermost call has committed.
+        """
+        self._ensure_writable()
+        if self._current_tx is not None:
+            self._after_commit.append([])
+            try:
+                with self._current_tx.savepoint():
+                    yield
+            except Exception:
+                self._after_commit.pop()
+                self._resync_index(self._current_tx.last_rolled_back)
+                raise
+            deferred = self._after_commit.pop()
+            self._after_commit[-1].extend(deferred)
+            return
+
         self._current_tx = TransactionManager(self.repo_path, self.meta)
         self._in_transaction = True
+        self._after_commit = [[]]
         
         try:
             with self._current_tx.begin():
+                git = self._git
+                self._current_tx.base_head = git.get_head_hash() if git else None
                 yield
                 # Invariants check before commit
-                IntegrityChecker.validate(self.repo_path)
+                self._validate_invariants()
                 
                 # Commit to Audit Provider (Git) BEFORE releasing SQLite savepoint
                 # This ensures that if Git fails, the transaction block raises and 
                 # SQLite rolls back.
-                self.audit.commit_transaction("Atomic Transaction Commit")
+                self.audit.commit_transaction(commit_msg)
+                self._stamp_history()
         except Exception as e:
             logger.error(f"Transaction Failed: {e}. Rolling back...")
-            if isinstance(self.audit, GitAuditProvider):
-                self.audit.run(["reset", "--hard", "HEAD"])
+            # Files were restored by TransactionManager; only realign their index
+            # entries, so writes still pending a group commit are left untouched.
+            self._resync_index(self._current_tx.last_rolled_back)
+            try:
+                self._revert_landed_commit(self._current_tx.last_rolled_back, self._current_tx.base_head,
+                                           f"Revert failed transaction: {commit_msg}")
+            except Exception as revert_error:
+                logger.error(f"Failed to revert the Git commit of the failed transaction: {revert_error}")
+            if hasattr(self.meta, "discard_history"): self.meta.discard_history()
             self.sync_meta_index() 
             raise
         finally:
             self._in_transaction = False
             self._current_tx = None
+            deferred, self._after_commit = self._after_commit, []
+            self.bump_generation()
+
+        for callback in deferred[0]:
+            callback()
+
+    def after_commit(self, callback: Callable[[], None]):
+        """
+        Runs `callback` once the running transaction commits, or straight away
+        outside one. It is dropped if the scope it was registered in rolls back,
+        so side effects kept outside the store (episodic events, vector entries)
+        never refer to records that were undone.
+        """
+        if self._after_commit:
+            self._after_commit[-1].append(callback)
+        else:
+            callback()
+
+    def _resync_index(self, paths: List[str]):
+        """Brings audit staging for rolled-back paths back in line with the working tree."""
+        if paths:
+            self.audit.stage_paths(paths)
+
+    def _validate_invariants(self):
+        """
+        Write-path invariant check. Uses indexed SQL over the metadata store when
+        supported, falling back to the file-based scan for custom providers.
+        """
+        if hasattr(self.meta, "find_violations"):
+            IntegrityChecker.validate_meta(self.meta)
+        else:
+            IntegrityChecker.validate(self.repo_path, cache=self.parse_cache)
 
     def _enforce_trust(self, event: Optional[MemoryEvent] = None):
         if self.trust_boundary == TrustBoundary.HUMAN_ONLY:
             if not event or (event.source == "agent" and event.kind == "decision"):
                 raise PermissionError("Trust Boundary Violation")
 
-    def save(self, event: MemoryEvent, namespace: Optional[str] = None) -> str:
-        self._enforce_trust(event)
-        
+    @staticmethod
+    def _validate_namespace(namespace: Optional[str]):
         # Security: Validate namespace
         if namespace and namespace != "default":
             import re
             if not re.match(r'^[a-zA-Z0-9_\-]+$', namespace):
                 raise ValueError(f"Invalid namespace format: {namespace}. Only alphanumeric, underscores, and hyphens allowed.")
+
+    def _render(self, event: MemoryEvent, namespace: Optional[str]) -> Tuple[str, str]:
+        """Picks a new file name for an event and serialises it. Returns (relative_path, content)."""
+        effective_namespace = namespace if namespace and namespace != "default" else None
+        suffix = uuid.uuid4().hex[:8]
+        filename = f"{event.kind}_{event.timestamp.strftime('%Y%m%d_%H%M%S_%f')}_{suffix}.md"
+        relative_path = os.path.join(effective_namespace, filename) if effective_namespace else filename
+        if effective_namespace: os.makedirs(os.path.join(self.repo_path, effective_namespace), exist_ok=True)
+
+        data = event.model_dump(mode='json')
+        body = f"# {event.content}\n\nRecorded from source: {event.source}\n"
+        return relative_path, MemoryLoader.stringify(data, body, fmt=self.frontmatter_format)
+
+    @staticmethod
+    def _meta_fields(event: MemoryEvent, relative_path: str, namespace: Optional[str], commit_msg: str) -> Dict[str, Any]:
+        """Metadata row for a newly saved event, in `upsert` keyword form."""
+        ctx = event.context
+        def get_ctx_val(obj, key, default):
+            if isinstance(obj, dict): return obj.get(key, default)
+            return getattr(obj, key, default)
+
+        # Prepare cached content including rationale for searchability
+        cached_content = event.content
+        rationale_val = get_ctx_val(ctx, 'rationale', '')
+        if rationale_val:
+            cached_content = f"{event.content}\n{rationale_val}"
+
+        import json
+        return dict(
+            fid=relative_path,
+            target=get_ctx_val(ctx, 'target', 'unknown'),
+            title=get_ctx_val(ctx, 'title', ''),
+            status=get_ctx_val(ctx, 'status', 'active'),
+            kind=event.kind,
+            timestamp=event.timestamp,
+            namespace=namespace or "default",
+            content=cached_content[:8000],
+            confidence=get_ctx_val(ctx, 'confidence', 1.0),
+            context_json=json.dumps(ctx if isinstance(ctx, dict) else ctx.model_dump(mode='json')),
+            message=commit_msg
+        )
+
+    def save(self, event: MemoryEvent, namespace: Optional[str] = None) -> str:
+        self._ensure_writable()
+        self._enforce_trust(event)
+        self._validate_namespace(namespace)
         
         if not self._in_transaction: self._fs_lock.acquire(exclusive=True)
         
-        effective_namespace = namespace if namespace and namespace != "default" else None
-        
         try:
-            suffix = uuid.uuid4().hex[:8]
-            filename = f"{event.kind}_{event.timestamp.strftime('%Y%m%d_%H%M%S_%f')}_{suffix}.md"
-            relative_path = os.path.join(effective_namespace, filename) if effective_namespace else filename
+            relative_path, content = self._render(event, namespace)
             full_path = os.path.join(self.repo_path, relative_path)
             
             if self._in_transaction and self._current_tx:
                 self._current_tx.stage_file(relative_path)
 
-            if effective_namespace: os.makedirs(os.path.join(self.repo_path, effective_namespace), exist_ok=True)
-            
-            data = event.model_dump(mode='json')
-            body = f"# {event.content}\n\nRecorded from source: {event.source}\n"
-            content = MemoryLoader.stringify(data, body)
-            
-            with open(full_path, "w", encoding="utf-8") as f: 
-                f.write(content)
+            atomic_write(full_path, content)
             
-            try:
-                ctx = event.context
-                def get_ctx_val(obj, key, default):
-                    if isinstance(obj, dict): return obj.get(key, default)
-                    return getattr(obj, key, default)
-
-                # Prepare cached content including rationale for searchability
-                cached_content = event.content
-                ctx_obj = event.context
-                rationale_val = ""
-                if isinstance(ctx_obj, dict):
-                    rationale_val = ctx_obj.get('rationale', '')
-                elif hasattr(ctx_obj, 'rationale'):
-                    rationale_val = getattr(ctx_obj, 'rationale', '')
-                
-                if rationale_val:
-                    cached_content = f"{event.content}\n{rationale_val}"
-
-                import json
-                self.meta.upsert(
-                    fid=relative_path,
-                    target=get_ctx_val(ctx, 'target', 'unknown'),
-                    title=get_ctx_val(ctx, 'title', ''),
-                    status=get_ctx_val(ctx, 'status', 'active'),
-                    kind=event.kind,
-                    timestamp=event.timestamp,
-                    namespace=namespace or "default",
-                    content=cached_content[:8000],
-                    confidence=get_ctx_val(ctx, 'confidence', 1.0),
-                    context_json=json.dumps(ctx if isinstance(ctx, dict) else ctx.model_dump(mode='json'))
-                )
-            except Exception as e:
-                # If we are in a transaction, TransactionManager will handle rollback.
-                # If not, we do manual cleanup.
-                if not self._in_transaction:
-                    if os.path.exists(full_path): os.remove(full_path)
-                raise RuntimeError(f"Metadata Update Failed: {e}")
-
-            if not self._in_transaction:
+            commit_msg = f"Add {event.kind}: {event.content[:50]}"
+            with self._direct_write():
                 try:
-                    IntegrityChecker.validate(self.repo_path)
-                    self.audit.add_artifact(relative_path, content, f"Add {event.kind}: {event.content[:50]}")
+                    self.meta.upsert(**self._meta_fields(event, relative_path, namespace, commit_msg))
                 except Exception as e:
-                    if os.path.exists(full_path): os.remove(full_path)
-                    self.meta.delete(relative_path)
-                    raise RuntimeError(f"Integrity Violation: {e}")
-            else:
-                # In transaction: validation and audit commit happen at the end of the block
-                if isinstance(self.audit, GitAuditProvider):
-                    self.audit.run(["add", "--", relative_path])
+                    # If we are in a transaction, TransactionManager will handle rollback.
+                    # If not, we do manual cleanup.
+                    if not self._in_transaction:
+                        if os.path.exists(full_path): os.remove(full_path)
+                    raise RuntimeError(f"Metadata Update Failed: {e}")
+
+                if not self._in_transaction:
+                    try:
+                        self._validate_invariants()
+                        self.audit.add_artifact(relative_path, content, commit_msg)
+                        self._stamp_history()
+                    except Exception as e:
+                        if os.path.exists(full_path): os.remove(full_path)
+                        self.meta.delete(relative_path, purge_history=True) # Never committed
+                        raise RuntimeError(f"Integrity Violation: {e}")
+                else:
+                    # In transaction: validation and audit commit happen at the end of the block
+                    self.audit.stage_paths([relative_path])
+            self._commit_meta()
             
             return relative_path
         finally:
+            self.bump_generation()
             if not self._in_transaction: self._fs_lock.release()
 
+    def save_many(self, events: List[MemoryEvent], commit_msg: str, namespace: Optional[str] = None) -> List[str]:
+        """
+        Saves a batch of new records as one transaction: files are written,
+        metadata is upserted in bulk, invariants are checked once and the audit
+        provider makes a single commit. Nothing is written if any step fails.
+        """
+        self._ensure_writable()
+        for event in events:
+            self._enforce_trust(event)
+        self._validate_namespace(namespace)
+
+        paths = []
+        with self.transaction(commit_msg=commit_msg):
+            rows = []
+            for event in events:
+                relative_path, content = self._render(event, namespace)
+                self._current_tx.write_file(relative_path, content)
+                rows.append(self._meta_fields(event, relative_path, namespace, f"Add {event.kind}: {event.content[:50]}"))
+                paths.append(relative_path)
+            if hasattr(self.meta, "upsert_many"):
+                self.meta.upsert_many(rows)
+            else:
+                for row in rows:
+                    self.meta.upsert(**row)
+            self.audit.stage_paths(paths)
+        return paths
+
+    @contextmanager
+    def _direct_write(self):
+        """
+        Wraps the metadata side of a write made outside a transaction in a
+        SQLite savepoint, so that a failure also drops its history rows and any
+        queued audit operation. Yields whether a savepoint was taken; inside a
+        transaction the enclosing savepoint already covers the write.
+        """
+        if self._in_transaction or not hasattr(self.meta, "savepoint"):
+            yield False
+            return
+        with self.meta.savepoint():
+            yield True
+
     def _validate_fid(self, fid: str):
         """Prevents Path Traversal attacks."""
         if ".." in fid or fid.startswith("/") or fid.startswith("~"):
             raise ValueError(f"Invalid file identifier: {fid}")
 
+    @staticmethod
+    def _meta_row(filename: str, data: Dict[str, Any], commit_msg: str) -> Dict[str, Any]:
+        """Metadata row for a parsed record, in `upsert` keyword form."""
+        import json
+        ctx = data.get("context", {})
+        ts = data.get("timestamp")
+        if isinstance(ts, str): ts = datetime.fromisoformat(ts)
+
+        # Combine content with rationale for better searchability in metadata cache
+        cached_content = data.get("content", "")
+        rationale = ctx.get("rationale", "")
+        if rationale:
+            cached_content = f"{cached_content}\n{rationale}"
+
+        return dict(
+            fid=filename,
+            target=ctx.get("target"),
+            title=ctx.get("title", ""),
+            status=ctx.get("status"),
+            kind=data.get("kind"),
+            timestamp=ts or datetime.now(),
+            superseded_by=ctx.get("superseded_by"),
+            namespace=ctx.get("namespace", "default"),
+            content=cached_content[:8000],
+            confidence=ctx.get("confidence", 1.0),
+            context_json=json.dumps(ctx),
+            message=commit_msg
+        )
+
+    def _apply_updates(self, filename: str, updates: dict, commit_msg: str) -> Tuple[str, str, Dict[str, Any]]:
+        """Merges `updates` into a record's context. Returns (old content, new content, metadata row)."""
+        with open(os.path.join(self.repo_path, filename), "r", encoding="utf-8") as f: content = f.read()
+        old_data, body = MemoryLoader.parse(content)
+        new_data = copy.deepcopy(old_data)
+        if "context" not in new_data: new_data["context"] = {}
+        new_data["context"].update(updates)
+        TransitionValidator.validate_update(old_data, new_data)
+        new_content = MemoryLoader.stringify(new_data, body, fmt=self.frontmatter_format)
+        return content, new_content, self._meta_row(filename, new_data, commit_msg)
+
     def update_decision(self, filename: str, updates: dict, commit_msg: str):
+        self._ensure_writable()
         self._validate_fid(filename)
         self._enforce_trust()
         if not self._in_transaction: self._fs_lock.acquire(exclusive=True)
@@ -319,85 +636,108 @@ class SemanticStore:
                 self._current_tx.stage_file(filename)
 
             file_path = os.path.join(self.repo_path, filename)
-            with open(file_path, "r", encoding="utf-8") as f: content = f.read()
-            old_data, body = MemoryLoader.parse(content)
-            new_data = yaml.safe_load(yaml.dump(old_data))
-            if "context" not in new_data: new_data["context"] = {}
-            new_data["context"].update(updates)
-            TransitionValidator.validate_update(old_data, new_data)
-            
-            new_content = MemoryLoader.stringify(new_data, body)
-            with open(file_path, "w", encoding="utf-8") as f: f.write(new_content)
-            
-            ctx = new_data.get("context", {})
-            from datetime import datetime
-            ts = new_data.get("timestamp")
-            if isinstance(ts, str): ts = datetime.fromisoformat(ts)
-            
-            # Combine content with rationale for better searchability in metadata cache
-            cached_content_upd = new_data.get("content", "")
-            rationale_upd = ctx.get("rationale", "")
-            if rationale_upd:
-                cached_content_upd = f"{cached_content_upd}\n{rationale_upd}"
+            content, new_content, row = self._apply_updates(filename, updates, commit_msg)
+            atomic_write(file_path, new_content)
 
+            scoped = False
             try:
-                import json
-                self.meta.upsert(
-                    fid=filename,
-                    target=ctx.get("target"),
-                    title=ctx.get("title", ""),
-                    status=ctx.get("status"),
-                    kind=new_data.get("kind"),
-                    timestamp=ts or datetime.now(),
-                    superseded_by=ctx.get("superseded_by"),
-                    namespace=ctx.get("namespace", "default"),
-                    content=cached_content_upd[:8000],
-                    confidence=ctx.get("confidence", 1.0),
-                    context_json=json.dumps(ctx)
-                )
-            except Exception as e:
-                if not self._in_transaction:
-                    with open(file_path, "w", encoding="utf-8") as f: f.write(content)
-                raise RuntimeError(f"Metadata Update Failed: {e}")
-
+                with self._direct_write() as scoped:
+                    try:
+                        self.meta.upsert(**row)
+                    except Exception as e:
+                        raise RuntimeError(f"Metadata Update Failed: {e}")
 
-            if not self._in_transaction:
-                try:
-                    IntegrityChecker.validate(self.repo_path)
-                    self.audit.update_artifact(filename, new_content, commit_msg)
-                except Exception as e:
+                    if not self._in_transaction:
+                        try:
+                            self._validate_invariants()
+                            self.audit.update_artifact(filename, new_content, commit_msg)
+                            self._stamp_history()
+                        except Exception as e:
+                            raise RuntimeError(f"Integrity Violation: {e}")
+                    else:
+                        self.audit.stage_paths([filename])
+            except Exception:
+                if not self._in_transaction:
                     with open(file_path, "w", encoding="utf-8") as f: f.write(content)
-                    self.sync_meta_index()
-                    raise RuntimeError(f"Integrity Violation: {e}")
-            else:
-                if isinstance(self.audit, GitAuditProvider):
-                    self.audit.run(["add", "--", filename])
+                    if not scoped:
+                        # No savepoint undid the metadata: realign it by hand
+                        if hasattr(self.meta, "discard_history"): self.meta.discard_history()
+                        self.sync_meta_index()
+                raise
+            self._commit_meta()
         finally:
+            self.bump_generation()
             if not self._in_transaction: self._fs_lock.release()
 
+    def update_many(self, updates: Dict[str, Dict[str, Any]], commit_msg: str, purge: Iterable[str] = (),
+                    messages: Optional[Dict[str, str]] = None) -> List[str]:
+        """
+        Applies context updates to many records, and hard-deletes the `purge`
+        records, as one transaction: invariants are checked once and the audit
+        provider makes a single commit. Nothing is written if any step fails.
+        `messages` optionally gives a per-record history message in place of
+        `commit_msg`. Returns the affected paths.
+        """
+        self._ensure_writable()
+        self._enforce_trust()
+        purge = list(purge)
+        for fid in list(updates) + purge:
+            self._validate_fid(fid)
+        if not updates and not purge:
+            return []
+
+        paths = []
+        with self.transaction(commit_msg=commit_msg):
+            for fid, changes in updates.items():
+                _, new_content, row = self._apply_updates(fid, changes, (messages or {}).get(fid, commit_msg))
+                self._current_tx.write_file(fid, new_content)
+                self.meta.upsert(**row)
+                paths.append(fid)
+            for fid in purge:
+                self._current_tx.remove_file(fid)
+                self.parse_cache.invalidate(fid)
+                self.meta.delete(fid, purge_history=True)
+                paths.append(fid)
+            if paths:
+                self.audit.stage_paths(paths)
+        return paths
+
     def list_decisions(self) -> List[str]:
-        self._fs_lock.acquire(exclusive=False)
+        # The running transaction already holds the exclusive lock; read-only
+        # opens rely on SQLite's snapshot and never touch the lock file
+        shared = not (self._in_transaction or self.read_only)
+        if shared: self._fs_lock.acquire(exclusive=False)
         try:
             all_meta = self.meta.list_all()
             return [m['fid'] for m in all_meta]
-        finally: self._fs_lock.release()
+        finally:
+            if shared: self._fs_lock.release()
 
     def purge_memory(self, fid: str):
         """Hard delete for GDPR compliance."""
+        self._ensure_writable()
         self._fs_lock.acquire(exclusive=True)
         try:
             full_path = os.path.join(self.repo_path, fid)
             if os.path.exists(full_path): os.remove(full_path)
+            self.parse_cache.invalidate(fid)
             self.audit.purge_artifact(fid)
-            self.meta.delete(fid)
-        finally: self._fs_lock.release()
+            self.meta.delete(fid, purge_history=True)
+            self._commit_meta()
+        finally:
+            self.bump_generation()
+            self._fs_lock.release()
 
     def get_head_hash(self) -> Optional[str]:
         return self.audit.get_head_hash()
 
     def list_active_conflicts(self, target: str, namespace: str = "default") -> List[str]:
-        self._fs_lock.acquire(exclusive=False)
+        # The running transaction already holds the exclusive lock; read-only
+        # opens rely on SQLite's snapshot and never touch the lock file
+        shared = not (self._in_transaction or self.read_only)
+        if shared: self._fs_lock.acquire(exclusive=False)
         try:
             all_meta = self.meta.list_all()
             return [m['fid'] for m in all_meta if m.get('target') == target and m.get('status') == 'active' and m.get('kind') == 'decision' and m.get('namespace', 'default') == namespace]
-        finally: self._fs_lock.release()
+        finally:
+            if shared: self._fs_lock.release()
@@ -0,0 +1,251 @@
+import os
+import time
+import threading
+import logging
+import numpy as np
+from collections import OrderedDict
+from typing import Dict, Any, Tuple, Optional, List
+from prometheus_client import Counter, Gauge
+
+from .loader import MemoryLoader
+
+logger = logging.getLogger("ledgermind-core.parse-cache")
+
+PARSE_CACHE_REQUESTS = Counter("agent_memory_parse_cache_requests_total", "Parse cache lookups", ["result"])
+PARSE_CACHE_EVICTIONS = Counter("agent_memory_parse_cache_evictions_total", "Parse cache evictions due to byte budget")
+PARSE_CACHE_BYTES = Gauge("agent_memory_parse_cache_bytes", "Approximate bytes held by parse caches")
+
+class ParseCache:
+    """
+    Per-repository LRU of parsed frontmatter, bounded by an approximate byte budget.
+    Entries are validated against (mtime_ns, size) on every lookup, so external
+    edits and deletions are never served stale.
+
+    Returned dicts are shared between callers and must be treated as read-only.
+    """
+    def __init__(self, repo_path: str, max_bytes: int = 16 * 1024 * 1024):
+        self.repo_path = repo_path
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[int, int, Dict[str, Any], str, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        # Hash of (filename, mtime) pairs from the last successful full validation
+        self.state_hash: Optional[int] = None
+
+    @staticmethod
+    def _cost(content: str) -> int:
+        # Source text plus its parsed copy
+        return 2 * len(content)
+
+    def get(self, relative_path: str) -> Tuple[Dict[str, Any], str]:
+        """
+        Returns (metadata_dict, body_string) for a file, parsing it on a miss.
+        Raises OSError if the file cannot be read.
+        """
+        full_path = os.path.join(self.repo_path, relative_path)
+        try:
+            st = os.stat(full_path)
+        except OSError:
+            self.invalidate(relative_path)
+            raise
+
+        with self._lock:
+            entry = self._entries.get(relative_path)
+            if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+                self._entries.move_to_end(relative_path)
+                self.hits += 1
+                PARSE_CACHE_REQUESTS.labels(result="hit").inc()
+                return entry[2], entry[3]
+            self.misses += 1
+
+        PARSE_CACHE_REQUESTS.labels(result="miss").inc()
+        with open(full_path, 'r', encoding='utf-8') as stream:
+            content = stream.read()
+        data, body = MemoryLoader.parse(content)
+        self._put(relative_path, st.st_mtime_ns, st.st_size, data, body, self._cost(content))
+        return data, body
+
+    def get_many(self, relative_paths: List[str], workers: Optional[int] = None) -> Dict[str, Tuple[Dict[str, Any], str]]:
+        """
+        Bulk lookup used by full scans. Misses are parsed in parallel via
+        MemoryLoader.parse_many; unreadable files are omitted from the result.
+        """
+        results: Dict[str, Tuple[Dict[str, Any], str]] = {}
+        missing = []
+        with self._lock:
+            for rel_path in relative_paths:
+                entry = self._entries.get(rel_path)
+                if entry:
+                    try:
+                        st = os.stat(os.path.join(self.repo_path, rel_path))
+                    except OSError:
+                        continue
+                    if entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+                        self._entries.move_to_end(rel_path)
+                        results[rel_path] = (entry[2], entry[3])
+                        continue
+                missing.append(rel_path)
+            self.hits += len(results)
+            self.misses += len(missing)
+        PARSE_CACHE_REQUESTS.labels(result="hit").inc(len(results))
+        PARSE_CACHE_REQUESTS.labels(result="miss").inc(len(missing))
+
+        for rel_path, mtime_ns, size, data, body, source_len in MemoryLoader.parse_many(self.repo_path, missing, workers=workers):
+            self._put(rel_path, mtime_ns, size, data, body, 2 * source_len)
+            results[rel_path] = (data, body)
+        return results
+
+    def _put(self, relative_path: str, mtime_ns: int, size: int, data: Dict[str, Any], body: str, cost: int):
+        if cost > self.max_bytes:
+            self.invalidate(relative_path)
+            return
+        with self._lock:
+            old = self._entries.pop(relative_path, None)
+            if old:
+                self._adjust(-old[4])
+            self._entries[relative_path] = (mtime_ns, size, data, body, cost)
+            self._adjust(cost)
+            while self._bytes > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._adjust(-evicted[4])
+                PARSE_CACHE_EVICTIONS.inc()
+
+    def _adjust(self, delta: int):
+        self._bytes += delta
+        PARSE_CACHE_BYTES.inc(delta)
+
+    def invalidate(self, relative_path: str):
+        with self._lock:
+            old = self._entries.pop(relative_path, None)
+            if old:
+                self._adjust(-old[4])
+            self.state_hash = None
+
+    def clear(self):
+        with self._lock:
+            self._adjust(-self._bytes)
+            self._entries.clear()
+            self.state_hash = None
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0
+        }
+
+SEARCH_CACHE_REQUESTS = Counter("agent_memory_search_cache_requests_total", "Search result cache lookups", ["result"])
+
+class SearchCache:
+    """
+    LRU of search results bounded by entry count and TTL. Each entry records
+    the store generation it was computed at and is discarded once the store
+    has moved on, so results never outlive a write.
+
+    Returned lists are copies; the result dicts inside them are shared.
+    """
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 60.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple, Tuple[Any, float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple, generation: Any) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == generation and entry[1] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                SEARCH_CACHE_REQUESTS.labels(result="hit").inc()
+                return list(entry[2])
+            if entry:
+                del self._entries[key]
+            self.misses += 1
+        SEARCH_CACHE_REQUESTS.labels(result="miss").inc()
+        return None
+
+    def put(self, key: Tuple, generation: Any, results: List[Dict[str, Any]]):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (generation, time.monotonic() + self.ttl_seconds, list(results))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def record_bypass(self):
+        SEARCH_CACHE_REQUESTS.labels(result="bypass").inc()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0
+        }
+
+PROMPT_CACHE_REQUESTS = Counter("agent_memory_prompt_cache_requests_total", "Semantic prompt cache lookups", ["result"])
+
+class PromptCache:
+    """
+    Semantic cache of recent prompt embeddings and the memories retrieved for
+    them. A lookup hits when a cached prompt with the same key lies within
+    `threshold` cosine similarity and was retrieved at the current store
+    generation; entries from older generations are dropped. Embeddings must
+    be unit-norm.
+    """
+    def __init__(self, max_entries: int = 64, threshold: float = 0.95):
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self._entries: List[Tuple[np.ndarray, Tuple, Any, List[Dict[str, Any]]]] = []
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, embedding: np.ndarray, key: Tuple, generation: Any) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            self._entries = [e for e in self._entries if e[2] == generation]
+            candidates = [i for i, e in enumerate(self._entries) if e[1] == key]
+            if candidates:
+                similarities = np.stack([self._entries[i][0] for i in candidates]) @ embedding
+                best = int(np.argmax(similarities))
+                if similarities[best] >= self.threshold:
+                    entry = self._entries.pop(candidates[best])
+                    self._entries.append(entry) # Most recently used last
+                    self.hits += 1
+                    PROMPT_CACHE_REQUESTS.labels(result="hit").inc()
+                    return list(entry[3])
+            self.misses += 1
+        PROMPT_CACHE_REQUESTS.labels(result="miss").inc()
+        return None
+
+    def put(self, embedding: np.ndarray, key: Tuple, generation: Any, memories: List[Dict[str, Any]]):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries.append((embedding, key, generation, list(memories)))
+            del self._entries[:-self.max_entries]
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0
+        }
@@ -1,6 +1,6 @@
-from typing import List, Dict, Any, Set
+from typing import List, Dict, Any, Set, Optional
 import os
-import yaml
+from .cache import ParseCache
 
 class IntegrityViolation(Exception):
     """
@@ -17,8 +17,6 @@ class IntegrityChecker:
     """
     Validator for maintaining architectural invariants across the semantic store.
     """
-    _state_cache: Dict[str, int] = {} # repo_path -> state_hash
-    _file_data_cache: Dict[str, Any] = {} # full_path -> (mtime, data)
 
     @staticmethod
     def _get_state_hash(repo_path: str) -> int:
@@ -44,7 +42,7 @@ class IntegrityChecker:
         return hash(tuple(state))
 
     @staticmethod
-    def validate(repo_path: str, force: bool = False):
+    def validate(repo_path: str, force: bool = False, cache: Optional[ParseCache] = None, workers: Optional[int] = None):
         """
         Scans the repository and ensures all integrity invariants are met.
         
@@ -53,10 +51,14 @@ class IntegrityChecker:
         - I3: Bidirectional supersede links.
         - I5: Acyclic evolution graph.
         
+        Parsed files and the last validated state are kept in `cache` (owned by
+        the SemanticStore); without one, every call is a full scan. Cache misses
+        are parsed on a process pool for large repositories (see MemoryLoader.parse_many).
+
         Raises IntegrityViolation if any invariant is broken.
         """
         current_hash = IntegrityChecker._get_state_hash(repo_path)
-        if not force and IntegrityChecker._state_cache.get(repo_path) == current_hash:
+        if not force and cache is not None and cache.state_hash == current_hash:
             return
 
         all_files = []
@@ -68,29 +70,16 @@ class IntegrityChecker:
                     all_files.append(rel_path)
         
         decisions = {}
-        
-        from .loader import MemoryLoader
+        parser = cache or ParseCache(repo_path, max_bytes=0)
+        parsed = parser.get_many(all_files, workers=workers)
         
         for f in all_files:
-            file_path = os.path.join(repo_path, f)
-            try:
-                mtime = os.path.getmtime(file_path)
-                cached_mtime, cached_data = IntegrityChecker._file_data_cache.get(file_path, (0, None))
-                
-                if cached_data and cached_mtime == mtime:
-                    data = cached_data
-                else:
-                    with open(file_path, 'r', encoding='utf-8') as stream:
-                        content = stream.read()
-                        data, _ = MemoryLoader.parse(content)
-                        if not data:
-                            raise IntegrityViolation(f"Corrupted or empty frontmatter", fid=f)
-                        IntegrityChecker._file_data_cache[file_path] = (mtime, data)
-                
-                decisions[f] = data
-            except (OSError, IntegrityViolation) as e:
-                if isinstance(e, IntegrityViolation): raise
+            if f not in parsed:
                 continue
+            data, _ = parsed[f]
+            if not data:
+                raise IntegrityViolation(f"Corrupted or empty frontmatter", fid=f)
+            decisions[f] = data
 
         # I4: Single active decision per target
         active_targets: Dict[str, str] = {}
@@ -147,7 +136,41 @@ class IntegrityChecker:
         IntegrityChecker._check_cycles(decisions)
         
         # Update cache on success
-        IntegrityChecker._state_cache[repo_path] = current_hash
+        if cache is not None:
+            cache.state_hash = current_hash
+
+    @staticmethod
+    def validate_meta(meta: Any):
+        """
+        Fast-path invariant check evaluated as indexed SQL over the metadata store.
+        Cost is independent of the number of files on disk; the file-based
+        `validate` remains the source of truth and is cross-checked in maintenance.
+
+        Raises IntegrityViolation if any invariant is broken.
+        """
+        violations = meta.find_violations(limit=1)
+        if not violations:
+            return
+
+        v = violations[0]
+        fid, details = v["fid"], v["details"]
+        if v["invariant"] == "I4":
+            raise IntegrityViolation(
+                f"I4 Violation: Multiple active decisions for target '{details['target']}'",
+                fid=fid,
+                details={"conflicting_file": details["conflicting_file"]}
+            )
+        if v["invariant"] == "I3-dangling":
+            raise IntegrityViolation(f"I3 Violation: Dangling reference. Superseded by non-existent file.", fid=fid, details=details)
+        if v["invariant"] == "I3":
+            raise IntegrityViolation(
+                f"I3 Violation: Broken backlink. {details['target']} does not acknowledge via 'supersedes'.",
+                fid=fid,
+                details=details
+            )
+        if v["invariant"] == "REF":
+            raise IntegrityViolation(f"Reference Violation: Claims to supersede non-existent file.", fid=fid, details=details)
+        raise IntegrityViolation(f"I5 Violation: Cycle detected in knowledge evolution.", fid=fid)
 
     @staticmethod
     def _check_cycles(decisions: Dict[str, Any]):
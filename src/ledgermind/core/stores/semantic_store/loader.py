@@ -1,11 +1,88 @@
+import os
+import json
 import yaml
 import re
-from typing import Dict, Any, Tuple
+import logging
+from enum import Enum
+from typing import Dict, Any, Tuple, List, Optional
+
+logger = logging.getLogger("ledgermind-core.loader")
+
+# Prefer the libyaml bindings when PyYAML was built with them
+_BaseLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_BaseDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+class _FrontmatterDumper(_BaseDumper):
+    """
+    Safe dumper that writes str-based enums (e.g. ProposalStatus) as plain values
+    and tuples and sets as lists, which the safe representer would reject.
+    """
+    pass
+
+def _as_list(values: Any) -> List[Any]:
+    """Tuples keep their order; sets are sorted where possible so output is stable."""
+    if isinstance(values, (set, frozenset)):
+        try:
+            return sorted(values)
+        except TypeError:
+            return list(values)
+    return list(values)
+
+_FrontmatterDumper.add_multi_representer(Enum, lambda dumper, value: dumper.represent_data(value.value))
+for _sequence in (tuple, set, frozenset):
+    _FrontmatterDumper.add_representer(_sequence, lambda dumper, value: dumper.represent_list(_as_list(value)))
+
+def _json_default(value: Any) -> Any:
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, frozenset)):
+        return _as_list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def _parse_chunk(repo_path: str, rel_paths: List[str]) -> List[Tuple[str, int, int, Dict[str, Any], str, int]]:
+    """
+    Process-pool work unit: stats, reads and parses a chunk of files.
+    Returns (rel_path, mtime_ns, size, data, body, source_len); unreadable files are skipped.
+    """
+    results = []
+    for rel_path in rel_paths:
+        full_path = os.path.join(repo_path, rel_path)
+        try:
+            st = os.stat(full_path)
+            with open(full_path, 'r', encoding='utf-8') as stream:
+                content = stream.read()
+        except (OSError, UnicodeDecodeError):
+            continue
+        data, body = MemoryLoader.parse(content)
+        results.append((rel_path, st.st_mtime_ns, st.st_size, data, body, len(content)))
+    return results
 
 class MemoryLoader:
     # Pattern to match YAML frontmatter between --- and ---
     FRONTMATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*(.*)', re.DOTALL | re.MULTILINE)
 
+    FORMAT_YAML = "yaml"
+    FORMAT_JSON = "json"
+
+    # Below this many files the process pool costs more than it saves
+    PARALLEL_MIN_FILES = 512
+    CHUNK_SIZE = 128
+
+    @staticmethod
+    def load_frontmatter(text: str) -> Any:
+        """
+        Decodes a frontmatter block. JSON frontmatter (still valid YAML) takes the
+        json.loads fast path; everything else goes through the libyaml safe loader.
+        """
+        if text.lstrip().startswith("{"):
+            try:
+                return json.loads(text)
+            except ValueError:
+                pass
+        return yaml.load(text, Loader=_BaseLoader)  # nosec B506 - safe loader
+
     @staticmethod
     def parse(content: str) -> Tuple[Dict[str, Any], str]:
         """
@@ -16,7 +93,7 @@ class MemoryLoader:
         if not match:
             # Try to parse as pure YAML (backward compatibility)
             try:
-                data = yaml.safe_load(content)
+                data = MemoryLoader.load_frontmatter(content)
                 if isinstance(data, dict):
                     return data, ""
             except yaml.YAMLError:
@@ -27,15 +104,16 @@ class MemoryLoader:
         body = match.group(2).strip()
         
         try:
-            data = yaml.safe_load(front_yaml)
+            data = MemoryLoader.load_frontmatter(front_yaml)
             return data if isinstance(data, dict) else {}, body
         except yaml.YAMLError:
             return {}, body
 
     @staticmethod
-    def stringify(data: Dict[str, Any], body: str = "") -> str:
+    def stringify(data: Dict[str, Any], body: str = "", fmt: str = FORMAT_YAML) -> str:
         """
         Serializes metadata and body into a single Markdown string with frontmatter.
+        `fmt="json"` writes indented JSON frontmatter, which is valid YAML but parses much faster.
         """
         # Ensure timestamp is ISO string for consistency
         if 'timestamp' in data and not isinstance(data['timestamp'], str):
@@ -44,5 +122,37 @@ class MemoryLoader:
             except AttributeError:
                 pass
                 
-        yaml_str = yaml.dump(data, allow_unicode=True, sort_keys=False).strip()
-        return f"---\n{yaml_str}\n---\n\n{body}"
+        if fmt == MemoryLoader.FORMAT_JSON:
+            front = json.dumps(data, indent=2, ensure_ascii=False, default=_json_default)
+        else:
+            front = yaml.dump(data, Dumper=_FrontmatterDumper, allow_unicode=True, sort_keys=False).strip()
+        return f"---\n{front}\n---\n\n{body}"
+
+    @staticmethod
+    def parse_many(repo_path: str, rel_paths: List[str], workers: Optional[int] = None) -> List[Tuple[str, int, int, Dict[str, Any], str, int]]:
+        """
+        Parses many files, fanning chunked work units out to a process pool for large batches.
+        Workers are started with forkserver (spawn where unavailable), never fork.
+        `workers=None` picks a pool size automatically; 1 forces serial parsing.
+        Returns the same tuples as `_parse_chunk`, in input order.
+        """
+        if workers is None:
+            workers = min(os.cpu_count() or 1, 8) if len(rel_paths) >= MemoryLoader.PARALLEL_MIN_FILES else 1
+        if workers <= 1 or len(rel_paths) <= MemoryLoader.CHUNK_SIZE:
+            return _parse_chunk(repo_path, rel_paths)
+
+        chunks = [rel_paths[i:i + MemoryLoader.CHUNK_SIZE] for i in range(0, len(rel_paths), MemoryLoader.CHUNK_SIZE)]
+        try:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            # The caller may already run threads (search pool, group-commit flusher,
+            # scheduler); forking a multithreaded process can deadlock the child
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(method)) as pool:
+                results = []
+                for part in pool.map(_parse_chunk, [repo_path] * len(chunks), chunks):
+                    results.extend(part)
+                return results
+        except Exception as e:
+            logger.warning(f"Parallel parsing failed ({e}). Falling back to serial parsing.")
+            return _parse_chunk(repo_path, rel_paths)
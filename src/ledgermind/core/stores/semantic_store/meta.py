@@ -1,9 +1,16 @@
+import os
 import sqlite3
+import json
+import time
 import logging
+import threading
+import numpy as np
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+from contextlib import contextmanager
 
 import re
+from ledgermind.core.reasoning.decay import INVALID_EPOCH
 
 logger = logging.getLogger(__name__)
 
@@ -12,10 +19,27 @@ class SemanticMetaStore:
     Transactional metadata index for the Semantic Store using SQLite.
     Provides DB-level guarantees for invariants.
     """
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, read_only: bool = False):
+        """
+        With `read_only`, the database is opened with `mode=ro` and the schema
+        setup is skipped; hit counters are not updated and other writes fail.
+        """
         self.db_path = db_path
-        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30.0)
-        self._init_db()
+        self.read_only = read_only
+        self._readers = threading.local()
+        self._reader_conns: List[sqlite3.Connection] = []
+        self.history_author = os.environ.get("GIT_AUTHOR_NAME", "ledgermind-core")
+        self._unstamped_history: List[int] = []
+        self._conn = self._connect()
+        if not read_only:
+            self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.read_only:
+            from urllib.request import pathname2url
+            uri = f"file:{pathname2url(os.path.abspath(self.db_path))}?mode=ro"
+            return sqlite3.connect(uri, uri=True, check_same_thread=False, timeout=30.0)
+        return sqlite3.connect(self.db_path, check_same_thread=False, timeout=30.0)
 
     def _init_db(self):
         self._conn.execute("PRAGMA journal_mode=WAL")
@@ -54,11 +78,17 @@ class SemanticMetaStore:
                     self._conn.execute(f"ALTER TABLE semantic_meta ADD COLUMN {col} {definition}")
                 except sqlite3.OperationalError: pass
 
-            # I4 Violation Prevention: Only one 'active' decision per target per namespace
+            # I4 Violation Prevention: Only one 'active' decision per target per namespace.
+            # Target-less records are exempt, as in IntegrityChecker.
+            row = self._conn.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'index' AND name = 'idx_active_target_ns'"
+            ).fetchone()
+            if row and "target != ''" not in row[0]:
+                self._conn.execute("DROP INDEX idx_active_target_ns")
             try:
                 self._conn.execute("""
                     CREATE UNIQUE INDEX IF NOT EXISTS idx_active_target_ns 
-                    ON semantic_meta(target, namespace) WHERE status = 'active' AND kind = 'decision'
+                    ON semantic_meta(target, namespace) WHERE status = 'active' AND kind = 'decision' AND target != ''
                 """)
             except sqlite3.OperationalError:
                 pass
@@ -66,19 +96,79 @@ class SemanticMetaStore:
             self._conn.execute("CREATE INDEX IF NOT EXISTS idx_status ON semantic_meta(status)")
             self._conn.execute("CREATE INDEX IF NOT EXISTS idx_target ON semantic_meta(target)")
             self._conn.execute("CREATE INDEX IF NOT EXISTS idx_namespace ON semantic_meta(namespace)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_superseded_by ON semantic_meta(superseded_by)")
+
+            # Supersede edges (fid supersedes old_fid), mirrored from context_json
+            # so that I3/I5 can be checked with indexed queries.
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS semantic_supersedes (
+                    fid TEXT NOT NULL,
+                    old_fid TEXT NOT NULL,
+                    PRIMARY KEY (fid, old_fid)
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_supersedes_old ON semantic_supersedes(old_fid)")
+            edge_count = self._conn.execute("SELECT count(*) FROM semantic_supersedes").fetchone()[0]
+            if edge_count == 0:
+                self._conn.execute("""
+                    INSERT OR IGNORE INTO semantic_supersedes (fid, old_fid)
+                    SELECT m.fid, j.value FROM semantic_meta m, json_each(m.context_json, '$.supersedes') j
+                    WHERE j.type = 'text'
+                """)
+
+            # Per-version history of every decision, written alongside each upsert.
+            # Git remains the authoritative audit; see rebuild_history.
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS semantic_history (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    fid TEXT NOT NULL,
+                    target TEXT,
+                    status TEXT,
+                    commit_hash TEXT,
+                    audit_id INTEGER,
+                    author TEXT,
+                    message TEXT NOT NULL DEFAULT '',
+                    timestamp TEXT NOT NULL,
+                    changed_fields TEXT NOT NULL DEFAULT '[]',
+                    snapshot TEXT NOT NULL DEFAULT '{}'
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_history_fid ON semantic_history(fid, id)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_history_target ON semantic_history(target, id)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_history_fid_ts ON semantic_history(fid, timestamp)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_history_unattributed ON semantic_history(id) WHERE commit_hash IS NULL")
+
+            # Durable queue of audit operations for the asynchronous committer.
+            # Rows are written on the same connection as the metadata they describe.
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS audit_queue (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    op TEXT NOT NULL,
+                    paths TEXT NOT NULL DEFAULT '[]',
+                    message TEXT NOT NULL DEFAULT '',
+                    content TEXT,
+                    enqueued_at REAL NOT NULL
+                )
+            """)
 
             # FTS5 Full Text Search
             try:
-                # Use External Content Table pattern for reliable synchronization
-                # Drop triggers and table to ensure clean schema update
+                # Use External Content Table pattern for reliable synchronization.
+                # The index is kept across opens; stores from versions that recreated
+                # it on every open (without repopulating it) are rebuilt once.
+                self._conn.execute("CREATE TABLE IF NOT EXISTS sys_config (key TEXT PRIMARY KEY, value TEXT)")
+                fts_ready = self._conn.execute(
+                    "SELECT value FROM sys_config WHERE key = 'fts_persistent'"
+                ).fetchone() is not None
+                if not fts_ready:
+                    self._conn.execute("DROP TABLE IF EXISTS semantic_fts")
                 self._conn.execute("DROP TRIGGER IF EXISTS semantic_ai")
                 self._conn.execute("DROP TRIGGER IF EXISTS semantic_ad")
                 self._conn.execute("DROP TRIGGER IF EXISTS semantic_au")
-                self._conn.execute("DROP TABLE IF EXISTS semantic_fts")
                 
                 # Create FTS5 table linked to semantic_meta
                 self._conn.execute("""
-                    CREATE VIRTUAL TABLE semantic_fts USING fts5(
+                    CREATE VIRTUAL TABLE IF NOT EXISTS semantic_fts USING fts5(
                         fid, title, target, content, 
                         content='semantic_meta', 
                         content_rowid='rowid'
@@ -103,24 +193,26 @@ class SemanticMetaStore:
                     END;
                 """)
                 
-                # Check if index needs rebuild (e.g. empty)
-                # For External Content tables, querying count(*) might query the backing table?
-                # Let's just run rebuild if the FTS is empty but meta is not.
-                # Actually, 'rebuild' is safe to run.
-                fts_count = self._conn.execute("SELECT count(*) FROM semantic_fts").fetchone()[0]
-                meta_count = self._conn.execute("SELECT count(*) FROM semantic_meta").fetchone()[0]
-                
-                if fts_count == 0 and meta_count > 0:
+                # count(*) on an external content table counts the backing table,
+                # so emptiness of the index itself cannot be probed cheaply
+                if not fts_ready:
                     logger.info("Rebuilding FTS index...")
                     self._conn.execute("INSERT INTO semantic_fts(semantic_fts) VALUES('rebuild')")
+                    self._conn.execute("INSERT OR REPLACE INTO sys_config (key, value) VALUES ('fts_persistent', '1')")
                     
             except sqlite3.OperationalError as e:
                 logger.warning(f"FTS5 setup failed: {e}. Keyword search will be limited.")
 
     def upsert(self, fid: str, target: str, status: str, kind: str, timestamp: datetime, 
                title: str = "", superseded_by: Optional[str] = None, namespace: str = "default",
-               content: str = "", confidence: float = 1.0, context_json: str = "{}"):
-        """Atomic upsert of decision metadata with content caching."""
+               content: str = "", confidence: float = 1.0, context_json: str = "{}",
+               message: Optional[str] = None):
+        """
+        Atomic upsert of decision metadata with content caching.
+        With a `message`, a history row is recorded if the context changed.
+        """
+        if message is not None:
+            self._record_history(fid, target, status, message, context_json)
         self._conn.execute("""
             INSERT INTO semantic_meta (fid, target, title, status, kind, timestamp, superseded_by, namespace, content, confidence, context_json)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
@@ -133,6 +225,157 @@ class SemanticMetaStore:
                 confidence=excluded.confidence,
                 context_json=excluded.context_json
         """, (fid, target, title, status, kind, timestamp.isoformat(), superseded_by, namespace, content, confidence, context_json))
+        self._conn.execute("DELETE FROM semantic_supersedes WHERE fid = ?", (fid,))
+        self._conn.execute("""
+            INSERT OR IGNORE INTO semantic_supersedes (fid, old_fid)
+            SELECT ?, value FROM json_each(?, '$.supersedes') WHERE type = 'text'
+        """, (fid, context_json))
+
+    def upsert_many(self, rows: List[Dict[str, Any]]):
+        """
+        Bulk form of `upsert` for records new to the store, using executemany.
+        Each row takes `upsert`'s keyword arguments; rows with a `message` get
+        an initial history row.
+        """
+        rows = [{"title": "", "superseded_by": None, "namespace": "default", "content": "",
+                 "confidence": 1.0, "context_json": "{}", "message": None, **r,
+                 "timestamp": r["timestamp"].isoformat()} for r in rows]
+        self._conn.executemany("""
+            INSERT INTO semantic_meta (fid, target, title, status, kind, timestamp, superseded_by, namespace, content, confidence, context_json)
+            VALUES (:fid, :target, :title, :status, :kind, :timestamp, :superseded_by, :namespace, :content, :confidence, :context_json)
+            ON CONFLICT(fid) DO UPDATE SET
+                title=excluded.title,
+                status=excluded.status,
+                superseded_by=excluded.superseded_by,
+                namespace=excluded.namespace,
+                content=excluded.content,
+                confidence=excluded.confidence,
+                context_json=excluded.context_json
+        """, rows)
+        self._conn.executemany("DELETE FROM semantic_supersedes WHERE fid = :fid", rows)
+        self._conn.executemany("""
+            INSERT OR IGNORE INTO semantic_supersedes (fid, old_fid)
+            SELECT :fid, value FROM json_each(:context_json, '$.supersedes') WHERE type = 'text'
+        """, rows)
+
+        history = [r for r in rows if r["message"] is not None]
+        if history:
+            last_id = self._conn.execute("SELECT COALESCE(MAX(id), 0) FROM semantic_history").fetchone()[0]
+            now = datetime.now().isoformat()
+            self._conn.executemany("""
+                INSERT INTO semantic_history (fid, target, status, author, message, timestamp, changed_fields, snapshot)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, [(r["fid"], r["target"], r["status"], self.history_author, r["message"], now,
+                   json.dumps(sorted(json.loads(r["context_json"] or "{}"))), r["context_json"] or "{}") for r in history])
+            self._unstamped_history.extend(
+                row[0] for row in self._conn.execute("SELECT id FROM semantic_history WHERE id > ? ORDER BY id", (last_id,))
+            )
+
+    @staticmethod
+    def _changed_fields(old: Dict[str, Any], new: Dict[str, Any]) -> List[str]:
+        return sorted(k for k in set(old) | set(new) if old.get(k) != new.get(k))
+
+    def _record_history(self, fid: str, target: str, status: str, message: str, context_json: str,
+                        timestamp: Optional[str] = None, commit_hash: Optional[str] = None, author: Optional[str] = None):
+        row = self._conn.execute(
+            "SELECT snapshot FROM semantic_history WHERE fid = ? ORDER BY id DESC LIMIT 1", (fid,)
+        ).fetchone()
+        new_ctx = json.loads(context_json or "{}")
+        if row is None:
+            changed = sorted(new_ctx)
+        else:
+            changed = self._changed_fields(json.loads(row[0]), new_ctx)
+            if not changed:
+                return
+        cursor = self._conn.execute("""
+            INSERT INTO semantic_history (fid, target, status, commit_hash, author, message, timestamp, changed_fields, snapshot)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (fid, target, status, commit_hash, author or self.history_author, message,
+              timestamp or datetime.now().isoformat(), json.dumps(changed), context_json or "{}"))
+        if commit_hash is None:
+            self._unstamped_history.append(cursor.lastrowid)
+
+    def stamp_history(self, commit_hash: Optional[str] = None, audit_id: Optional[int] = None):
+        """
+        Attaches the audit commit hash, or the id of the queued audit operation,
+        to history rows written since the last stamp. Without either, the rows
+        are left unattributed.
+        """
+        ids, self._unstamped_history = self._unstamped_history, []
+        if ids and (commit_hash or audit_id):
+            self._conn.execute(
+                f"UPDATE semantic_history SET commit_hash = ?, audit_id = ? WHERE id IN ({','.join('?' * len(ids))})",
+                [commit_hash, audit_id] + ids
+            )
+
+    def resolve_history(self, audit_id: int, commit_hash: Optional[str], conn: Optional[sqlite3.Connection] = None):
+        """Replaces a queued audit id with the commit hash it was applied as."""
+        conn = conn or self._conn
+        conn.execute("UPDATE semantic_history SET commit_hash = ? WHERE audit_id = ?", (commit_hash, audit_id))
+
+    def resolve_pending_history(self, commit_hash: Optional[str]):
+        """
+        Attributes history rows that have neither a hash nor a queued audit id,
+        i.e. rows written while their group commit was pending, to `commit_hash`.
+        Called by the group-commit flusher, which holds the FS lock, so no
+        write is half-way through on this connection.
+        """
+        if not commit_hash:
+            return
+        in_transaction = self._conn.in_transaction
+        self._conn.execute(
+            "UPDATE semantic_history SET commit_hash = ? WHERE commit_hash IS NULL AND audit_id IS NULL",
+            (commit_hash,)
+        )
+        if not in_transaction:
+            self._conn.commit()
+
+    def discard_history(self):
+        """Drops history rows written since the last stamp (used when a direct write is undone)."""
+        ids, self._unstamped_history = self._unstamped_history, []
+        if ids:
+            self._conn.execute(f"DELETE FROM semantic_history WHERE id IN ({','.join('?' * len(ids))})", ids)
+
+    def _history_rows(self, where: str, params: tuple, limit: int, before: Optional[int]) -> List[Dict[str, Any]]:
+        rows = self._conn.execute(f"""
+            SELECT id, fid, target, status, commit_hash, author, message, timestamp, changed_fields, snapshot, audit_id
+            FROM semantic_history WHERE {where} AND (? IS NULL OR id < ?)
+            ORDER BY id DESC LIMIT ?
+        """, params + (before, before, limit)).fetchall()
+        return [{
+            "id": r[0], "fid": r[1], "target": r[2], "status": r[3],
+            "hash": r[4], "author": r[5], "message": r[6], "timestamp": r[7],
+            "changed_fields": json.loads(r[8]), "context": json.loads(r[9]),
+            "pending": r[4] is None and r[10] is not None
+        } for r in rows]
+
+    def get_history(self, fid: str, limit: int = 50, before: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Versions of a decision, newest first. Pass the last seen `id` as `before` to page."""
+        return self._history_rows("fid = ?", (fid,), limit, before)
+
+    def get_target_timeline(self, target: str, limit: int = 50, before: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Versions of all decisions for a target, newest first, with keyset pagination."""
+        return self._history_rows("target = ?", (target,), limit, before)
+
+    def get_as_of(self, fid: str, timestamp: str) -> Optional[Dict[str, Any]]:
+        """The latest version of a decision recorded at or before `timestamp` (ISO-8601)."""
+        rows = self._history_rows("fid = ? AND timestamp <= ?", (fid, timestamp), 1, None)
+        return rows[0] if rows else None
+
+    def has_history(self) -> bool:
+        return self._conn.execute("SELECT 1 FROM semantic_history LIMIT 1").fetchone() is not None
+
+    def replace_history(self, entries: List[Dict[str, Any]]):
+        """
+        Replaces the history table with `entries` (oldest first; keys fid, target,
+        status, hash, author, message, timestamp, context) in one transaction.
+        """
+        with self._conn:
+            self._conn.execute("DELETE FROM semantic_history")
+            for e in entries:
+                self._record_history(e["fid"], e.get("target"), e.get("status"), e["message"],
+                                     json.dumps(e.get("context") or {}), timestamp=e["timestamp"],
+                                     commit_hash=e["hash"], author=e.get("author"))
 
     def get_by_fid(self, fid: str) -> Optional[Dict[str, Any]]:
         """Retrieves full metadata for a specific file ID."""
@@ -149,10 +392,27 @@ class SemanticMetaStore:
         ).fetchone()
         return row[0] if row else None
 
-    def keyword_search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
-        """Search using FTS5 (BM25) or fallback to LIKE."""
-        self._conn.row_factory = sqlite3.Row
-        cursor = self._conn.cursor()
+    def reader(self) -> sqlite3.Connection:
+        """
+        A read-only connection owned by the calling thread, so searches can run
+        beside the shared connection. Sees committed data only.
+        """
+        conn = getattr(self._readers, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            conn.execute("PRAGMA query_only=ON")
+            self._readers.conn = conn
+            self._reader_conns.append(conn)
+        return conn
+
+    def keyword_search(self, query: str, limit: int = 10, conn: Optional[sqlite3.Connection] = None) -> List[Dict[str, Any]]:
+        """Search using FTS5 (BM25) or fallback to LIKE. Pass a `reader()` as `conn` to search off the shared connection."""
+        if conn is None:
+            self._conn.row_factory = sqlite3.Row
+            cursor = self._conn.cursor()
+        else:
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
         
         try:
             # FTS Search
@@ -231,6 +491,35 @@ class SemanticMetaStore:
         cursor.execute("SELECT * FROM semantic_meta")
         return [dict(row) for row in cursor.fetchall()]
 
+    def has_inactive(self, cutoff: str) -> bool:
+        """True if an active or deprecated record was last hit (or created) before `cutoff`."""
+        row = self._conn.execute(
+            "SELECT 1 FROM semantic_meta WHERE status IN ('active', 'deprecated') "
+            "AND COALESCE(last_hit_at, timestamp) <= ? LIMIT 1",
+            (cutoff,)
+        ).fetchone()
+        return row is not None
+
+    def decay_columns(self) -> Dict[str, Any]:
+        """
+        Active and deprecated records as columns for `DecayEngine.evaluate_semantic_columns`:
+        fids, wall-clock epoch of the last hit (or creation), confidence, kind and status.
+        """
+        rows = self._conn.execute("""
+            SELECT fid,
+                   COALESCE(CAST(strftime('%s', substr(COALESCE(NULLIF(last_hit_at, ''), timestamp), 1, 19)) AS INTEGER), ?),
+                   COALESCE(confidence, 1.0), kind, status
+            FROM semantic_meta WHERE status IN ('active', 'deprecated')
+        """, (int(INVALID_EPOCH),)).fetchall()
+        fids, last_active, confidence, kinds, statuses = zip(*rows) if rows else ((), (), (), (), ())
+        return {
+            "fids": np.array(fids, dtype=object),
+            "last_active": np.array(last_active, dtype=np.int64),
+            "confidence": np.array(confidence, dtype=np.float64),
+            "kinds": np.array(kinds, dtype=object),
+            "statuses": np.array(statuses, dtype=object)
+        }
+
     def list_draft_proposals(self) -> List[Dict[str, Any]]:
         """Efficiently retrieves all draft proposals from the database."""
         self._conn.row_factory = sqlite3.Row
@@ -249,32 +538,174 @@ class SemanticMetaStore:
         return {row[0] for row in cursor.fetchall()}
 
     def increment_hit(self, fid: str):
+        if self.read_only:
+            return
+        owns_tx = not self._conn.in_transaction
         self._conn.execute("""
             UPDATE semantic_meta 
             SET hit_count = hit_count + 1, 
                 last_hit_at = ? 
             WHERE fid = ?
         """, (datetime.now().isoformat(), fid))
+        if owns_tx:
+            # Don't hold the write lock past a read-path counter update
+            self._conn.commit()
+
+    def find_violations(self, limit: int = 1) -> List[Dict[str, Any]]:
+        """
+        Evaluates the I3, I4 and I5 invariants directly over the index.
+        Returns up to `limit` violations per invariant in check order (I4, I3, references, I5).
+        """
+        violations: List[Dict[str, Any]] = []
+        cursor = self._conn.cursor()
 
-    def delete(self, fid: str):
+        # I4: Single active decision per target
+        for target, fids in cursor.execute("""
+            SELECT target, group_concat(fid, '|') FROM semantic_meta
+            WHERE kind = 'decision' AND status = 'active' AND target IS NOT NULL AND target != ''
+            GROUP BY target HAVING count(*) > 1 LIMIT ?
+        """, (limit,)).fetchall():
+            first, *rest = sorted(fids.split('|'))
+            violations.append({"invariant": "I4", "fid": rest[0], "details": {"target": target, "conflicting_file": first}})
+
+        # I3: superseded_by must point to an existing record that acknowledges it
+        for fid, successor, exists in cursor.execute("""
+            SELECT m.fid, m.superseded_by, s.fid IS NOT NULL FROM semantic_meta m
+            LEFT JOIN semantic_meta s ON s.fid = m.superseded_by
+            LEFT JOIN semantic_supersedes e ON e.fid = m.superseded_by AND e.old_fid = m.fid
+            WHERE m.superseded_by IS NOT NULL AND m.superseded_by != ''
+              AND (s.fid IS NULL OR e.fid IS NULL)
+            LIMIT ?
+        """, (limit,)).fetchall():
+            violations.append({"invariant": "I3" if exists else "I3-dangling", "fid": fid, "details": {"target": successor}})
+
+        # References: every 'supersedes' entry must exist
+        for fid, old_fid in cursor.execute("""
+            SELECT e.fid, e.old_fid FROM semantic_supersedes e
+            LEFT JOIN semantic_meta m ON m.fid = e.old_fid
+            WHERE m.fid IS NULL LIMIT ?
+        """, (limit,)).fetchall():
+            violations.append({"invariant": "REF", "fid": fid, "details": {"target": old_fid}})
+
+        # I5: Acyclic evolution graph (walk superseded_by chains back to their start)
+        for (fid,) in cursor.execute("""
+            WITH RECURSIVE chain(start, fid, depth) AS (
+                SELECT fid, superseded_by, 1 FROM semantic_meta
+                WHERE superseded_by IS NOT NULL AND superseded_by != ''
+                UNION ALL
+                SELECT c.start, m.superseded_by, c.depth + 1 FROM chain c
+                JOIN semantic_meta m ON m.fid = c.fid
+                WHERE m.superseded_by IS NOT NULL AND m.superseded_by != ''
+                  AND c.fid != c.start
+                  AND c.depth <= (SELECT count(*) FROM semantic_meta)
+            )
+            SELECT DISTINCT start FROM chain WHERE fid = start LIMIT ?
+        """, (limit,)).fetchall():
+            violations.append({"invariant": "I5", "fid": fid, "details": {}})
+
+        return violations
+
+    def delete(self, fid: str, purge_history: bool = False):
+        """Drops the index rows of a record. Its history is kept unless `purge_history` is set (purge/forget)."""
         self._conn.execute("DELETE FROM semantic_meta WHERE fid = ?", (fid,))
+        self._conn.execute("DELETE FROM semantic_supersedes WHERE fid = ?", (fid,))
+        if purge_history:
+            self._conn.execute("DELETE FROM semantic_history WHERE fid = ?", (fid,))
 
     def clear(self):
         self._conn.execute("DELETE FROM semantic_meta")
+        self._conn.execute("DELETE FROM semantic_supersedes")
+
+    def enqueue_audit(self, op: str, paths: List[str], message: str, content: Optional[str] = None) -> int:
+        """Queues an audit operation. Becomes durable with the surrounding SQLite transaction."""
+        cursor = self._conn.execute(
+            "INSERT INTO audit_queue (op, paths, message, content, enqueued_at) VALUES (?, ?, ?, ?, ?)",
+            (op, json.dumps(paths), message, content, time.time())
+        )
+        return cursor.lastrowid
+
+    def pending_audit(self, limit: int = 100, path: Optional[str] = None, conn: Optional[sqlite3.Connection] = None) -> List[Dict[str, Any]]:
+        """
+        Queued audit operations, oldest first, optionally only those touching `path`.
+        Pass a separate `conn` to see committed entries only.
+        """
+        conn = conn or self._conn
+        if path is None:
+            rows = conn.execute(
+                "SELECT id, op, paths, message, content, enqueued_at FROM audit_queue ORDER BY id LIMIT ?", (limit,)
+            ).fetchall()
+        else:
+            rows = conn.execute("""
+                SELECT id, op, paths, message, content, enqueued_at FROM audit_queue
+                WHERE EXISTS (SELECT 1 FROM json_each(audit_queue.paths) WHERE value = ?)
+                ORDER BY id LIMIT ?
+            """, (path, limit)).fetchall()
+        return [
+            {"id": r[0], "op": r[1], "paths": json.loads(r[2]), "message": r[3], "content": r[4], "enqueued_at": r[5]}
+            for r in rows
+        ]
+
+    def ack_audit(self, entry_id: int, conn: Optional[sqlite3.Connection] = None):
+        """Removes an applied audit operation and commits."""
+        conn = conn or self._conn
+        with conn:
+            conn.execute("DELETE FROM audit_queue WHERE id = ?", (entry_id,))
+
+    def audit_queue_depth(self, conn: Optional[sqlite3.Connection] = None) -> Dict[str, Any]:
+        """Queue depth and oldest entry. Pass a separate `conn` to count committed entries only."""
+        row = (conn or self._conn).execute("SELECT count(*), min(enqueued_at) FROM audit_queue").fetchone()
+        return {"depth": row[0], "oldest_enqueued_at": row[1]}
+
+    def data_version(self) -> int:
+        """SQLite's data_version: changes when another connection commits to the database."""
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def commit(self):
+        """Commits any implicit transaction left open by direct writes."""
+        self._conn.commit()
+
+    @contextmanager
+    def savepoint(self, name: str = "ledgermind_write"):
+        """
+        Scopes a direct (non-transactional) write: metadata, history and queued
+        audit rows written inside are undone together if the block raises.
+        Releasing the savepoint commits when it opened the transaction.
+        """
+        self._conn.execute(f"SAVEPOINT {name}")
+        try:
+            yield
+        except Exception:
+            self._conn.execute(f"ROLLBACK TO {name}")
+            self._conn.execute(f"RELEASE {name}")
+            raise
+        self._conn.execute(f"RELEASE {name}")
 
     def get_config(self, key: str, default: Any = None) -> Any:
         """Retrieves a configuration value from sys_config."""
+        if self.read_only:
+            try:
+                row = self._conn.execute("SELECT value FROM sys_config WHERE key = ?", (key,)).fetchone()
+            except sqlite3.OperationalError:
+                return default
+            return row[0] if row else default
         with self._conn:
             self._conn.execute("CREATE TABLE IF NOT EXISTS sys_config (key TEXT PRIMARY KEY, value TEXT)")
         cursor = self._conn.cursor()
         row = cursor.execute("SELECT value FROM sys_config WHERE key = ?", (key,)).fetchone()
         return row[0] if row else default
 
-    def set_config(self, key: str, value: Any):
-        """Stores a configuration value in sys_config."""
+    def set_config(self, key: str, value: Any, commit: bool = True):
+        """
+        Stores a configuration value in sys_config. With `commit=False` the
+        write joins the running transaction (e.g. a SemanticStore.transaction).
+        """
+        sql = "INSERT OR REPLACE INTO sys_config (key, value) VALUES (?, ?)"
+        if not commit:
+            self._conn.execute(sql, (key, str(value)))
+            return
         with self._conn:
             self._conn.execute("CREATE TABLE IF NOT EXISTS sys_config (key TEXT PRIMARY KEY, value TEXT)")
-            self._conn.execute("INSERT OR REPLACE INTO sys_config (key, value) VALUES (?, ?)", (key, str(value)))
+            self._conn.execute(sql, (key, str(value)))
 
     def get_version(self) -> str:
         """Retrieves the current schema version."""
@@ -285,5 +716,8 @@ class SemanticMetaStore:
         self.set_config('version', version)
 
     def close(self):
-        """Closes the persistent database connection."""
+        """Closes the persistent database connection and any reader connections."""
+        for conn in self._reader_conns:
+            conn.close()
+        self._reader_conns = []
         self._conn.close()
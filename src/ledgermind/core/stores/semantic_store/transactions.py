@@ -3,7 +3,7 @@ import shutil
 import sqlite3
 import logging
 import time
-from typing import List, Optional, Any
+from typing import List, Optional, Any, Dict
 from contextlib import contextmanager
 
 logger = logging.getLogger("ledgermind-core.transactions")
@@ -92,17 +92,50 @@ class FileSystemLock:
                 os.remove(semaphore_path)
             except OSError: pass
 
+def atomic_write(path: str, content: str):
+    """Writes a file via a sibling temp file and os.replace, so readers never see a torn write."""
+    tmp_path = f"{path}.tx-{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
 class TransactionManager:
     """
     Implements ACID properties over a Git-backed file store.
-    Uses WAL-like pattern via Backup/Restore and SQLite transaction.
+
+    Staged files are written via temp file + os.replace, so the original inode is
+    never modified in place. Before the first write, the original is hard-linked
+    into `.tx_backup` (falling back to a copy where links are unsupported), which
+    makes backups copy-free. An append-only, fsynced journal records every staged
+    path so that `recover` can undo an interrupted transaction at startup. Its
+    first line holds `base_head`, the audit HEAD the transaction started from,
+    so recovery can tell whether the audit commit landed before the crash.
+
+    Nested scopes opened with `savepoint` keep their own backups and SQLite
+    savepoint; only the outermost `begin` holds the lock and commits. The
+    journal is removed as soon as the commit is durable, so a crash while
+    discarding backups cannot roll back a committed transaction.
     """
+    JOURNAL = "journal"
+    HEAD_MARKER = "#head"
+
     def __init__(self, repo_path: str, meta_db: Any):
         self.repo_path = repo_path
         self.meta_db = meta_db
         self.lock = FileSystemLock(os.path.join(repo_path, ".lock"))
         self.backup_dir = os.path.join(repo_path, ".tx_backup")
-        self._staged_files: List[str] = []
+        # One dict per open scope: rel_path -> backup path (None for new files)
+        self._levels: List[Dict[str, Optional[str]]] = []
+        self._seq = 0
+        self._journal = None
+        self._removed: set = set()
+        self.last_rolled_back: List[str] = []
+        # Audit HEAD when the transaction began; set by the caller, journaled for recovery
+        self.base_head: Optional[str] = None
+
+    @property
+    def depth(self) -> int:
+        return len(self._levels)
 
     @contextmanager
     def begin(self):
@@ -110,72 +143,235 @@ class TransactionManager:
         Starts a transaction.
         1. Acquires Exclusive Lock.
         2. Starts SQLite SAVEPOINT.
-        3. Clears previous backup.
         """
         self.lock.acquire(exclusive=True)
-        self._staged_files = []
+        self._levels = [{}]
         
         # Start DB transaction via SAVEPOINT
         db_conn = getattr(self.meta_db, '_conn', None)
         if db_conn:
+            if db_conn.in_transaction:
+                # Settle implicit writes left by direct (non-transactional) calls
+                db_conn.commit()
+            # Take the write lock up front: a deferred transaction that reads first
+            # fails with SQLITE_BUSY if another connection commits in between.
+            db_conn.execute("BEGIN IMMEDIATE")
             db_conn.execute("SAVEPOINT ledgermind_tx")
 
-        # Ensure clean state
-        if os.path.exists(self.backup_dir):
-            shutil.rmtree(self.backup_dir)
-        os.makedirs(self.backup_dir)
-        
         try:
             yield self
             self._commit()
             if db_conn:
                 db_conn.execute("RELEASE ledgermind_tx")
+                db_conn.commit()
         except Exception as e:
             logger.error(f"Transaction failed: {e}. Rolling back...")
-            self._rollback()
+            self.last_rolled_back = self.staged_files
+            for level in reversed(self._levels):
+                self._rollback(level)
             if db_conn:
                 db_conn.execute("ROLLBACK TO ledgermind_tx")
+                db_conn.rollback()
             raise
+        else:
+            self._mark_committed()
         finally:
-            if os.path.exists(self.backup_dir):
-                shutil.rmtree(self.backup_dir)
+            self._discard_backups()
             self.lock.release()
 
+    @contextmanager
+    def savepoint(self):
+        """
+        Opens a nested scope inside a running transaction. On error only the
+        changes made within the scope are undone; on success they are folded
+        into the enclosing scope. Paths undone by the last failed scope are
+        kept in `last_rolled_back`.
+        """
+        if not self._levels:
+            raise RuntimeError("savepoint() requires an active transaction")
+
+        name = f"ledgermind_tx_{len(self._levels)}"
+        db_conn = getattr(self.meta_db, '_conn', None)
+        if db_conn:
+            db_conn.execute(f"SAVEPOINT {name}")
+        self._levels.append({})
+
+        try:
+            yield self
+        except Exception:
+            level = self._levels.pop()
+            self._rollback(level)
+            self.last_rolled_back = list(level)
+            if db_conn:
+                db_conn.execute(f"ROLLBACK TO {name}")
+                db_conn.execute(f"RELEASE {name}")
+            raise
+
+        level = self._levels.pop()
+        parent = self._levels[-1]
+        for rel_path, backup_path in level.items():
+            if rel_path in parent:
+                # The enclosing scope already holds an older backup
+                if backup_path and os.path.exists(backup_path):
+                    os.remove(backup_path)
+            else:
+                parent[rel_path] = backup_path
+        if db_conn:
+            db_conn.execute(f"RELEASE {name}")
+
     def stage_file(self, relative_path: str):
         """
-        Marks a file as part of the transaction. Backs it up if it exists.
+        Marks a file as part of the current scope. Keeps the prior version (if any) for rollback.
         """
+        level = self._levels[-1] if self._levels else None
+        if level is None:
+            level = {}
+            self._levels.append(level)
+        if relative_path in level:
+            return
+
+        if self._journal is None:
+            os.makedirs(self.backup_dir, exist_ok=True)
+            self._journal = open(os.path.join(self.backup_dir, self.JOURNAL), "a", encoding="utf-8")
+            self._journal.write(f"{self.HEAD_MARKER}\t{self.base_head or ''}\n")
+
         full_path = os.path.join(self.repo_path, relative_path)
-        backup_path = os.path.join(self.backup_dir, relative_path)
-        
-        if relative_path not in self._staged_files:
-            if os.path.exists(full_path):
-                # Copy original to backup
-                os.makedirs(os.path.dirname(backup_path), exist_ok=True)
+        backup_path = None
+        if os.path.exists(full_path):
+            backup_path = os.path.join(self.backup_dir, f"{self._seq}.bak")
+            self._seq += 1
+            try:
+                os.link(full_path, backup_path)
+            except OSError:
                 shutil.copy2(full_path, backup_path)
-            self._staged_files.append(relative_path)
 
-    def _rollback(self):
+        self._journal.write(f"{relative_path}\t{os.path.basename(backup_path) if backup_path else ''}\n")
+        self._journal.flush()
+        # The entry must be durable before the file it protects is replaced
+        os.fsync(self._journal.fileno())
+        level[relative_path] = backup_path
+
+    def write_file(self, relative_path: str, content: str):
+        """Stages and atomically writes a file inside the transaction."""
+        self.stage_file(relative_path)
+        atomic_write(os.path.join(self.repo_path, relative_path), content)
+        self._removed.discard(relative_path)
+
+    def remove_file(self, relative_path: str):
+        """Stages and deletes a file inside the transaction; rollback restores it."""
+        self.stage_file(relative_path)
+        full_path = os.path.join(self.repo_path, relative_path)
+        if os.path.exists(full_path):
+            os.remove(full_path)
+        self._removed.add(relative_path)
+
+    @property
+    def staged_files(self) -> List[str]:
+        seen: Dict[str, None] = {}
+        for level in self._levels:
+            seen.update(dict.fromkeys(level))
+        return list(seen)
+
+    def _rollback(self, level: Dict[str, Optional[str]]):
         """
-        Restores files from backup and deletes new files created during transaction.
+        Restores files from backup and deletes new files created within a scope.
         """
-        for rel_path in self._staged_files:
+        for rel_path, backup_path in level.items():
             full_path = os.path.join(self.repo_path, rel_path)
-            backup_path = os.path.join(self.backup_dir, rel_path)
-            
-            if os.path.exists(backup_path):
+            if backup_path and os.path.exists(backup_path):
                 # Restore original
-                shutil.copy2(backup_path, full_path)
-            elif os.path.exists(full_path):
+                os.replace(backup_path, full_path)
+            elif not backup_path and os.path.exists(full_path):
                 # It was a new file, delete it
                 os.remove(full_path)
 
+    def _mark_committed(self):
+        """Drops the journal at the durable point; `recover` then discards the backups instead of replaying them."""
+        if self._journal is not None:
+            self._journal.close()
+            os.remove(os.path.join(self.backup_dir, self.JOURNAL))
+
+    def _discard_backups(self):
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+            TransactionManager._clear_backup_dir(self.backup_dir)
+        self._levels = []
+        self._seq = 0
+        self._removed = set()
+
+    @staticmethod
+    def _clear_backup_dir(backup_dir: str):
+        for name in os.listdir(backup_dir):
+            path = os.path.join(backup_dir, name)
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+
+    @staticmethod
+    def journal_head(repo_path: str) -> Optional[str]:
+        """The `base_head` recorded by an interrupted transaction's journal, if any."""
+        journal_path = os.path.join(repo_path, ".tx_backup", TransactionManager.JOURNAL)
+        try:
+            with open(journal_path, "r", encoding="utf-8") as f:
+                marker, _, head = f.readline().rstrip("\n").partition("\t")
+        except FileNotFoundError:
+            return None
+        if marker != TransactionManager.HEAD_MARKER:
+            return None
+        return head or None
+
+    @staticmethod
+    def recover(repo_path: str) -> List[str]:
+        """
+        Undoes a transaction interrupted by a crash, using the journal left in
+        `.tx_backup`. Backups without a journal belong to a committed transaction
+        and are discarded. Must be called under the exclusive FS lock.
+        Returns the relative paths that were restored or removed.
+        """
+        backup_dir = os.path.join(repo_path, ".tx_backup")
+        journal_path = os.path.join(backup_dir, TransactionManager.JOURNAL)
+        if not os.path.exists(journal_path):
+            if os.path.isdir(backup_dir):
+                TransactionManager._clear_backup_dir(backup_dir)
+            return []
+
+        with open(journal_path, "r", encoding="utf-8") as f:
+            entries = [line.rstrip("\n").split("\t", 1) for line in f if "\t" in line] # Skip a torn final line
+        entries = [e for e in entries if e[0] != TransactionManager.HEAD_MARKER]
+
+        # Undo newest first so the oldest backup of each path wins. Backups consumed
+        # by a nested rollback or folded into an enclosing scope are already gone.
+        recovered: Dict[str, None] = {}
+        for rel_path, backup_name in reversed(entries):
+            full_path = os.path.join(repo_path, rel_path)
+            backup_path = os.path.join(backup_dir, backup_name) if backup_name else None
+            if backup_path and os.path.exists(backup_path):
+                os.replace(backup_path, full_path)
+            elif not backup_path and os.path.exists(full_path):
+                os.remove(full_path)
+            recovered[rel_path] = None
+        recovered = list(recovered)
+        for root, _, filenames in os.walk(repo_path):
+            if ".git" in root or ".tx_backup" in root: continue
+            for name in filenames:
+                if ".tx-" in name and name.endswith(".tmp"):
+                    os.remove(os.path.join(root, name))
+
+        TransactionManager._clear_backup_dir(backup_dir)
+        if recovered:
+            logger.warning(f"Recovered {len(recovered)} files from an interrupted transaction.")
+        return recovered
+
     def _commit(self):
         """
         Finalizes the transaction. Verifies that all staged files are correctly written.
         The DB commit and Git commit are coordinated by the caller (SemanticStore).
         """
-        for rel_path in self._staged_files:
+        for rel_path in self.staged_files:
+            if rel_path in self._removed:
+                continue
             full_path = os.path.join(self.repo_path, rel_path)
             if not os.path.exists(full_path):
                 raise RuntimeError(f"Atomic Commit Failed: File {rel_path} missing before commit.")
@@ -2,7 +2,11 @@ import os
 import numpy as np
 import logging
 import platform
-from typing import List, Dict, Any, Optional
+import json
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
+from ledgermind.core.stores.semantic_store.transactions import FileSystemLock, atomic_write
 
 logger = logging.getLogger(__name__)
 
@@ -20,14 +24,29 @@ class VectorStore:
     """
     A simple vector store using NumPy for cosine similarity.
     Reliable and stable in environments like Termux.
+
+    The index on disk is shared by every process opened on the same path. The
+    matrix is memory-mapped, so processes share one copy in the page cache.
+    `vector_manifest.json` carries a generation that each save bumps under
+    the index lock. Searches stat the manifest and reload when it moved.
+    Concurrent writers merge: a save appends its unsaved rows to whatever is
+    on disk.
+
+    Within a process, `_sync_lock` guards the in-memory index: searches run on
+    worker threads and may save, so every mutation happens under it and
+    readers take `_vectors`/`_doc_ids` as one snapshot.
     """
-    def __init__(self, storage_path: str, model_name: str = "all-MiniLM-L6-v2", dimension: int = 384, workers: int = 0):
+    QUERY_MEMO_SIZE = 8
+    def __init__(self, storage_path: str, model_name: str = "all-MiniLM-L6-v2", dimension: int = 384, workers: int = 0,
+                 read_only: bool = False):
+        """With `read_only`, the index is memory-mapped on load and cannot be modified."""
         self.storage_path = storage_path
         self.index_path = os.path.join(storage_path, "vectors.npy")
         self.meta_path = os.path.join(storage_path, "vector_meta.npy")
         self.model_name = model_name
         self.dimension = dimension
         self.workers = self._resolve_workers(workers)
+        self.read_only = read_only
         self._model = None
         self._pool = None
         self._vectors = None # NumPy array of vectors
@@ -35,10 +54,26 @@ class VectorStore:
         self._deleted_ids = set()
         self._dirty = False
         self._unsaved_count = 0
+        self._query_vectors: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._query_lock = threading.Lock()
+        # Shared-index state: the manifest generation and compaction epoch the
+        # in-memory index reflects, and how many leading rows are on disk
+        self.manifest_path = os.path.join(storage_path, "vector_manifest.json")
+        self._generation = 0
+        self._epoch = 0
+        self._synced_rows = 0
+        self._manifest_sig: Optional[tuple] = None
+        self._norms: Optional[np.ndarray] = None
+        self._sync_lock = threading.RLock()
+        self._lock = None if read_only else FileSystemLock(os.path.join(storage_path, ".lock"))
 
-        if not os.path.exists(storage_path):
+        if not read_only and not os.path.exists(storage_path):
             os.makedirs(storage_path, exist_ok=True)
 
+    def _ensure_writable(self):
+        if self.read_only:
+            raise PermissionError("Vector store is open read-only")
+
     def _resolve_workers(self, workers: int) -> int:
         if workers > 0:
             return workers
@@ -87,58 +122,178 @@ class VectorStore:
                 logger.debug(f"Error stopping pool: {e}")
             self._pool = None
 
+    def _manifest_signature(self) -> Optional[tuple]:
+        try:
+            st = os.stat(self.manifest_path)
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def _read_manifest(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _load_from_disk(self, manifest: Optional[Dict[str, Any]], attempts: int = 5):
+        """
+        Maps the saved index. Within an epoch rows are only appended, so the
+        norm cache of the rows already on disk is kept.
+        """
+        for _ in range(attempts):
+            sig = self._manifest_signature()
+            if os.path.exists(self.index_path) and os.path.exists(self.meta_path):
+                vectors = np.load(self.index_path, mmap_mode="r")
+                doc_ids = np.load(self.meta_path, allow_pickle=True).tolist()
+            else:
+                vectors, doc_ids = None, []
+            # A writer may have replaced files while they were read
+            rows = manifest.get("rows") if manifest else None
+            consistent = len(doc_ids) == (0 if vectors is None else len(vectors)) and rows in (None, len(doc_ids))
+            if consistent and self._manifest_signature() == sig:
+                break
+            manifest = self._read_manifest()
+        else:
+            raise RuntimeError(f"Vector index at {self.storage_path} kept changing while loading")
+        manifest = manifest or {"generation": 0, "epoch": 0, "deleted": []}
+        if manifest.get("epoch", 0) != self._epoch or vectors is None or len(vectors) < self._synced_rows:
+            self._norms = None
+        elif self._norms is not None:
+            # Rows past the old disk prefix may be local rows now placed after other writers' rows
+            self._norms = self._norms[:self._synced_rows]
+        self._vectors = vectors
+        self._doc_ids = doc_ids
+        self._deleted_ids = set(manifest.get("deleted", []))
+        self._generation = manifest.get("generation", 0)
+        self._epoch = manifest.get("epoch", 0)
+        self._synced_rows = len(doc_ids)
+        self._manifest_sig = sig
+        self._dirty = False
+        self._unsaved_count = 0
+
     def load(self):
-        if os.path.exists(self.index_path) and os.path.exists(self.meta_path):
+        with self._sync_lock:
             try:
-                self._vectors = np.load(self.index_path)
-                self._doc_ids = np.load(self.meta_path, allow_pickle=True).tolist()
-                self._deleted_ids = set()
-                logger.info(f"Loaded {len(self._doc_ids)} vectors from disk")
+                self._load_from_disk(self._read_manifest())
+                if self._doc_ids:
+                    logger.info(f"Loaded {len(self._doc_ids)} vectors from disk")
             except Exception as e:
                 logger.error(f"Failed to load vector store: {e}")
                 self._vectors = None
 
+    def refresh(self) -> bool:
+        """
+        Picks up changes saved by other processes sharing the index. Costs one
+        stat() when nothing changed. Unsaved local rows are merged by saving.
+        Returns True if the index was reloaded.
+        """
+        if self._manifest_signature() == self._manifest_sig:
+            return False
+        with self._sync_lock:
+            manifest = self._read_manifest()
+            self._manifest_sig = self._manifest_signature()
+            if manifest is None or manifest.get("generation") == self._generation:
+                return False
+            if self._dirty and not self.read_only:
+                self.save()
+            else:
+                self._load_from_disk(manifest)
+            return True
+
+    def _write(self, vectors: Optional[np.ndarray], doc_ids: List[str], deleted: set, epoch: int, generation: int):
+        """Publishes a new index state. Files are replaced, never rewritten, so existing maps stay valid."""
+        if vectors is not None and len(doc_ids):
+            tmp = f"{self.index_path}.{os.getpid()}.tmp.npy"
+            np.save(tmp, vectors)
+            os.replace(tmp, self.index_path)
+            tmp = f"{self.meta_path}.{os.getpid()}.tmp.npy"
+            np.save(tmp, np.array(doc_ids, dtype=object))
+            os.replace(tmp, self.meta_path)
+        else:
+            for path in (self.index_path, self.meta_path):
+                if os.path.exists(path): os.remove(path)
+        present = set(doc_ids)
+        atomic_write(self.manifest_path, json.dumps({
+            "generation": generation,
+            "epoch": epoch,
+            "rows": len(doc_ids),
+            "deleted": sorted(d for d in deleted if d in present)
+        }))
+
+    def _locked_merge(self) -> Tuple[Optional[np.ndarray], List[str], set, int]:
+        """
+        Under the index lock (and `_sync_lock`): the on-disk state with this
+        process's unsaved rows and deletions applied on top, plus the disk generation.
+        """
+        manifest = self._read_manifest()
+        disk_generation = manifest.get("generation", 0) if manifest else 0
+        vectors, doc_ids = self._vectors, list(self._doc_ids)
+        if len(doc_ids) != (0 if vectors is None else len(vectors)):
+            raise RuntimeError(f"Vector index at {self.storage_path} has {len(doc_ids)} ids for {0 if vectors is None else len(vectors)} rows")
+        pending_vectors = vectors[self._synced_rows:] if vectors is not None else None
+        pending_ids = doc_ids[self._synced_rows:]
+        if disk_generation == self._generation:
+            return vectors, doc_ids, set(self._deleted_ids), disk_generation
+        deleted = set(self._deleted_ids)
+        self._load_from_disk(manifest)
+        if pending_ids:
+            base = self._vectors
+            self._vectors = pending_vectors if base is None else np.vstack([base, pending_vectors])
+            self._doc_ids = self._doc_ids + pending_ids
+        return self._vectors, list(self._doc_ids), self._deleted_ids | deleted, disk_generation
+
     def save(self):
-        if self._vectors is not None and self._dirty:
-            np.save(self.index_path, self._vectors)
-            np.save(self.meta_path, np.array(self._doc_ids, dtype=object))
-            self._dirty = False
-            self._unsaved_count = 0
-            logger.debug("Vector store flushed to disk.")
+        if self.read_only or not self._dirty:
+            return
+        with self._sync_lock:
+            self._lock.acquire(exclusive=True)
+            try:
+                vectors, doc_ids, deleted, disk_generation = self._locked_merge()
+                self._write(vectors, doc_ids, deleted, self._epoch, disk_generation + 1)
+                self._load_from_disk(self._read_manifest())
+            finally:
+                self._lock.release()
+        logger.debug("Vector store flushed to disk.")
 
     def remove_id(self, fid: str):
         """Soft-removes a vector from the store."""
-        if fid in self._doc_ids:
+        self._ensure_writable()
+        with self._sync_lock:
+            if fid not in self._doc_ids:
+                return
             self._deleted_ids.add(fid)
+            self._dirty = True
             logger.info(f"Marked vector {fid} as deleted (soft delete)")
-            
+
             # Periodically compact if deleted items > 20% of index
             if len(self._deleted_ids) > max(10, len(self._doc_ids) * 0.2):
                 self.compact()
 
     def compact(self):
         """Physically removes soft-deleted vectors and rebuilds index."""
-        if not self._deleted_ids or self._vectors is None:
-            return
-
-        logger.info(f"Compacting vector store: removing {len(self._deleted_ids)} items...")
-        
-        remaining_indices = [i for i, fid in enumerate(self._doc_ids) if fid not in self._deleted_ids]
-        
-        if not remaining_indices:
-            self._vectors = None
-            self._doc_ids = []
-            if os.path.exists(self.index_path): os.remove(self.index_path)
-            if os.path.exists(self.meta_path): os.remove(self.meta_path)
-        else:
-            self._vectors = self._vectors[remaining_indices]
-            self._doc_ids = [self._doc_ids[i] for i in remaining_indices]
-            self.save()
-
-        self._deleted_ids = set()
+        self._ensure_writable()
+        with self._sync_lock:
+            if not self._deleted_ids or self._vectors is None:
+                return
+            logger.info(f"Compacting vector store: removing {len(self._deleted_ids)} items...")
+            self._lock.acquire(exclusive=True)
+            try:
+                vectors, doc_ids, deleted, disk_generation = self._locked_merge()
+                remaining_indices = [i for i, fid in enumerate(doc_ids) if fid not in deleted]
+                if remaining_indices:
+                    vectors = np.asarray(vectors[remaining_indices])
+                    doc_ids = [doc_ids[i] for i in remaining_indices]
+                else:
+                    vectors, doc_ids = None, []
+                self._write(vectors, doc_ids, set(), self._epoch + 1, disk_generation + 1)
+                self._load_from_disk(self._read_manifest())
+            finally:
+                self._lock.release()
         logger.info("Vector store compaction complete")
 
     def add_documents(self, documents: List[Dict[str, Any]]):
+        self._ensure_writable()
         if not documents or not EMBEDDING_AVAILABLE: return
         
         texts = [doc["content"] for doc in documents]
@@ -154,52 +309,89 @@ class VectorStore:
             
         new_embeddings = np.array(new_embeddings).astype('float32')
 
-        if self._vectors is None:
-            self._vectors = new_embeddings
-        else:
-            self._vectors = np.vstack([self._vectors, new_embeddings])
-            
-        self._doc_ids.extend(ids)
-        self._dirty = True
-        self._unsaved_count += len(documents)
-        
-        if self._unsaved_count >= 50:
-            self.save()
+        with self._sync_lock:
+            if self._vectors is None:
+                self._vectors = new_embeddings
+            else:
+                self._vectors = np.vstack([self._vectors, new_embeddings])
+            # Rebound, not extended: snapshots taken by readers keep their length
+            self._doc_ids = self._doc_ids + ids
+            self._dirty = True
+            self._unsaved_count += len(documents)
+
+            if self._unsaved_count >= 50:
+                self.save()
 
     def get_vector(self, fid: str) -> Optional[np.ndarray]:
         """Retrieves the vector for a specific document ID."""
-        if self._vectors is None or fid not in self._doc_ids:
+        with self._sync_lock:
+            vectors, doc_ids = self._vectors, self._doc_ids
+        if vectors is None or fid not in doc_ids or fid in self._deleted_ids:
             return None
-        try:
-            idx = self._doc_ids.index(fid)
-            if fid in self._deleted_ids: return None
-            return self._vectors[idx]
-        except ValueError:
+        return vectors[doc_ids.index(fid)]
+
+    def encode_query(self, query: str) -> Optional[np.ndarray]:
+        """
+        Unit-norm embedding of a query, or None without an embedding model.
+        The most recent queries are memoised, so callers that embed a prompt
+        before searching with it pay for one encode.
+        """
+        if not EMBEDDING_AVAILABLE:
             return None
+        with self._query_lock:
+            cached = self._query_vectors.get(query)
+            if cached is not None:
+                self._query_vectors.move_to_end(query)
+                return cached
+        vector = np.asarray(self.model.encode([query])[0], dtype='float32')
+        vector = vector / (np.linalg.norm(vector) + 1e-9)
+        with self._query_lock:
+            self._query_vectors[query] = vector
+            while len(self._query_vectors) > self.QUERY_MEMO_SIZE:
+                self._query_vectors.popitem(last=False)
+        return vector
+
+    def _row_norms(self, vectors: np.ndarray, norms: Optional[np.ndarray]) -> np.ndarray:
+        """
+        Row norms of `vectors` given the norm cache taken with them, extending
+        the cached prefix when rows were only appended. The cache is only
+        updated if `vectors` is still the current index.
+        """
+        if norms is None or len(norms) > len(vectors):
+            norms = np.linalg.norm(vectors, axis=1)
+        elif len(norms) < len(vectors):
+            norms = np.concatenate([norms, np.linalg.norm(vectors[len(norms):], axis=1)])
+        with self._sync_lock:
+            if self._vectors is vectors:
+                self._norms = norms
+        return norms
 
     def search(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
-        if self._vectors is None or len(self._vectors) == 0 or not EMBEDDING_AVAILABLE:
+        if not EMBEDDING_AVAILABLE:
+            return []
+        self.refresh()
+        with self._sync_lock:
+            vectors, doc_ids, norms, deleted = self._vectors, self._doc_ids, self._norms, set(self._deleted_ids)
+        if vectors is None or len(vectors) == 0:
             return []
 
-        query_vector = self.model.encode([query])[0].astype('float32')
+        query_vector = self.encode_query(query)
         
         # Calculate cosine similarity: (A dot B) / (|A| * |B|)
-        # Since sentence-transformers usually returns normalized vectors, 
-        # it's just a dot product.
-        norms = np.linalg.norm(self._vectors, axis=1)
-        query_norm = np.linalg.norm(query_vector)
+        # The query vector is already unit-norm.
+        norms = self._row_norms(vectors, norms)
         
         # Dot product
-        similarities = np.dot(self._vectors, query_vector) / (norms * query_norm + 1e-9)
+        similarities = np.dot(vectors, query_vector) / (norms + 1e-9)
         
         # Get top indices
         top_indices = np.argsort(similarities)[::-1]
         
         results = []
         for idx in top_indices:
-            fid = self._doc_ids[idx]
-            if fid in self._deleted_ids: continue
-            
+            fid = doc_ids[idx]
+            if fid in deleted: continue
+
             results.append({
                 "id": fid,
                 "score": float(similarities[idx])
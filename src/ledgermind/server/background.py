@@ -6,6 +6,7 @@ from typing import Optional, Dict, List
 from datetime import datetime
 
 from ledgermind.core.api.memory import Memory
+from ledgermind.server.scheduler import MaintenanceScheduler, MaintenanceTask
 
 logger = logging.getLogger(__name__)
 
@@ -14,15 +15,36 @@ class BackgroundWorker:
     Active Runtime Loop ("The Heartbeat") for LedgerMind.
     Ensures the system is always alive, healthy, and evolving.
     Uses threading for compatibility with sync/async environments.
+
+    Tasks run through a MaintenanceScheduler in slices of `slice_budget_ms`;
+    the loop sleeps until the next task is due. The scheduler alone decides
+    when a task is due; a `_run_*` method returns False only when it could
+    not do its work (e.g. the store was locked) and should be retried on the next slice.
     """
-    def __init__(self, memory: Memory, interval_seconds: int = 300):
+    REFLECTION_INTERVAL = 300 # 5 minutes
+    DECAY_INTERVAL = 3600 # 1 hour
+    GIT_MAINTENANCE_INTERVAL = 3600 # 1 hour
+    def __init__(self, memory: Memory, interval_seconds: int = 300, slice_budget_ms: int = 2000):
         self.memory = memory
         self.interval = interval_seconds
+        self.slice_budget_ms = slice_budget_ms
         self.running = False
         self.thread: Optional[threading.Thread] = None
         self.last_run: Dict[str, datetime] = {}
         self.status = "stopped"
         self.errors: List[str] = []
+        # Each task is probed only once due, so an idle store costs a few cheap queries per interval
+        self.scheduler = MaintenanceScheduler([
+            MaintenanceTask("health", self._run_health_check, interval_seconds=interval_seconds, cost_ms=10),
+            MaintenanceTask("git_sync", self._run_git_sync, has_work=lambda: self.memory.has_git_sync_work("."),
+                            interval_seconds=interval_seconds, cost_ms=200),
+            MaintenanceTask("reflection", self._run_reflection, has_work=self.memory.has_reflection_work,
+                            interval_seconds=self.REFLECTION_INTERVAL, cost_ms=1000),
+            MaintenanceTask("decay", self._run_decay, has_work=self.memory.has_decay_work,
+                            interval_seconds=self.DECAY_INTERVAL, cost_ms=2000),
+            MaintenanceTask("git_maintenance", self._run_git_maintenance, has_work=self.memory.has_git_maintenance_work,
+                            interval_seconds=self.GIT_MAINTENANCE_INTERVAL, cost_ms=5000),
+        ])
 
     def start(self):
         if self.running: return
@@ -45,28 +67,14 @@ class BackgroundWorker:
         
         while self.running:
             try:
-                start_time = time.time()
-                
-                # 1. Health Check & Self-Healing
-                self._run_health_check()
-                
-                # 2. Git Sync (Ingest external changes)
-                self._run_git_sync()
-                
-                # 3. Reflection Cycle (Generate proposals)
-                self._run_reflection()
-                
-                # 4. Decay Cycle (Prune old data)
-                self._run_decay()
-                
-                elapsed = time.time() - start_time
-                sleep_time = max(1.0, self.interval - elapsed)
-                
+                self.scheduler.run_slice(self.slice_budget_ms, should_stop=lambda: not self.running)
+                sleep_time = max(1.0, min(self.scheduler.next_due_in(), self.interval))
+
                 # Sleep in chunks to allow faster stopping
                 for _ in range(int(sleep_time)):
                     if not self.running: break
                     time.sleep(1)
-                
+
             except Exception as e:
                 # Handle SQLite not ready yet or other startup race conditions
                 if "no such table" in str(e).lower():
@@ -117,16 +125,10 @@ class BackgroundWorker:
     def _run_reflection(self):
         """Runs the incremental reflection cycle to generate proposals."""
         try:
-            # Reflection is now incremental and cheap, run it every 5 minutes
-            last = self.last_run.get("reflection")
-            now = datetime.now()
-            
-            if not last or (now - last).total_seconds() > 300: # 5 minutes
-                proposals = self.memory.run_reflection()
-                if proposals:
-                    logger.info(f"Background Reflection: Generated/Updated {len(proposals)} proposals.")
-                
-                self.last_run["reflection"] = now
+            proposals = self.memory.run_reflection()
+            if proposals:
+                logger.info(f"Background Reflection: Generated/Updated {len(proposals)} proposals.")
+            self.last_run["reflection"] = datetime.now()
         except Exception as e:
             if "no such table" in str(e).lower(): raise e
             logger.error(f"Reflection cycle failed: {e}")
@@ -134,14 +136,24 @@ class BackgroundWorker:
     def _run_decay(self):
         """Runs the decay cycle to prune old data."""
         try:
-             # Run decay every 1 hour
-            last = self.last_run.get("decay")
-            now = datetime.now()
-            if not last or (now - last).total_seconds() > 3600: # 1 hour
-                report = self.memory.run_decay()
-                if report.archived > 0 or report.pruned > 0:
-                    logger.info(f"Background Decay: Archived {report.archived}, Pruned {report.pruned}")
-                self.last_run["decay"] = now
+            report = self.memory.run_decay()
+            if report.archived > 0 or report.pruned > 0:
+                logger.info(f"Background Decay: Archived {report.archived}, Pruned {report.pruned}")
+            self.last_run["decay"] = datetime.now()
         except Exception as e:
             if "no such table" in str(e).lower(): raise e
             logger.error(f"Decay cycle failed: {e}")
+
+    def _run_git_maintenance(self):
+        """Repacks the semantic Git repository once object counts cross thresholds."""
+        try:
+            report = self.memory.run_git_maintenance(should_stop=lambda: not self.running)
+            if report.get("actions"):
+                logger.info(f"Background Maintenance: {', '.join(report['actions'])}")
+            # A cycle skipped because writers held the lock is retried on the next slice
+            if report.get("skipped") == "locked":
+                return False
+            self.last_run["git_maintenance"] = datetime.now()
+        except Exception as e:
+            if "no such table" in str(e).lower(): raise e
+            logger.error(f"Git maintenance failed: {e}")
@@ -69,6 +69,44 @@ def show_stats(path: str):
     except Exception as e:
         print(f"✗ Error fetching stats: {e}")
 
+def import_decisions(path: str, source: str, chunk_size: int):
+    """Bulk-imports decisions from a JSON Lines file (one decision object per line)."""
+    from ledgermind.core.api.memory import Memory
+
+    line_numbers, parse_errors = [], {}
+
+    def read_items(f):
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            line_numbers.append(line_no)
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                parse_errors[len(line_numbers) - 1] = f"Invalid JSON: {e}"
+                yield None
+
+    try:
+        memory = Memory(storage_path=path)
+    except Exception as e:
+        print(f"✗ Error opening storage: {e}")
+        return
+    try:
+        with open(source, "r", encoding="utf-8") as f:
+            report = memory.import_decisions(read_items(f), chunk_size=chunk_size)
+    except OSError as e:
+        print(f"✗ Error reading {source}: {e}")
+        return
+    finally:
+        memory.close()
+
+    print(f"✓ Imported {report['imported']} decisions into {path}")
+    if report["skipped"]:
+        print(f"\nSkipped {len(report['skipped'])} entries:")
+        for entry in report["skipped"]:
+            reason = parse_errors.get(entry["index"], entry["reason"])
+            print(f"  - line {line_numbers[entry['index']]}: {reason}")
+
 def main():
     parser = argparse.ArgumentParser(description="Ledgermind MCP Server Launcher")
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
@@ -94,6 +132,12 @@ def main():
     stats_parser = subparsers.add_parser("stats", help="Show project statistics")
     stats_parser.add_argument("--path", default=".ledgermind", help="Path to memory storage")
 
+    # Import command
+    import_parser = subparsers.add_parser("import", help="Bulk-import decisions from a JSONL file")
+    import_parser.add_argument("file", help="JSON Lines file with one {title, target, rationale, consequences} object per line")
+    import_parser.add_argument("--path", default=".ledgermind", help="Path to memory storage")
+    import_parser.add_argument("--chunk-size", type=int, default=500, help="Decisions per transaction and audit commit")
+
     # Global options
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
     parser.add_argument("--log-file", help="Path to log file")
@@ -104,7 +148,7 @@ def main():
     # Default to 'run' if no command is provided, but we need to handle arguments
     # A simple way is to check sys.argv
     import sys
-    known_commands = ["run", "init", "check", "stats", "export-schema", "-h", "--help", "--verbose", "-v", "--log-file"]
+    known_commands = ["run", "init", "check", "stats", "import", "export-schema", "-h", "--help", "--verbose", "-v", "--log-file"]
     if len(sys.argv) > 1 and sys.argv[1] not in known_commands:
         # Insert 'run' as the default command
         sys.argv.insert(1, "run")
@@ -123,6 +167,8 @@ def main():
         check_project(args.path)
     elif args.command == "stats":
         show_stats(args.path)
+    elif args.command == "import":
+        import_decisions(args.path, args.file, args.chunk_size)
     elif args.command == "run":
         capabilities = None
         if args.capabilities:
@@ -0,0 +1,129 @@
+import time
+import logging
+from typing import Any, Callable, Dict, List, Optional
+from prometheus_client import Counter, Histogram
+
+logger = logging.getLogger(__name__)
+
+MAINTENANCE_RUNS = Counter(
+    "agent_memory_maintenance_runs_total", "Maintenance task outcomes per scheduler slice", ["task", "result"]
+)
+MAINTENANCE_DURATION = Histogram(
+    "agent_memory_maintenance_duration_seconds", "Wall time of maintenance task runs", ["task"],
+    buckets=(0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300)
+)
+
+class MaintenanceTask:
+    """
+    A unit of background work. `has_work` is a cheap probe consulted once the
+    task is due; `run` may return False to ask for a retry on the next slice
+    instead of waiting a full interval. `cost_ms` starts as the declared
+    estimate and then tracks observed run times; retried attempts are not
+    observed, so they cannot drag the estimate towards zero.
+    """
+    COST_SMOOTHING = 0.3
+
+    def __init__(self, name: str, run: Callable[[], Any], has_work: Optional[Callable[[], bool]] = None,
+                 interval_seconds: float = 0.0, cost_ms: float = 100.0):
+        self.name = name
+        self.run = run
+        self.has_work = has_work
+        self.interval = interval_seconds
+        self.cost_ms = float(cost_ms)
+        self.last_run: Optional[float] = None
+        self.deferred = False
+        self.stats = {"runs": 0, "idle": 0, "deferred": 0, "failed": 0, "retry": 0, "last_duration_ms": None}
+
+    def due(self, now: float) -> bool:
+        return self.last_run is None or now - self.last_run >= self.interval
+
+    def observe(self, duration_ms: float):
+        self.cost_ms += self.COST_SMOOTHING * (duration_ms - self.cost_ms)
+        self.stats["last_duration_ms"] = round(duration_ms, 3)
+
+class MaintenanceScheduler:
+    """
+    Runs maintenance tasks in time-boxed slices.
+
+    A slice walks the tasks in priority order, deferred ones first. Tasks that
+    are not due cost a clock comparison; due tasks whose probe reports no work
+    are marked as run without doing anything, so an idle store only pays for
+    its probes once per interval. A task with work whose estimated cost
+    exceeds what is left of the budget is deferred to the next slice, unless
+    nothing has run yet in this slice, so that an expensive task cannot
+    starve. Tasks are not preempted: the budget decides which tasks start,
+    not when they stop.
+    """
+    def __init__(self, tasks: Optional[List[MaintenanceTask]] = None, clock: Callable[[], float] = time.monotonic):
+        self.tasks: List[MaintenanceTask] = list(tasks or [])
+        self.clock = clock
+
+    def add(self, task: MaintenanceTask) -> MaintenanceTask:
+        self.tasks.append(task)
+        return task
+
+    def _record(self, task: MaintenanceTask, result: str):
+        task.stats[result] += 1
+        MAINTENANCE_RUNS.labels(task=task.name, result=result).inc()
+
+    def run_slice(self, budget_ms: float, should_stop: Optional[Callable[[], bool]] = None) -> Dict[str, str]:
+        """Runs one slice. Returns the outcome per task that was due: runs, idle, deferred, failed or retry."""
+        start = self.clock()
+        outcomes: Dict[str, str] = {}
+        ran_any = False
+        for task in sorted(self.tasks, key=lambda t: not t.deferred):
+            if should_stop and should_stop():
+                break
+            now = self.clock()
+            if not task.due(now):
+                continue
+            try:
+                if task.has_work is not None and not task.has_work():
+                    task.last_run = now
+                    task.deferred = False
+                    self._record(task, "idle")
+                    outcomes[task.name] = "idle"
+                    continue
+                remaining = budget_ms - (self.clock() - start) * 1000
+                if ran_any and task.cost_ms > remaining:
+                    task.deferred = True
+                    self._record(task, "deferred")
+                    outcomes[task.name] = "deferred"
+                    continue
+                task.deferred = False
+                result = task.run()
+            except Exception as e:
+                # A failing task waits its interval instead of spinning every slice
+                if "no such table" in str(e).lower(): raise
+                logger.error(f"Maintenance task {task.name} failed: {e}")
+                task.last_run = now
+                self._record(task, "failed")
+                outcomes[task.name] = "failed"
+                ran_any = True
+                continue
+            ran_any = True
+            if result is False:
+                # Not done (e.g. the store was locked): due again on the next slice
+                self._record(task, "retry")
+                outcomes[task.name] = "retry"
+                continue
+            duration_ms = (self.clock() - now) * 1000
+            task.observe(duration_ms)
+            MAINTENANCE_DURATION.labels(task=task.name).observe(duration_ms / 1000)
+            task.last_run = now
+            self._record(task, "runs")
+            outcomes[task.name] = "runs"
+        return outcomes
+
+    def next_due_in(self) -> float:
+        """Seconds until the earliest task becomes due (0 if one already is)."""
+        if not self.tasks:
+            return float("inf")
+        now = self.clock()
+        return max(0.0, min(0.0 if t.last_run is None or t.deferred else t.last_run + t.interval - now for t in self.tasks))
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            t.name: {**t.stats, "cost_ms": round(t.cost_ms, 3), "interval_seconds": t.interval, "pending": t.deferred}
+            for t in self.tasks
+        }
@@ -58,6 +58,7 @@ class MCPServer:
         
         self._last_write_time = 0
         self._write_cooldown = 1.0 
+        self._bridge = None
         self._register_tools()
         
         # Initialize Background Worker (Active Loop)
@@ -93,6 +94,14 @@ class MCPServer:
 
     # --- Tool Handlers ---
 
+    @property
+    def bridge(self):
+        """IntegrationBridge over the server's own Memory, created on first use."""
+        if self._bridge is None:
+            from ledgermind.core.api.bridge import IntegrationBridge
+            self._bridge = IntegrationBridge(memory=self.memory)
+        return self._bridge
+
     def _get_commit_hash(self) -> Optional[str]:
         return self.memory.semantic.get_head_hash()
 
@@ -324,16 +333,12 @@ class MCPServer:
         @self.mcp.tool()
         def get_relevant_context(prompt: str, limit: int = 3) -> str:
             """Retrieves and formats relevant context for a given user prompt (Bridge Tool)."""
-            from ledgermind.core.api.bridge import IntegrationBridge
-            bridge = IntegrationBridge(memory_path=self.memory.storage_path)
-            return bridge.get_context_for_prompt(prompt, limit=limit)
+            return self.bridge.get_context_for_prompt(prompt, limit=limit)
 
         @self.mcp.tool()
         def record_interaction(prompt: str, response: str, success: bool = True) -> str:
             """Records a completed interaction (prompt and response) into episodic memory (Bridge Tool)."""
-            from ledgermind.core.api.bridge import IntegrationBridge
-            bridge = IntegrationBridge(memory_path=self.memory.storage_path)
-            bridge.record_interaction(prompt, response, success=success)
+            self.bridge.record_interaction(prompt, response, success=success)
             return json.dumps({"status": "success"})
 
         @self.mcp.tool()
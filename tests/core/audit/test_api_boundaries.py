@@ -1,5 +1,6 @@
 import pytest
 import os
+import subprocess
 from ledgermind.core.api.memory import Memory
 from ledgermind.core.core.schemas import TrustBoundary
 
@@ -29,3 +30,64 @@ def test_trust_boundary_agent_allowed(temp_storage):
     
     assert res.should_persist is True
     assert res.store_type == "semantic"
+
+def test_import_decisions_bulk(memory):
+    """Bulk import writes one audit commit per chunk and skips invalid or conflicting items."""
+    memory.record_decision(title="Database", target="database", rationale="We use SQLite for simplicity")
+    items = [{"title": f"Rule {i}", "target": f"area_{i}", "rationale": f"Rationale for area {i}"} for i in range(5)]
+    items += [
+        {"title": "Duplicate", "target": "AREA_1", "rationale": "Same target as an earlier item"},
+        {"title": "Clash", "target": "Database", "rationale": "Target already has an active decision"},
+        {"title": "", "target": "area_x", "rationale": "Missing title"},
+        "not a decision",
+    ]
+    sem_path = memory.semantic.repo_path
+    commits_before = int(subprocess.run(["git", "rev-list", "--count", "HEAD"], cwd=sem_path,
+                                        capture_output=True, text=True).stdout)
+
+    report = memory.import_decisions(items, chunk_size=3)
+
+    assert report["imported"] == 5
+    assert [s["index"] for s in report["skipped"]] == [5, 6, 7, 8]
+    assert "CONFLICT" in report["skipped"][0]["reason"]
+    assert "already has an active decision" in report["skipped"][1]["reason"]
+    commits_after = int(subprocess.run(["git", "rev-list", "--count", "HEAD"], cwd=sem_path,
+                                       capture_output=True, text=True).stdout)
+    assert commits_after - commits_before == 2
+    for fid in report["ids"]:
+        meta = memory.semantic.meta.get_by_fid(fid)
+        assert meta["status"] == "active"
+        assert memory.semantic.meta.get_history(fid)[0]["hash"]
+    assert memory.search_decisions("Rule 3")[0]["title"] == "Rule 3"
+    linked = [e for e in memory.get_recent_events(limit=20) if e.get("linked_id") in report["ids"]]
+    assert len(linked) == 5
+
+def test_read_only_memory(temp_storage):
+    """A read-only open serves queries without startup writes and rejects every write."""
+    writer = Memory(storage_path=temp_storage)
+    writer.record_decision(title="Database", target="database", rationale="We use SQLite for simplicity")
+    writer.close()
+    sem_path = os.path.join(temp_storage, "semantic")
+    head = subprocess.run(["git", "rev-parse", "HEAD"], cwd=sem_path, capture_output=True, text=True).stdout
+
+    reader = Memory(storage_path=temp_storage, read_only=True)
+    results = reader.search_decisions("SQLite")
+    assert results and results[0]["title"] == "Database"
+    assert len(reader.get_decisions()) == 1
+    assert reader.get_decision_history(results[0]["id"])
+
+    with pytest.raises(PermissionError):
+        reader.record_decision(title="Cache", target="cache", rationale="Redis for hot keys")
+    with pytest.raises(PermissionError):
+        reader.forget(results[0]["id"])
+    with pytest.raises(PermissionError):
+        reader.semantic.update_decision(results[0]["id"], {"status": "deprecated"}, "Deprecate")
+    reader.close()
+
+    assert not os.path.exists(os.path.join(sem_path, ".lock.lock"))
+    assert subprocess.run(["git", "rev-parse", "HEAD"], cwd=sem_path, capture_output=True, text=True).stdout == head
+    assert Memory(storage_path=temp_storage).semantic.meta.get_by_fid(results[0]["id"])["hit_count"] == 0
+
+def test_read_only_requires_existing_store(tmp_path):
+    with pytest.raises(ValueError):
+        Memory(storage_path=str(tmp_path / "missing"), read_only=True)
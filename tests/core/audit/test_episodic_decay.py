@@ -61,3 +61,77 @@ def test_archive_to_prune_pipeline(memory, temp_storage):
     # Final check: physically gone
     events = memory.episodic.query(limit=100, status='archived')
     assert not any(e['id'] == eid for e in events)
+
+def test_semantic_decay_is_one_commit(memory):
+    """Semantic decay applies all confidence/status changes and forgets in a single audit commit."""
+    import subprocess
+    from datetime import datetime, timedelta
+    fids = [memory.record_decision(f"Rule {t}", t, f"Rationale for {t} decay").metadata["file_id"]
+            for t in ("alpha", "beta", "gamma")]
+    now = datetime.now()
+    ages = [now - timedelta(days=70), now - timedelta(days=300), datetime(2000, 1, 1)]
+    for fid, ts in zip(fids, ages):
+        memory.semantic.meta._conn.execute(
+            "UPDATE semantic_meta SET timestamp = ?, last_hit_at = NULL WHERE fid = ?", (ts.isoformat(), fid))
+    memory.semantic.meta._conn.commit()
+
+    repo = memory.semantic.repo_path
+    def commits():
+        return int(subprocess.run(["git", "rev-list", "--count", "HEAD"], cwd=repo,
+                                  capture_output=True, text=True).stdout.strip())
+    before = commits()
+    report = memory.run_decay()
+    assert commits() == before + 1
+    assert report.semantic_forgotten == 1
+
+    kept, stale, gone = (memory.semantic.meta.get_by_fid(f) for f in fids)
+    assert kept["confidence"] == 0.83 and kept["status"] == "active"
+    assert stale["confidence"] == 0.3 and stale["status"] == "deprecated"
+    assert gone is None
+    assert not os.path.exists(os.path.join(repo, fids[2]))
+    with open(os.path.join(repo, fids[1]), encoding="utf-8") as f:
+        assert "deprecated" in f.read()
+
+def test_columnar_decay_matches_row_evaluation(memory, temp_storage):
+    """The columnar decay path archives/prunes exactly what the per-row evaluation does."""
+    from datetime import datetime
+    rows = [
+        ("result", "2000-01-01T00:00:00", None, "active"),          # expired -> archive
+        ("result", "2000-01-01T00:00:00+03:00", None, "archived"),  # expired, tz suffix -> prune
+        ("result", "not-a-date", None, "active"),                   # invalid -> archive
+        ("decision", "2000-01-01T00:00:00", None, "active"),        # immortal kind
+        ("result", "2000-01-01T00:00:00", "decision_1.md", "active"),  # immortal link
+        ("result", datetime.now().isoformat(), None, "active"),     # fresh
+    ]
+    db_path = os.path.join(temp_storage, "episodic.db")
+    with sqlite3.connect(db_path) as conn:
+        conn.executemany(
+            "INSERT INTO events (source, kind, content, context, timestamp, linked_id, status) VALUES ('agent', ?, 'x', '{}', ?, ?, ?)",
+            rows)
+
+    engine = memory.decay_engine
+    expected = engine.evaluate(memory.episodic.query(limit=100, status=None))
+    cols = memory.episodic.decay_columns()
+    archive, prune, retained = engine.evaluate_columns(cols["ids"], cols["timestamps"], cols["active"], cols["immortal"])
+    assert (sorted(archive.tolist()), sorted(prune.tolist()), retained) == (sorted(expected[0]), sorted(expected[1]), expected[2])
+    assert len(archive) == 2 and len(prune) == 1 and retained == 2
+
+def test_decay_columns_backfill_epoch_on_upgrade(tmp_path):
+    """Events logged before the epoch column existed are backfilled on open; later edits keep it in step."""
+    from ledgermind.core.reasoning.decay import INVALID_EPOCH
+    from ledgermind.core.stores.episodic import EpisodicStore
+
+    db_path = str(tmp_path / "episodic.db")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE events (id INTEGER PRIMARY KEY AUTOINCREMENT, source TEXT, kind TEXT, content TEXT, "
+                     "context TEXT, timestamp TEXT, status TEXT DEFAULT 'active', linked_id TEXT DEFAULT NULL)")
+        conn.executemany("INSERT INTO events (source, kind, content, context, timestamp) VALUES ('agent', 'result', ?, '{}', ?)",
+                         [("a", "1970-01-02T00:00:00"), ("b", "not-a-date")])
+
+    store = EpisodicStore(db_path)
+    assert store.decay_columns()["timestamps"].tolist() == [86400, INVALID_EPOCH]
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("UPDATE events SET timestamp = '1970-01-01T00:01:00+03:00' WHERE content = 'b'")
+    cols = store.decay_columns()
+    assert cols["timestamps"].tolist() == [86400, 60]
+    assert cols["active"].all() and not cols["immortal"].any()
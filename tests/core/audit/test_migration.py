@@ -3,6 +3,8 @@ import pytest
 from unittest.mock import MagicMock
 from ledgermind.core.stores.semantic import SemanticStore
 from ledgermind.core.core.schemas import TrustBoundary
+from ledgermind.core.core.migration import MigrationEngine
+from ledgermind.core.stores.semantic_store.loader import MemoryLoader
 
 def test_auto_migration_v1_22(temp_storage):
     sem_path = os.path.join(temp_storage, "semantic")
@@ -41,3 +43,67 @@ context:
     # 4. Verify SQLite index updated
     meta = store.meta.list_all()
     assert any(m['fid'] == legacy_file and m['target'] == 'migrated_t1' for m in meta)
+
+def _legacy(target: str) -> str:
+    return f"""---
+timestamp: '2026-01-01T00:00:00'
+context:
+  title: Old
+  target: {target}
+  status: superseded
+  rationale: short
+---
+# Old Content"""
+
+def test_migration_resumes_from_checkpoint(temp_storage):
+    sem_path = os.path.join(temp_storage, "semantic")
+    for name in ["a.md", "b.md", "c.md"]:
+        with open(os.path.join(sem_path, name), 'w') as f:
+            f.write(_legacy("t" + name[0]))
+
+    store = SemanticStore(sem_path, trust_boundary=TrustBoundary.AGENT_WITH_INTENT)
+    # Simulate an upgrade interrupted after the chunk ending at a.md
+    store.meta.set_version("1.0.0")
+    with open(os.path.join(sem_path, "a.md"), 'w') as f: f.write(_legacy("ta"))
+    with open(os.path.join(sem_path, "c.md"), 'w') as f: f.write(_legacy("tc"))
+    store.meta.set_config(MigrationEngine.CHECKPOINT_KEY, "a.md")
+    store.meta.close()
+
+    store = SemanticStore(sem_path, trust_boundary=TrustBoundary.AGENT_WITH_INTENT)
+    with open(os.path.join(sem_path, "a.md")) as f: assert "target: ta" in f.read()
+    with open(os.path.join(sem_path, "c.md")) as f: assert "target: migrated_tc" in f.read()
+    assert store.meta.get_config(MigrationEngine.CHECKPOINT_KEY) == ""
+
+def test_migration_resume_commits_files_rewritten_by_interrupted_chunk(temp_storage):
+    sem_path = os.path.join(temp_storage, "semantic")
+    for name in ["a.md", "b.md"]:
+        with open(os.path.join(sem_path, name), 'w') as f:
+            f.write(_legacy("t" + name[0]))
+    store = SemanticStore(sem_path, trust_boundary=TrustBoundary.AGENT_WITH_INTENT)
+    migrated = open(os.path.join(sem_path, "b.md")).read()
+
+    # Simulate a crash after b.md's chunk was rewritten on disk but before its commit
+    with open(os.path.join(sem_path, "b.md"), 'w') as f: f.write(_legacy("tb"))
+    store.audit.run(["add", "b.md"])
+    store.audit.run(["commit", "-m", "Legacy b"])
+    with open(os.path.join(sem_path, "b.md"), 'w') as f: f.write(migrated)
+    store.meta.set_version("1.0.0")
+    store.meta.set_config(MigrationEngine.CHECKPOINT_KEY, "a.md")
+    store.meta.close()
+
+    store = SemanticStore(sem_path, trust_boundary=TrustBoundary.AGENT_WITH_INTENT)
+    assert "target: migrated_tb" in store.audit.run(["show", "HEAD:b.md"]).stdout.decode()
+    assert store.audit.run(["status", "--porcelain", "--untracked-files=no"]).stdout.decode().strip() == ""
+
+def test_parallel_parse_matches_serial(tmp_path, monkeypatch):
+    names = []
+    for i in range(12):
+        name = f"f{i:02d}.md"
+        (tmp_path / name).write_text(_legacy(f"target_{i}"))
+        names.append(name)
+    monkeypatch.setattr(MemoryLoader, "CHUNK_SIZE", 4)
+
+    serial = MemoryLoader.parse_many(str(tmp_path), names, workers=1)
+    parallel = MemoryLoader.parse_many(str(tmp_path), names, workers=2)
+    assert [r[0] for r in parallel] == names
+    assert [r[3] for r in parallel] == [r[3] for r in serial]
@@ -3,11 +3,13 @@ from unittest.mock import MagicMock
 from ledgermind.core.reasoning.merging import MergeEngine
 from ledgermind.core.reasoning.distillation import DistillationEngine
 from ledgermind.core.reasoning.ranking.graph import KnowledgeGraphGenerator
+from ledgermind.core.stores.semantic_store.cache import ParseCache
 
 def test_merging_scan(tmp_path):
     mock_memory = MagicMock()
     mock_memory.get_decisions.return_value = ["dec1.md", "dec2.md"]
     mock_memory.semantic.repo_path = str(tmp_path)
+    mock_memory.semantic.parse_cache = ParseCache(str(tmp_path))
     
     # Create two identical files
     content = """---
@@ -6,6 +6,7 @@ from ledgermind.core.reasoning.reflection import ReflectionEngine, ReflectionPol
 def test_reflection_proactive_success():
     """Verify that consistent successes lead to best practice proposals."""
     mock_episodic = MagicMock()
+    mock_episodic.target_stats_since.return_value = None # No target statistics: events are clustered
     mock_semantic = MagicMock()
     mock_processor = MagicMock()
     
@@ -46,6 +47,7 @@ def test_reflection_proactive_success():
 def test_reflection_lower_error_threshold():
     """Verify that fewer errors now trigger a proposal in v4.1."""
     mock_episodic = MagicMock()
+    mock_episodic.target_stats_since.return_value = None # No target statistics: events are clustered
     mock_semantic = MagicMock()
     mock_processor = MagicMock()
     
@@ -82,6 +84,7 @@ def test_reflection_lower_error_threshold():
 def test_reflection_skips_active_targets():
     """Verify that it doesn't suggest best practices for targets that already have active decisions."""
     mock_episodic = MagicMock()
+    mock_episodic.target_stats_since.return_value = None # No target statistics: events are clustered
     mock_semantic = MagicMock()
     
     mock_episodic.query.return_value = [
@@ -108,3 +111,160 @@ context: {target: existing_target, status: active}
             
             # Should NOT create a success proposal because target is already active
             assert not any("Best Practice" in r for r in results)
+
+def test_proposal_updates_coalesce_and_skip_unchanged():
+    """Staged updates merge per fid, reach the in-memory draft, and drop fields equal to the stored ones."""
+    from ledgermind.core.reasoning.reflection import ProposalUpdates
+    staged = ProposalUpdates()
+    changed = {"context": {"confidence": 0.5, "ready_for_review": False}}
+    same = {"context": {"confidence": 0.4}}
+
+    staged.stage("a.md", changed, {"confidence": 0.45}, "Reflection: Applied decay.")
+    staged.stage("a.md", changed, {"ready_for_review": True}, "Reflection: Automatic readiness update.")
+    staged.stage("b.md", same, {"confidence": 0.4}, "Reflection: Applied decay.")
+
+    assert changed["context"] == {"confidence": 0.45, "ready_for_review": True}
+    assert staged.changed() == {"a.md": {"confidence": 0.45, "ready_for_review": True}}
+    assert staged.message("a.md") == "Reflection: Applied decay. Reflection: Automatic readiness update."
+
+def test_reflection_cycle_flushes_proposals_in_one_commit(memory):
+    """All draft updates of a cycle land in one audit commit with one metadata write per draft."""
+    import subprocess
+    from ledgermind.core.core.schemas import MemoryEvent, ProposalContent
+
+    fids = []
+    for target in ("cache_layer", "queue_worker"):
+        prop = ProposalContent(title=f"Flaky {target}", target=target, rationale=f"Observed instability in {target}", confidence=0.8)
+        fids.append(memory.process_event(source="reflection_engine", kind="proposal", content=prop.title, context=prop).metadata["file_id"])
+    memory.run_reflection() # Consumes the proposals' own events, which mark them as evaluated
+    memory.episodic.append(MemoryEvent(source="agent", kind="result", content="Unrelated", context={"target": "other_area"}))
+
+    repo = memory.semantic.repo_path
+    def commits():
+        return int(subprocess.run(["git", "rev-list", "--count", "HEAD"], cwd=repo, capture_output=True, text=True).stdout.strip())
+    before = commits()
+    with patch.object(memory.semantic, "update_decision", wraps=memory.semantic.update_decision) as single:
+        memory.run_reflection()
+    assert single.call_count == 0
+    assert commits() == before + 1
+    for fid in fids:
+        assert memory.semantic.meta.get_by_fid(fid)["confidence"] == 0.75
+
+def test_reflection_drains_backlog_in_chunks(memory):
+    """Each chunk advances the watermark on its own; a spent budget leaves the rest for the next run."""
+    from ledgermind.core.core.schemas import MemoryEvent
+
+    memory.config.reflection_chunk_size = 2
+    ids = [memory.episodic.append(MemoryEvent(source="agent", kind="result", content=f"Step {i}"))
+           for i in range(5)]
+    assert memory.reflection_backlog() == 5
+
+    memory.run_reflection(budget_ms=0) # A started chunk always completes
+    assert int(memory.semantic.meta.get_config("last_reflection_event_id")) == ids[1]
+    assert memory.reflection_backlog() == 3
+
+    memory.run_reflection()
+    assert int(memory.semantic.meta.get_config("last_reflection_event_id")) >= ids[-1]
+    assert memory.reflection_backlog() == 0
+
+def test_target_stats_follow_appends(tmp_path):
+    """target_stats is maintained on append, backfilled for older databases and reports ring overflow."""
+    import sqlite3
+    from ledgermind.core.core.schemas import MemoryEvent
+    from ledgermind.core.stores.episodic import EpisodicStore
+
+    db = str(tmp_path / "episodic.db")
+    store = EpisodicStore(db)
+    store.TARGET_RING_SIZE = 3
+    e1 = store.append(MemoryEvent(source="agent", kind="error", content="boom", context={"target": "auth"}))
+    ids = store.append_many([
+        (MemoryEvent(source="agent", kind="result", content="ok", context={"target": "auth"}), None),
+        (MemoryEvent(source="system", kind="commit_change", content="fix(auth): retry token refresh"), None),
+        (MemoryEvent(source="agent", kind="result", content="no target"), None),
+    ])
+
+    stats = store.target_stats_since(None)
+    assert set(stats) == {"auth"}
+    assert (stats["auth"]["errors"], stats["auth"]["successes"], stats["auth"]["commits"]) == (1, 1, 1)
+    assert stats["auth"]["error_ids"] == [e1] and stats["auth"]["commit_ids"] == [ids[1]]
+    assert store.target_stats_since(ids[-1]) == {}
+    assert store.target_stats_since(e1)["auth"]["error_ids"] == []
+
+    for _ in range(4):
+        last = store.append(MemoryEvent(source="agent", kind="error", content="boom", context={"target": "auth"}))
+    assert store.target_stats_since(None) is None # Five errors, ring of three
+    assert store.target_stats_since(last - 1)["auth"]["error_ids"] == [last]
+
+    with sqlite3.connect(db) as conn:
+        conn.execute("DROP TABLE target_stats")
+    rebuilt = EpisodicStore(db).target_stats_since(ids[-1])
+    assert rebuilt["auth"]["errors"] == 5 and len(rebuilt["auth"]["error_ids"]) == 4
+
+def test_append_many_ids_ignore_concurrent_appends(tmp_path):
+    """An append from another connection between reading MAX(id) and inserting is never reported as ours."""
+    import sqlite3
+    from contextlib import contextmanager
+    from ledgermind.core.core.schemas import MemoryEvent
+    from ledgermind.core.stores.episodic import EpisodicStore
+
+    db = str(tmp_path / "episodic.db")
+    store = EpisodicStore(db)
+    get_conn = store._get_conn
+
+    class Interleaving:
+        """Lets another connection append after append_many read MAX(id), before its inserts."""
+        def __init__(self, conn):
+            self.conn = conn
+        def __getattr__(self, name):
+            return getattr(self.conn, name)
+        def __enter__(self):
+            return self.conn.__enter__()
+        def __exit__(self, *exc):
+            return self.conn.__exit__(*exc)
+        def executemany(self, sql, *args):
+            if sql.startswith("INSERT INTO events"):
+                try:
+                    with sqlite3.connect(db, timeout=0.1) as other:
+                        other.execute("INSERT INTO events (source, kind, content, context, timestamp) "
+                                      "VALUES ('agent', 'error', 'intruder', '{\"target\": \"auth\"}', '2000-01-01T00:00:00')")
+                except sqlite3.OperationalError:
+                    pass # Locked out, as it should be
+            return self.conn.executemany(sql, *args)
+
+    @contextmanager
+    def interleaving_conn():
+        with get_conn() as conn:
+            yield Interleaving(conn)
+
+    store._get_conn = interleaving_conn
+    ids = store.append_many([
+        (MemoryEvent(source="agent", kind="result", content=f"ours {i}", context={"target": "auth"}), None) for i in range(2)
+    ])
+    store._get_conn = get_conn
+
+    contents = {e["id"]: e["content"] for e in store.query(limit=10, status=None)}
+    assert [contents[i] for i in ids] == ["ours 0", "ours 1"]
+    assert store.target_stats_since(None)["auth"]["success_ids"] == ids
+
+def test_reflection_reads_target_stats_like_clustering(memory):
+    """Evidence read from target_stats matches clustering the chunk's events."""
+    from ledgermind.core.core.schemas import MemoryEvent
+
+    memory.run_reflection()
+    after_id = int(memory.semantic.meta.get_config("last_reflection_event_id") or 0) or None
+    for i in range(3):
+        memory.episodic.append(MemoryEvent(source="agent", kind="error", content=f"Timeout {i}", context={"target": "db_pool"}))
+    memory.episodic.append(MemoryEvent(source="agent", kind="result", content="Served", context={"target": "cdn_edge"}))
+    memory.episodic.append(MemoryEvent(source="system", kind="commit_change", content="feat(db_pool): bound waits"))
+
+    engine = memory.reflection_engine
+    events = memory.episodic.query(limit=1000, status='active', after_id=after_id, order='ASC')
+    expected = engine._cluster_evidence(events)
+    with patch.object(engine, "_cluster_evidence") as scan:
+        clusters = engine._load_evidence(events, after_id)
+    scan.assert_not_called()
+    assert list(clusters) == list(expected) == ["db_pool", "cdn_edge"]
+    for target, cluster in clusters.items():
+        for key in ("errors", "successes", "commits", "last_seen"):
+            assert cluster[key] == expected[target][key]
+        assert [e['id'] for e in cluster['error_events']] == [e['id'] for e in expected[target]['error_events']]
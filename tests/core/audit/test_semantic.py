@@ -1,5 +1,7 @@
 import pytest
+from unittest.mock import patch
 import os
+import sqlite3
 from ledgermind.core.api.memory import Memory
 from ledgermind.core.stores.semantic_store.integrity import IntegrityViolation
 from ledgermind.core.stores.semantic_store.transitions import TransitionError
@@ -24,6 +26,32 @@ def test_S1_multiple_active_targets(temp_storage):
         Memory(storage_path=temp_storage)
     assert "Multiple active decisions" in str(excinfo.value)
 
+@pytest.mark.parametrize("target,violates", [("", False), ("DB_Target", True)])
+def test_S1b_file_and_index_checkers_agree(tmp_path, target, violates):
+    """S1b: The file scan and the SQL fast path judge I4 alike; target-less records never conflict."""
+    from ledgermind.core.stores.semantic import SemanticStore
+    from ledgermind.core.stores.semantic_store.integrity import IntegrityChecker
+    from ledgermind.core.stores.semantic_store.meta import SemanticMetaStore
+
+    sem_path = str(tmp_path)
+    meta = SemanticMetaStore(os.path.join(sem_path, "semantic_meta.db"))
+    base = {"kind": "decision", "source": "agent", "content": "Valid Content", "timestamp": datetime.now().isoformat()}
+    for i in (1, 2):
+        # Separate namespaces get past the index's uniqueness guard, so the checks decide
+        data = {**base, "context": {"title": f"Title {i}", "target": target, "status": "active", "namespace": f"ns{i}",
+                                    "rationale": f"Rationale {i} is long enough"}}
+        with open(os.path.join(sem_path, f"{i}.md"), "w") as f: f.write(MemoryLoader.stringify(data, f"D{i}"))
+        meta.upsert(**SemanticStore._meta_row(f"{i}.md", data, "fixture"))
+
+    outcomes = []
+    for check in (lambda: IntegrityChecker.validate(sem_path, force=True), lambda: IntegrityChecker.validate_meta(meta)):
+        try:
+            check()
+            outcomes.append(False)
+        except IntegrityViolation:
+            outcomes.append(True)
+    assert outcomes == [violates, violates]
+
 def test_S3_dangling_supersede(temp_storage):
     """S3: Fail-fast on dangling reference."""
     sem_path = os.path.join(temp_storage, "semantic")
@@ -86,3 +114,606 @@ def test_T1_immutable_fields(memory):
     with pytest.raises(TransitionError):
 
         memory.semantic.update_decision(fid, {"target": "NEW_TARGET_AREA"}, "Illegal update rationale string")
+
+def test_S5_meta_invariants_match_file_checker(tmp_path):
+    """S5: SQL invariant checks over the metastore report I3, I4 and I5 violations."""
+    import json
+    from ledgermind.core.stores.semantic_store.meta import SemanticMetaStore
+    from ledgermind.core.stores.semantic_store.integrity import IntegrityChecker
+
+    meta = SemanticMetaStore(str(tmp_path / "meta.db"))
+    ts = datetime.now()
+    meta.upsert("a.md", "T_one", "superseded", "decision", ts, superseded_by="b.md")
+    meta.upsert("b.md", "T_one", "active", "decision", ts, context_json=json.dumps({"supersedes": ["a.md"]}))
+    IntegrityChecker.validate_meta(meta)
+
+    # I3: broken backlink
+    meta.upsert("b.md", "T_one", "active", "decision", ts, context_json="{}")
+    with pytest.raises(IntegrityViolation, match="Broken backlink"):
+        IntegrityChecker.validate_meta(meta)
+
+    # I5: cycle a -> b -> a
+    meta.upsert("b.md", "T_one", "superseded", "decision", ts, superseded_by="a.md",
+                context_json=json.dumps({"supersedes": ["a.md"]}))
+    meta.upsert("a.md", "T_one", "superseded", "decision", ts, superseded_by="b.md",
+                context_json=json.dumps({"supersedes": ["b.md"]}))
+    with pytest.raises(IntegrityViolation, match="Cycle detected"):
+        IntegrityChecker.validate_meta(meta)
+
+    # I4: multiple active decisions across namespaces
+    meta.clear()
+    meta.upsert("c.md", "T_two", "active", "decision", ts, namespace="ns1")
+    meta.upsert("d.md", "T_two", "active", "decision", ts, namespace="ns2")
+    with pytest.raises(IntegrityViolation, match="Multiple active decisions"):
+        IntegrityChecker.validate_meta(meta)
+
+def test_S6_maintenance_crosscheck(memory):
+    """S6: Maintenance cross-checks the metastore against the files on disk."""
+    memory.record_decision(title="Base", target="TargetArea", rationale="Base rationale string")
+    report = memory.run_maintenance()
+    assert report["integrity"] == "ok"
+    assert report["integrity_crosscheck"] == "ok"
+
+def test_S7_parse_cache_is_bounded_and_per_repo(memory, tmp_path):
+    """S7: Parse cache evicts under its byte budget and serves fresh data after edits."""
+    from ledgermind.core.stores.semantic_store.cache import ParseCache
+
+    base = {"kind": "decision", "source": "agent", "content": "Cached", "timestamp": datetime.now().isoformat()}
+    for i in range(5):
+        ctx = {"title": f"T{i}", "target": f"target_{i}", "status": "active", "rationale": "Rationale long enough"}
+        (tmp_path / f"{i}.md").write_text(MemoryLoader.stringify({**base, "context": ctx}, "x" * 200))
+
+    cache = ParseCache(str(tmp_path), max_bytes=2000)
+    for i in range(5):
+        cache.get(f"{i}.md")
+    assert cache.stats()["bytes"] <= 2000
+    assert cache.stats()["entries"] < 5
+
+    data, _ = cache.get("4.md")
+    assert cache.hits == 1
+    (tmp_path / "4.md").write_text(MemoryLoader.stringify({**base, "context": {**data["context"], "title": "Edited"}}))
+    assert cache.get("4.md")[0]["context"]["title"] == "Edited"
+
+    os.remove(tmp_path / "4.md")
+    with pytest.raises(OSError):
+        cache.get("4.md")
+    assert memory.semantic.parse_cache is not cache
+
+def test_S8_json_frontmatter_roundtrip(temp_storage):
+    """S8: JSON frontmatter is written on opt-in, stays valid YAML and updates cleanly."""
+    import yaml
+    from ledgermind.core.core.schemas import LedgermindConfig, ProposalStatus
+
+    mem = Memory(config=LedgermindConfig(storage_path=temp_storage, frontmatter_format="json"))
+    fid = mem.record_decision(title="Json", target="TargetArea", rationale="Json frontmatter rationale").metadata["file_id"]
+    mem.semantic.update_decision(fid, {"confidence": 0.7, "status": "deprecated"}, "Lower confidence for test")
+
+    with open(os.path.join(mem.semantic.repo_path, fid)) as f:
+        raw = f.read()
+    assert raw.startswith("---\n{")
+    front = raw.split("---\n")[1]
+    assert yaml.safe_load(front)["context"]["confidence"] == 0.7
+    assert MemoryLoader.parse(raw)[0]["context"]["status"] == "deprecated"
+
+    # Enum values are written as plain scalars in YAML mode
+    content = MemoryLoader.stringify({"context": {"status": ProposalStatus.FALSIFIED}})
+    assert MemoryLoader.parse(content)[0]["context"]["status"] == "falsified"
+
+@pytest.mark.parametrize("fmt", [MemoryLoader.FORMAT_YAML, MemoryLoader.FORMAT_JSON])
+def test_S8b_tuples_and_sets_roundtrip_as_lists(fmt):
+    """S8b: Tuples and sets in frontmatter are written as lists instead of failing the safe dumper."""
+    data = {"context": {
+        "consequences": ("first", "second"),
+        "keywords": {"gamma", "alpha", "beta"},
+        "tags": frozenset({"x"}),
+        "nested": [{"pair": (1, 2)}],
+    }}
+    content = MemoryLoader.stringify(data, "Body", fmt=fmt)
+    parsed, body = MemoryLoader.parse(content)
+    assert body == "Body"
+    assert parsed["context"] == {
+        "consequences": ["first", "second"],
+        "keywords": ["alpha", "beta", "gamma"],
+        "tags": ["x"],
+        "nested": [{"pair": [1, 2]}],
+    }
+
+def test_S9_transaction_rollback_restores_hardlinked_originals(memory):
+    """S9: Rollback restores originals from copy-free backups and removes new files."""
+    fid = memory.record_decision(title="Tx", target="TxTarget", rationale="Transaction rollback rationale").metadata["file_id"]
+    path = os.path.join(memory.semantic.repo_path, fid)
+    with open(path) as f: original = f.read()
+
+    with pytest.raises(RuntimeError):
+        with memory.semantic.transaction():
+            memory.semantic.update_decision(fid, {"confidence": 0.3}, "Lower confidence")
+            backup = os.path.join(memory.semantic.repo_path, ".tx_backup", "0.bak")
+            assert os.path.exists(backup)
+            with open(backup) as f: assert f.read() == original
+            raise RuntimeError("abort")
+
+    with open(path) as f: assert f.read() == original
+    assert os.listdir(os.path.join(memory.semantic.repo_path, ".tx_backup")) == []
+
+def test_S10_interrupted_transaction_recovered_on_startup(memory):
+    """S10: A journal left by a crashed transaction is rolled back when the store reopens."""
+    from ledgermind.core.stores.semantic_store.transactions import TransactionManager
+
+    semantic = memory.semantic
+    fid = memory.record_decision(title="Crash", target="CrashTarget", rationale="Crash recovery rationale").metadata["file_id"]
+    with open(os.path.join(semantic.repo_path, fid)) as f: original = f.read()
+
+    # Simulate a process dying mid-transaction: staged writes without commit or rollback
+    tx = TransactionManager(semantic.repo_path, semantic.meta)
+    tx.write_file(fid, original.replace("Crash recovery rationale", "Half-written rationale"))
+    tx.write_file("orphan.md", "---\n{}\n---\n")
+    semantic.audit.run(["add", "--", "orphan.md"])
+    tx._journal.close()
+
+    reopened = Memory(storage_path=memory.storage_path)
+    with open(os.path.join(reopened.semantic.repo_path, fid)) as f: assert f.read() == original
+    assert not os.path.exists(os.path.join(reopened.semantic.repo_path, "orphan.md"))
+    assert TransactionManager.recover(reopened.semantic.repo_path) == []
+
+def test_S10b_crash_after_commit_keeps_transaction(memory):
+    """S10b: A crash after the commit point leaves backups that recovery discards instead of replaying."""
+    from ledgermind.core.stores.semantic_store.transactions import TransactionManager
+
+    semantic = memory.semantic
+    fid = memory.record_decision(title="Durable", target="DurableTarget", rationale="Durable commit rationale").metadata["file_id"]
+
+    def crash(self):
+        self.lock.release() # The dying process drops its lock
+        raise RuntimeError("crash while discarding backups")
+
+    with patch.object(TransactionManager, "_discard_backups", crash):
+        with pytest.raises(RuntimeError):
+            with semantic.transaction("Lower confidence"):
+                semantic.update_decision(fid, {"confidence": 0.42}, "Lower confidence")
+    assert os.listdir(os.path.join(semantic.repo_path, ".tx_backup"))
+
+    reopened = Memory(storage_path=memory.storage_path)
+    data, _ = MemoryLoader.parse(open(os.path.join(reopened.semantic.repo_path, fid)).read())
+    assert data["context"]["confidence"] == 0.42
+    assert reopened.semantic.meta.get_by_fid(fid)["confidence"] == 0.42
+    assert reopened.semantic.audit.run(["status", "--porcelain", "--untracked-files=no"]).stdout.decode().strip() == ""
+    assert os.listdir(os.path.join(reopened.semantic.repo_path, ".tx_backup")) == []
+
+def test_S10c_crash_after_git_commit_is_reverted(memory):
+    """S10c: A crash between the Git commit and the SQLite commit is undone in Git as well."""
+    from ledgermind.core.core.schemas import MemoryEvent
+    from ledgermind.core.stores.semantic_store.transactions import TransactionManager
+
+    class Crash(BaseException):
+        pass
+
+    semantic = memory.semantic
+    fid = memory.record_decision(title="Landed", target="LandedTarget", rationale="Landed commit rationale").metadata["file_id"]
+    with open(os.path.join(semantic.repo_path, fid)) as f: original = f.read()
+    head = semantic.get_head_hash()
+
+    def die(self):
+        raise Crash()
+    def dead(self):
+        self._journal.close() # The dying process leaves its journal and backups behind
+        self.lock.release()
+
+    with patch.object(type(semantic), "_stamp_history", die), patch.object(TransactionManager, "_discard_backups", dead):
+        with pytest.raises(Crash):
+            with semantic.transaction("Landed then crashed"):
+                semantic.update_decision(fid, {"confidence": 0.42}, "Lower confidence")
+                new_fid = semantic.save(MemoryEvent(source="agent", kind="decision", content="Lost",
+                                                    context={"title": "Lost", "target": "LostTarget", "rationale": "Never committed to SQLite"}))
+    semantic.meta._conn.rollback()
+    assert semantic.get_head_hash() != head # Git committed, SQLite did not
+
+    reopened = Memory(storage_path=memory.storage_path)
+    git = reopened.semantic.audit
+    with open(os.path.join(reopened.semantic.repo_path, fid)) as f: assert f.read() == original
+    assert not os.path.exists(os.path.join(reopened.semantic.repo_path, new_fid))
+    assert git.run(["show", f"HEAD:{fid}"]).stdout.decode() == original
+    assert new_fid not in git.run(["ls-tree", "--name-only", "HEAD"]).stdout.decode()
+    assert git.run(["log", "-1", "--format=%s"]).stdout.decode().strip() == "Recovery: Revert interrupted transaction"
+    assert git.run(["status", "--porcelain", "--untracked-files=no"]).stdout.decode().strip() == ""
+    assert reopened.semantic.meta.get_by_fid(fid)["confidence"] != 0.42
+    assert reopened.semantic.meta.get_by_fid(new_fid) is None
+
+def test_S10d_failure_after_git_commit_is_reverted(memory):
+    """S10d: A transaction failing after its Git commit leaves HEAD matching the rolled-back files."""
+    semantic = memory.semantic
+    fid = memory.record_decision(title="Reverted", target="RevertedTarget", rationale="Reverted commit rationale").metadata["file_id"]
+    with open(os.path.join(semantic.repo_path, fid)) as f: original = f.read()
+
+    with patch.object(type(semantic), "_stamp_history", side_effect=RuntimeError("history failed")):
+        with pytest.raises(RuntimeError):
+            with semantic.transaction("Doomed update"):
+                semantic.update_decision(fid, {"confidence": 0.42}, "Lower confidence")
+
+    with open(os.path.join(semantic.repo_path, fid)) as f: assert f.read() == original
+    assert semantic.audit.run(["show", f"HEAD:{fid}"]).stdout.decode() == original
+    assert semantic.audit.run(["log", "-1", "--format=%s"]).stdout.decode().strip() == "Revert failed transaction: Doomed update"
+
+def test_S11_nested_transactions_commit_once(memory):
+    """S11: Nested transactions share one lock and produce a single Git commit."""
+    semantic = memory.semantic
+    head_before = semantic.get_head_hash()
+    count = lambda: int(semantic.audit.run(["rev-list", "--count", "HEAD"]).stdout.decode().strip())
+    commits_before = count()
+
+    with semantic.transaction():
+        outer_tx = semantic._current_tx
+        memory.record_decision(title="Outer", target="NestedA", rationale="Outer decision rationale")
+        with semantic.transaction():
+            assert semantic._current_tx is outer_tx and outer_tx.depth == 2
+            memory.record_decision(title="Inner", target="NestedB", rationale="Inner decision rationale")
+
+    assert count() == commits_before + 1
+    assert semantic.get_head_hash() != head_before
+    assert len(semantic.meta.list_all()) == 2
+
+def test_S12_failed_savepoint_rolls_back_inner_scope_only(memory):
+    """S12: An error in a nested scope undoes only that scope's files, rows and index entries."""
+    semantic = memory.semantic
+    with semantic.transaction():
+        kept = memory.record_decision(title="Kept", target="KeptTarget", rationale="Kept decision rationale").metadata["file_id"]
+        with pytest.raises(RuntimeError):
+            with semantic.transaction():
+                memory.semantic.update_decision(kept, {"confidence": 0.2}, "Inner change")
+                dropped = memory.record_decision(title="Dropped", target="DroppedTarget", rationale="Dropped decision rationale").metadata["file_id"]
+                raise RuntimeError("abort inner")
+
+    assert not os.path.exists(os.path.join(semantic.repo_path, dropped))
+    assert semantic.meta.get_by_fid(dropped) is None
+    data, _ = MemoryLoader.parse(open(os.path.join(semantic.repo_path, kept)).read())
+    assert data["context"].get("confidence", 1.0) != 0.2
+    assert dropped not in semantic.audit.run(["ls-files"]).stdout.decode()
+    assert semantic.audit.run(["status", "--porcelain", "--untracked-files=no"]).stdout.decode().strip() == ""
+
+def test_S12b_failed_savepoint_leaves_no_events_or_vectors(memory):
+    """S12b: Episodic links and vector entries from a rolled-back scope are never written."""
+    from ledgermind.core.core.schemas import ProposalContent
+
+    semantic = memory.semantic
+    indexed = []
+    memory.vector.add_documents = lambda docs: indexed.extend(d["id"] for d in docs)
+    prop = ProposalContent(title="Adopt queue", target="QueueTarget", rationale="Queues smooth out bursts of load", confidence=0.8)
+    proposal = memory.process_event(source="reflection_engine", kind="proposal", content=prop.title, context=prop).metadata["file_id"]
+    update_decision = semantic.update_decision
+
+    def failing_update(fid, *args, **kwargs):
+        if fid == proposal:
+            raise RuntimeError("proposal update failed")
+        return update_decision(fid, *args, **kwargs)
+
+    with semantic.transaction():
+        kept = memory.record_decision(title="Kept", target="KeptTarget", rationale="Kept decision rationale")
+        with patch.object(semantic, "update_decision", failing_update), pytest.raises(RuntimeError):
+            memory.accept_proposal(proposal)
+        assert "event_id" not in kept.metadata # Deferred until the outer commit
+
+    kept = kept.metadata["file_id"]
+    assert {row["fid"] for row in semantic.meta.list_all()} == {kept, proposal}
+    linked = {e["linked_id"] for e in memory.episodic.query(limit=100, status=None)}
+    assert kept in linked and proposal in linked
+    assert len(linked) == 2
+    assert indexed == [proposal, kept]
+
+def test_S13_group_commit_coalesces_writes(temp_storage):
+    """S13: Writes within the group-commit window land in one Git commit; the journal survives a crash."""
+    import time
+    from ledgermind.core.core.schemas import LedgermindConfig
+
+    mem = Memory(config=LedgermindConfig(storage_path=temp_storage, git_group_commit_ms=60_000))
+    audit = mem.semantic.audit
+    count = lambda: int(audit.run(["rev-list", "--count", "HEAD"]).stdout.decode().strip())
+    commits_before = count()
+
+    fids = [mem.record_decision(title=f"Group {i}", target=f"Group{i}", rationale=f"Group commit rationale {i}").metadata["file_id"] for i in range(3)]
+    assert count() == commits_before and audit.pending_count == 3
+    assert len(mem.semantic.meta.list_all()) == 3
+
+    # A new process (e.g. after a crash) drains the journal on startup
+    audit._pending.clear()
+    reopened = Memory(config=LedgermindConfig(storage_path=temp_storage, git_group_commit_ms=60_000))
+    assert count() == commits_before + 1
+    assert reopened.semantic.audit.pending_count == 0
+    tracked = audit.run(["ls-files"]).stdout.decode()
+    assert all(fid in tracked for fid in fids)
+    assert "Group commit: 3 changes" in audit.run(["log", "-1", "--format=%B"]).stdout.decode()
+
+    # The background flusher commits once the window elapses
+    reopened.semantic.audit.group_commit_ms = 20
+    reopened.record_decision(title="Late", target="LateTarget", rationale="Late group commit rationale")
+    deadline = time.time() + 10
+    while count() < commits_before + 2 and time.time() < deadline:
+        time.sleep(0.05)
+    assert count() == commits_before + 2
+
+def test_S13b_group_commit_history_hash_and_close(temp_storage):
+    """S13b: History rows written under group commit receive the hash once flushed; close() commits the tail."""
+    from ledgermind.core.core.schemas import LedgermindConfig
+
+    mem = Memory(config=LedgermindConfig(storage_path=temp_storage, git_group_commit_ms=60_000))
+    audit = mem.semantic.audit
+    fid = mem.record_decision(title="Grouped", target="GroupedTarget", rationale="Grouped history rationale").metadata["file_id"]
+    assert mem.semantic.meta.get_history(fid)[0]["hash"] is None
+    audit.flush()
+    assert mem.semantic.meta.get_history(fid)[0]["hash"] == audit.get_head_hash()
+
+    mem.semantic.update_decision(fid, {"confidence": 0.6}, "Lower confidence")
+    flusher = audit._flusher
+    assert flusher.is_alive() and audit.pending_count == 1
+    mem.close()
+    assert not flusher.is_alive() and audit.pending_count == 0
+    assert audit.run(["log", "-1", "--format=%s"]).stdout.decode().strip() == "Lower confidence"
+    assert mem.semantic.meta.get_history(fid)[0]["hash"] == audit.get_head_hash()
+
+def test_S14_fast_import_audit_provider(temp_storage):
+    """S14: The fast-import backend records, supersedes and purges with a consistent repo after checkpoint."""
+    from ledgermind.core.core.schemas import LedgermindConfig
+    from ledgermind.core.stores.audit_fast_import import FastImportAuditProvider
+
+    mem = Memory(config=LedgermindConfig(storage_path=temp_storage, audit_backend="fast-import"))
+    audit = mem.semantic.audit
+    assert isinstance(audit, FastImportAuditProvider)
+
+    old = mem.record_decision(title="Fast", target="FastTarget", rationale="Fast import rationale").metadata["file_id"]
+    new = mem.supersede_decision(title="Faster", target="FastTarget", rationale="Supersedes via fast import", old_decision_ids=[old]).metadata["file_id"]
+    tmp = mem.record_decision(title="Gone", target="GoneTarget", rationale="Decision to be purged").metadata["file_id"]
+    mem.forget(tmp)
+    head = audit.get_head_hash()
+
+    # Plain git commands see everything once state is published
+    assert audit.run(["rev-parse", "HEAD"]).stdout.decode().strip() == head
+    tracked = audit.run(["ls-files"]).stdout.decode()
+    assert old in tracked and new in tracked and tmp not in tracked
+    assert audit.run(["status", "--porcelain", "--untracked-files=no"]).stdout.decode().strip() == ""
+    assert len(mem.get_decision_history(old)) >= 2
+
+    # Commits made through the git CLI are respected by later streamed commits
+    audit.run(["commit", "--allow-empty", "-m", "External"])
+    mem.record_decision(title="After", target="AfterTarget", rationale="Recorded after an external commit")
+    audit.flush()
+    log = audit.run(["log", "--format=%s", "-3"]).stdout.decode()
+    assert "External" in log
+
+def test_S15_async_audit_queue(temp_storage):
+    """S15: Async audit queues commits durably in SQLite, reads history through the queue and drains in order."""
+    from ledgermind.core.core.schemas import LedgermindConfig
+    from ledgermind.core.stores.audit_async import AsyncAuditProvider
+
+    mem = Memory(config=LedgermindConfig(storage_path=temp_storage, async_audit=True))
+    audit = mem.semantic.audit
+    assert isinstance(audit, AsyncAuditProvider)
+    audit._stopped.set() # Park the committer so the queue can be inspected
+    audit._wakeup.set()
+    audit._committer.join(timeout=5)
+
+    git = mem.semantic._git
+    count = lambda: int(git.run(["rev-list", "--count", "HEAD"]).stdout.decode().strip())
+    commits_before = count()
+
+    fid = mem.record_decision(title="Async", target="AsyncTarget", rationale="Async audit rationale").metadata["file_id"]
+    mem.semantic.update_decision(fid, {"confidence": 0.6}, "Lower confidence")
+    assert count() == commits_before
+    assert audit.stats()["depth"] == 2
+
+    history = mem.get_decision_history(fid)
+    assert [h["message"] for h in history[:2]] == ["Lower confidence", "Add decision: Async"]
+    assert all(h["pending"] and h["hash"] is None for h in history[:2])
+
+    # Queue rows are committed in SQLite: a fresh store drains them on startup
+    reopened = Memory(config=LedgermindConfig(storage_path=temp_storage, async_audit=True))
+    assert reopened.semantic.audit.stats()["depth"] == 0
+    assert count() == commits_before + 2
+    log = git.run(["log", "--format=%s", "-2"]).stdout.decode().split("\n")
+    assert log[:2] == ["Lower confidence", "Atomic Transaction Commit"]
+    history = reopened.get_decision_history(fid)
+    assert not any(h["pending"] for h in history)
+    assert history[0]["hash"] == git.run(["rev-parse", "HEAD"]).stdout.decode().strip()
+    reopened.close()
+
+def test_S15b_async_audit_failed_write_leaves_no_queue_entry(temp_storage):
+    """S15b: A direct write that fails after queueing its audit op leaves neither queue row nor history; async repos report healthy."""
+    from ledgermind.core.core.schemas import LedgermindConfig, MemoryEvent
+    from ledgermind.core.stores.audit_async import AUDIT_QUEUE_DEPTH
+
+    mem = Memory(config=LedgermindConfig(storage_path=temp_storage, async_audit=True))
+    audit = mem.semantic.audit
+    audit._stopped.set() # Park the committer
+    audit._wakeup.set()
+    audit._committer.join(timeout=5)
+    assert mem.check_environment()["repo_healthy"]
+
+    fid = mem.record_decision(title="Queued", target="QueuedTarget", rationale="Queued audit rationale").metadata["file_id"]
+    depth, gauge, versions = audit.stats()["depth"], AUDIT_QUEUE_DEPTH._value.get(), len(mem.get_decision_history(fid))
+    event = MemoryEvent(source="agent", kind="decision", content="Doomed",
+                        context={"title": "Doomed", "target": "DoomedTarget", "rationale": "Write that fails after queueing"})
+    with patch.object(mem.semantic, "_stamp_history", side_effect=RuntimeError("stamp failed")):
+        with pytest.raises(RuntimeError):
+            mem.semantic.save(event)
+        with pytest.raises(RuntimeError):
+            mem.semantic.update_decision(fid, {"confidence": 0.3}, "Doomed update")
+
+    mem.semantic.meta.commit()
+    assert audit.stats()["depth"] == depth
+    assert AUDIT_QUEUE_DEPTH._value.get() == gauge
+    assert len(mem.get_decision_history(fid)) == versions
+    assert mem.semantic.meta.get_by_fid(fid)["confidence"] != 0.3
+    assert [m["target"] for m in mem.semantic.meta.list_all()] == ["QueuedTarget"]
+
+def test_S15c_async_audit_retry_after_failed_ack_commits_once(temp_storage):
+    """S15c: An entry committed to Git but not acknowledged is not committed again on retry or restart."""
+    from ledgermind.core.core.schemas import LedgermindConfig
+
+    mem = Memory(config=LedgermindConfig(storage_path=temp_storage, async_audit=True))
+    audit = mem.semantic.audit
+    audit._stopped.set() # Park the committer and drain by hand
+    audit._wakeup.set()
+    audit._committer.join(timeout=5)
+    git = mem.semantic._git
+    count = lambda: int(git.run(["rev-list", "--count", "HEAD"]).stdout.decode().strip())
+    commits_before = count()
+
+    def locked(entry_id, conn=None):
+        conn.rollback() # As `with conn:` does when the DELETE fails
+        raise sqlite3.OperationalError("database is locked")
+
+    fid = mem.record_decision(title="Once", target="OnceTarget", rationale="Committed exactly once").metadata["file_id"]
+    with patch.object(mem.semantic.meta, "ack_audit", side_effect=locked):
+        with pytest.raises(sqlite3.OperationalError):
+            audit.drain()
+    assert count() == commits_before + 1 and audit.stats()["depth"] == 1
+
+    assert audit.drain() == 1
+    assert count() == commits_before + 1 and audit.stats()["depth"] == 0
+    assert mem.get_decision_history(fid)[0]["hash"] == git.get_head_hash()
+
+    # A restarted process checks HEAD before applying its first entry
+    mem.semantic.update_decision(fid, {"confidence": 0.5}, "Lower confidence")
+    with patch.object(mem.semantic.meta, "ack_audit", side_effect=locked):
+        with pytest.raises(sqlite3.OperationalError):
+            audit.drain()
+    audit._check_head = False # As in a fresh process, which only knows to check from startup
+    reopened = Memory(config=LedgermindConfig(storage_path=temp_storage, async_audit=True))
+    reopened.semantic.audit.flush()
+    assert count() == commits_before + 2 and reopened.semantic.audit.stats()["depth"] == 0
+    assert "Ledgermind-Audit-Id:" in git.run(["log", "-1", "--format=%B"]).stdout.decode()
+
+def test_S16_history_table(memory):
+    """S16: History is served from SQLite with keyset pagination, as-of lookups and target timelines, and rebuilds from Git."""
+    import time
+    from datetime import datetime
+
+    fid = memory.record_decision(title="Hist", target="HistTarget", rationale="History table rationale").metadata["file_id"]
+    memory.semantic.update_decision(fid, {"confidence": 0.7}, "Lower confidence")
+    time.sleep(0.01)
+    checkpoint = datetime.now()
+    time.sleep(0.01)
+    memory.semantic.update_decision(fid, {"confidence": 0.5}, "Lower confidence again")
+    memory.semantic.update_decision(fid, {"confidence": 0.5}, "No-op update") # Nothing changed: no version
+
+    history = memory.get_decision_history(fid)
+    assert [h["message"] for h in history[:2]] == ["Lower confidence again", "Lower confidence"]
+    assert history[0]["changed_fields"] == ["confidence"]
+    assert history[0]["context"]["confidence"] == 0.5
+    assert "target" in history[-1]["changed_fields"]
+    head = memory.semantic.get_head_hash()
+    assert history[0]["hash"] == head and not history[0]["pending"]
+
+    page = memory.get_decision_history(fid, limit=1)
+    rest = memory.get_decision_history(fid, limit=100, before=page[0]["id"])
+    assert [h["id"] for h in page + rest] == [h["id"] for h in history]
+
+    as_of = memory.get_decision_as_of(fid, checkpoint)
+    assert as_of["message"] == "Lower confidence" and as_of["context"]["confidence"] == 0.7
+    assert memory.get_decision_as_of(fid, "2000-01-01T00:00:00") is None
+
+    other = memory.supersede_decision(title="Hist 2", target="HistTarget", rationale="Second decision on the target", old_decision_ids=[fid]).metadata["file_id"]
+    timeline = memory.get_target_timeline("HistTarget")
+    assert {h["fid"] for h in timeline[:2]} == {fid, other}
+    assert timeline[0]["fid"] == fid and timeline[0]["status"] == "superseded"
+    head = memory.semantic.get_head_hash()
+
+    # Git remains authoritative: the table can be rebuilt from the audit log
+    # (at commit granularity: writes inside one transaction share a commit)
+    versions = memory.get_decision_history(fid, limit=100)
+    memory.semantic.meta._conn.execute("DELETE FROM semantic_history")
+    assert memory.get_decision_history(fid) == []
+    assert memory.rebuild_history() > 0
+    rebuilt = memory.get_decision_history(fid, limit=100)
+    assert [h["hash"] for h in rebuilt] == list(dict.fromkeys(h["hash"] for h in versions))
+    assert rebuilt[0]["hash"] == head and rebuilt[0]["context"] == versions[0]["context"]
+
+    memory.forget(other)
+    assert {h["fid"] for h in memory.get_target_timeline("HistTarget")} == {fid}
+
+def test_S16a_resync_keeps_history(memory):
+    """S16a: Dropping an orphaned index row keeps the record's history; only purge/forget erases it."""
+    semantic = memory.semantic
+    kept = memory.record_decision(title="Orphan", target="OrphanTarget", rationale="Orphaned record rationale").metadata["file_id"]
+    gone = memory.record_decision(title="Purged", target="PurgedTarget", rationale="Purged record rationale").metadata["file_id"]
+    rows = lambda fid: semantic.meta._conn.execute("SELECT COUNT(*) FROM semantic_history WHERE fid = ?", (fid,)).fetchone()[0]
+    assert rows(kept) and rows(gone)
+
+    os.remove(os.path.join(semantic.repo_path, kept))
+    semantic.sync_meta_index()
+    assert semantic.meta.get_by_fid(kept) is None
+    assert rows(kept) > 0
+
+    memory.forget(gone)
+    assert rows(gone) == 0
+
+def test_S16b_rebuild_history_flushes_group_commit(temp_storage, monkeypatch):
+    """S16b: Rebuilding history with a group commit pending flushes it under the held lock instead of deadlocking."""
+    from ledgermind.core.core.schemas import LedgermindConfig
+    from ledgermind.core.stores.semantic_store.transactions import FileSystemLock
+
+    mem = Memory(config=LedgermindConfig(storage_path=temp_storage, git_group_commit_ms=60_000))
+    fid = mem.record_decision(title="Pending", target="PendingTarget", rationale="Pending group commit rationale").metadata["file_id"]
+    assert mem.semantic.audit.pending_count == 1
+
+    monkeypatch.setattr(FileSystemLock.__init__, "__defaults__", (1,)) # A self-deadlock fails fast
+    assert mem.rebuild_history() > 0
+    assert mem.semantic.audit.pending_count == 0
+    assert mem.get_decision_history(fid)[0]["hash"] == mem.semantic.get_head_hash()
+    mem.close()
+
+def test_S17_cached_head_hash(memory, monkeypatch):
+    """S17: HEAD is tracked in-process and revalidated by stat; steady-state checks spawn no subprocesses."""
+    import subprocess
+    git = memory.semantic._git
+    rev_parse = lambda: git.run(["rev-parse", "HEAD"]).stdout.decode().strip()
+
+    memory.record_decision(title="Head", target="HeadTarget", rationale="Head hash cache rationale")
+    assert memory.semantic.get_head_hash() == rev_parse()
+    memory.check_environment()
+
+    spawned = []
+    real_run, real_popen = subprocess.run, subprocess.Popen
+    monkeypatch.setattr(subprocess, "run", lambda *a, **kw: spawned.append(a) or real_run(*a, **kw))
+    monkeypatch.setattr(subprocess, "Popen", lambda *a, **kw: spawned.append(a) or real_popen(*a, **kw))
+    head = memory.semantic.get_head_hash()
+    for _ in range(3):
+        assert memory.semantic.get_head_hash() == head
+        memory.check_environment()
+    assert spawned == []
+    monkeypatch.undo()
+
+    # Commits made outside the provider, detached HEADs and packed refs are picked up
+    git.run(["commit", "--allow-empty", "-m", "External"])
+    assert memory.semantic.get_head_hash() == rev_parse() != head
+    git.run(["pack-refs", "--all"])
+    assert memory.semantic.get_head_hash() == rev_parse()
+    git.run(["checkout", "-q", "--detach", head])
+    assert memory.semantic.get_head_hash() == head
+
+def test_S18_git_maintenance(memory):
+    """S18: Maintenance packs loose objects past the thresholds and yields to writers holding the lock."""
+    import os
+    from ledgermind.core.stores.semantic_store.transactions import FileSystemLock
+
+    for i in range(3):
+        memory.record_decision(title=f"Pack {i}", target=f"PackTarget{i}", rationale="Maintenance rationale text")
+    git = memory.semantic._git
+    before = git.object_stats()["count"]
+
+    # Below the thresholds nothing runs
+    assert git.maintain(loose_threshold=before + 1, pack_threshold=1000)["actions"] == []
+
+    writer = FileSystemLock(os.path.join(memory.semantic.repo_path, ".lock"))
+    writer.acquire(exclusive=True)
+    try:
+        report = git.maintain(loose_threshold=1)
+    finally:
+        writer.release()
+    assert report["skipped"] == "locked" and report["actions"] == []
+    assert git.maintain(loose_threshold=1, should_stop=lambda: True)["skipped"] == "stopped"
+
+    report = git.maintain(loose_threshold=1, pack_threshold=1000)
+    assert report["actions"] == ["repack", "commit_graph", "prune"]
+    assert report["loose_objects"] < before and report["packs"] >= 1
+    report = git.maintain(loose_threshold=10 ** 6, pack_threshold=1)
+    assert report["actions"] == ["geometric_repack", "commit_graph", "prune"]
+    assert git.run(["fsck", "--no-progress"]).returncode == 0
+    memory.record_decision(title="After pack", target="PackTarget9", rationale="Writes continue after maintenance")
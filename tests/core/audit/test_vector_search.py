@@ -85,3 +85,200 @@ def test_memory_vector_search_fallback(temp_storage, monkeypatch):
     assert len(results) > 0
     assert results[0]["title"] == "Keyword Test"
     assert results[0]["score"] == 0.55
+
+def test_search_retrievers_run_concurrently_with_deadline(temp_storage):
+    """Vector and keyword retrieval overlap; a retriever past the deadline is dropped and reported."""
+    import time
+    from ledgermind.core.core.schemas import LedgermindConfig
+
+    memory = Memory(config=LedgermindConfig(storage_path=temp_storage, search_deadline_ms=300))
+    fid = memory.record_decision("Concurrent retrieval", "search_target", "Keyword and vector retrievers overlap").metadata["file_id"]
+    keyword_search = memory.semantic.meta.keyword_search
+
+    def slow_keyword(*args, **kwargs):
+        time.sleep(0.2)
+        return keyword_search(*args, **kwargs)
+
+    def slow_vector(query, limit=5):
+        time.sleep(0.2)
+        return [{"id": fid, "score": 0.9}]
+
+    memory.semantic.meta.keyword_search = slow_keyword
+    memory.vector.search = slow_vector
+    start = time.monotonic()
+    results = memory.search_decisions("retrievers overlap", limit=3)
+    assert time.monotonic() - start < 0.35 # Overlapped, not 0.4s
+    assert results[0]["id"] == fid and results[0]["retrievers"] == ["vector", "keyword"]
+
+    def stuck_vector(query, limit=5):
+        time.sleep(1.0)
+        return [{"id": fid, "score": 0.9}]
+
+    memory.vector.search = stuck_vector
+    start = time.monotonic()
+    results = memory.search_decisions("retrievers overlap", limit=3, bypass_cache=True)
+    assert time.monotonic() - start < 0.6
+    assert results[0]["id"] == fid and results[0]["retrievers"] == ["keyword"]
+    memory.close()
+
+def test_search_blocked_retriever_does_not_starve_later_searches(temp_storage):
+    """A retriever stuck past the deadline neither holds a worker nor blocks the next search."""
+    import threading
+    import time
+    from ledgermind.core.core.schemas import LedgermindConfig
+
+    memory = Memory(config=LedgermindConfig(storage_path=temp_storage, search_deadline_ms=300))
+    fid = memory.record_decision("Blocked retrieval", "search_target", "One retriever hangs across searches").metadata["file_id"]
+    release = threading.Event()
+    calls = []
+
+    def blocked_vector(query, limit=5):
+        calls.append(query)
+        release.wait(10)
+        return [{"id": fid, "score": 0.9}]
+
+    memory.vector.search = blocked_vector
+    try:
+        for _ in range(2):
+            start = time.monotonic()
+            results = memory.search_decisions("retriever hangs", limit=3, bypass_cache=True)
+            assert time.monotonic() - start < 0.6
+            assert results[0]["id"] == fid and results[0]["retrievers"] == ["keyword"]
+        assert len(calls) == 1 # The stuck call is not started again while it runs
+    finally:
+        release.set()
+
+    memory.vector.search = lambda query, limit=5: [{"id": fid, "score": 0.9}]
+    for _ in range(50):
+        if memory._abandoned_retrievers["vector"].done():
+            break
+        time.sleep(0.01)
+    results = memory.search_decisions("retriever hangs", limit=3, bypass_cache=True)
+    assert results[0]["retrievers"] == ["vector", "keyword"]
+    memory.close()
+
+def test_search_cache_invalidated_by_generation(temp_storage):
+    """Repeated searches are served from cache until a write or another connection changes the store."""
+    from ledgermind.core.core.schemas import LedgermindConfig
+    from ledgermind.core.stores.semantic_store.meta import SemanticMetaStore
+
+    memory = Memory(config=LedgermindConfig(storage_path=temp_storage))
+    memory.record_decision("Cache first", "cache_target", "Cached search rationale text")
+    cache = memory.search_cache
+
+    first = memory.search_decisions("cached  SEARCH", limit=3)
+    assert memory.search_decisions("Cached search", limit=3) == first
+    assert cache.stats()["hits"] == 1
+    assert memory.search_decisions("cached search", limit=3, mode="strict") == first # Different key
+    assert cache.stats()["misses"] == 2
+
+    # Local writes bump the generation
+    memory.record_decision("Cache second", "cache_target_2", "Another cached search rationale")
+    second = memory.search_decisions("cached search", limit=3)
+    assert cache.stats()["misses"] == 3 and len(second) == 2
+
+    # Bypass skips the lookup
+    hits = cache.stats()["hits"]
+    assert memory.search_decisions("cached search", limit=3, bypass_cache=True) == second
+    assert cache.stats()["hits"] == hits
+
+    # Commits from another connection (e.g. another process) change SQLite's data_version
+    other = SemanticMetaStore(memory.semantic.meta.db_path)
+    other.set_config("touched", "1")
+    other.close()
+    memory.search_decisions("cached search", limit=3)
+    assert cache.stats()["hits"] == hits
+
+    # TTL bound
+    expired = Memory(config=LedgermindConfig(storage_path=temp_storage, search_cache_ttl_ms=0))
+    expired.search_decisions("cached search", limit=3)
+    expired.search_decisions("cached search", limit=3)
+    assert expired.search_cache.stats()["hits"] == 0
+    memory.close()
+    expired.close()
+
+def _shared_store(path, read_only=False):
+    from ledgermind.core.stores.vector import VectorStore
+    vs = VectorStore(path, dimension=4, read_only=read_only)
+    vs._model = MagicMock()
+    def mock_encode(texts):
+        embs = []
+        for t in texts:
+            emb = np.zeros(4, dtype='float32')
+            emb[int(t[-1]) % 4] = 1.0
+            embs.append(emb)
+        return embs
+    vs._model.encode = mock_encode
+    import ledgermind.core.stores.vector
+    ledgermind.core.stores.vector.EMBEDDING_AVAILABLE = True
+    vs.load()
+    return vs
+
+def test_vector_index_shared_between_processes(temp_storage):
+    """Stores on one path (one per process) see each other's saves and merge concurrent writes."""
+    a = _shared_store(temp_storage)
+    b = _shared_store(temp_storage)
+    reader = _shared_store(temp_storage, read_only=True)
+
+    a.add_documents([{"id": "a0", "content": "doc 0"}])
+    a.save()
+    assert [r["id"] for r in b.search("query 0", limit=5)] == ["a0"]
+    assert [r["id"] for r in reader.search("query 0", limit=5)] == ["a0"]
+    assert isinstance(reader._vectors, np.memmap)
+
+    # Both write before either sees the other's rows: neither save may drop rows
+    b.add_documents([{"id": "b1", "content": "doc 1"}])
+    a.add_documents([{"id": "a2", "content": "doc 2"}])
+    a.save()
+    b.save()
+    assert sorted(a.search("query 1", limit=5)[i]["id"] for i in range(3)) == ["a0", "a2", "b1"]
+    assert reader.search("query 1", limit=1)[0]["id"] == "b1"
+    assert reader.search("query 2", limit=1)[0]["id"] == "a2"
+
+    # Deletions are persisted and seen by other processes
+    a.remove_id("a0")
+    a.save()
+    assert "a0" not in [r["id"] for r in reader.search("query 0", limit=5)]
+
+    # Unchanged manifest: searching does not reload
+    generation = reader._generation
+    assert reader.refresh() is False
+    assert reader._generation == generation
+
+def test_vector_search_save_does_not_race_writers(temp_storage):
+    """A save triggered by a search on a worker thread neither drops nor misaligns rows added meanwhile."""
+    import threading
+    import time
+
+    a = _shared_store(temp_storage)
+    b = _shared_store(temp_storage)
+    a.add_documents([{"id": "a0", "content": "doc 0"}])
+    a.save()
+    b.add_documents([{"id": "b1", "content": "doc 1"}])
+    a.add_documents([{"id": "a2", "content": "doc 2"}])
+    a.save() # b now has unsaved rows and a stale manifest, so its next search saves
+
+    writing, release = threading.Event(), threading.Event()
+    write = b._write
+    def paused_write(*args, **kwargs):
+        writing.set()
+        release.wait(5)
+        return write(*args, **kwargs)
+    b._write = paused_write
+
+    search = threading.Thread(target=b.search, args=("query 1",))
+    search.start()
+    assert writing.wait(5)
+    add = threading.Thread(target=b.add_documents, args=([{"id": "b3", "content": "doc 3"}],))
+    add.start()
+    time.sleep(0.2)
+    release.set()
+    search.join(5)
+    add.join(5)
+    b._write = write
+    b.save()
+
+    fresh = _shared_store(temp_storage)
+    assert sorted(fresh._doc_ids) == ["a0", "a2", "b1", "b3"]
+    for fid, row in zip(fresh._doc_ids, fresh._vectors):
+        assert int(np.argmax(row)) == int(fid[-1]) % 4
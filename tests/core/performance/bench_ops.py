@@ -2,6 +2,7 @@ import pytest
 import time
 import uuid
 from ledgermind.core.api.memory import Memory
+from ledgermind.core.stores.semantic_store.loader import MemoryLoader
 
 @pytest.fixture
 def memory_instance(tmp_path):
@@ -28,3 +29,145 @@ def test_benchmark_search_decisions(memory_instance, benchmark):
         memory_instance.search_decisions("finding", limit=5)
     
     benchmark(search)
+
+_SAMPLE = {
+    "kind": "decision", "source": "agent", "content": "Use PostgreSQL for persistence",
+    "timestamp": "2026-01-01T00:00:00",
+    "context": {
+        "title": "Use PostgreSQL", "target": "database", "status": "active",
+        "rationale": "Relational guarantees and mature tooling for our workload.",
+        "consequences": ["Migrate schemas", "Add connection pooling"], "supersedes": []
+    }
+}
+
+@pytest.mark.parametrize("fmt", [MemoryLoader.FORMAT_YAML, MemoryLoader.FORMAT_JSON])
+def test_benchmark_frontmatter_parse(benchmark, fmt):
+    content = MemoryLoader.stringify(dict(_SAMPLE), "# Body", fmt=fmt)
+    benchmark(MemoryLoader.parse, content)
+
+@pytest.mark.parametrize("fmt", [MemoryLoader.FORMAT_YAML, MemoryLoader.FORMAT_JSON])
+def test_benchmark_frontmatter_stringify(benchmark, fmt):
+    benchmark(MemoryLoader.stringify, dict(_SAMPLE), "# Body", fmt)
+
+def _audit_providers():
+    from ledgermind.core.stores.audit_git import GitAuditProvider
+    from ledgermind.core.stores.audit_fast_import import FastImportAuditProvider
+    return {"git": GitAuditProvider, "fast-import": FastImportAuditProvider}
+
+@pytest.mark.parametrize("writes", [1_000, 10_000])
+@pytest.mark.parametrize("backend", ["git", "fast-import"])
+def test_benchmark_audit_writes(tmp_path, benchmark, backend, writes):
+    """Raw audit cost of N add_artifact calls, published at the end."""
+    import os
+
+    def setup():
+        repo = str(tmp_path / uuid.uuid4().hex)
+        provider = _audit_providers()[backend](repo)
+        provider.initialize()
+        return (provider, repo), {}
+
+    def write_all(provider, repo):
+        for i in range(writes):
+            rel = f"decision_{i}.md"
+            content = f"---\nkind: decision\n---\n# Decision {i}\n"
+            with open(os.path.join(repo, rel), "w", encoding="utf-8") as f:
+                f.write(content)
+            provider.add_artifact(rel, content, f"Add decision {i}")
+        provider.flush()
+
+    benchmark.pedantic(write_all, setup=setup, rounds=1, iterations=1)
+
+def test_benchmark_record_decision_async_audit(tmp_path, benchmark):
+    """record_decision with Git commits moved to the background committer."""
+    from ledgermind.core.core.schemas import LedgermindConfig
+    mem = Memory(config=LedgermindConfig(storage_path=str(tmp_path / "bench_async"), async_audit=True))
+
+    def record():
+        u = uuid.uuid4().hex
+        mem.record_decision(
+            title=f"Performance Test {u}",
+            target=f"perf_target_{u}",
+            rationale="Benchmarking decision recording with the asynchronous audit committer."
+        )
+
+    benchmark(record)
+    mem.close()
+
+def _bridge_tools(path, corpus):
+    """Memory seeded with `corpus` decisions, and a call doing one get_relevant_context + record_interaction round via MCP."""
+    from ledgermind.server.server import MCPServer
+    mem = Memory(storage_path=path)
+    for i in range(corpus):
+        mem.record_decision(f"Decision {i}", f"target_{i}", f"Rationale for decision {i} with sufficient length for validation")
+    server = MCPServer(mem, storage_path=path, start_worker=False)
+    tools = server.mcp._tool_manager._tools
+
+    def call():
+        tools["get_relevant_context"].fn(prompt="Rationale for decision", limit=3)
+        tools["record_interaction"].fn(prompt="Which decision?", response="Decision 1", success=True)
+
+    return mem, call
+
+@pytest.mark.parametrize("corpus", [10, 200])
+def test_benchmark_mcp_bridge_tools(tmp_path, benchmark, corpus):
+    """get_relevant_context + record_interaction via MCP; per-call cost should not grow with the corpus."""
+    mem, call = _bridge_tools(str(tmp_path / "bench_bridge"), corpus)
+    benchmark(call)
+    mem.close()
+
+def test_mcp_bridge_tools_cost_flat_in_corpus(tmp_path):
+    """The bridge round at 200 decisions costs less than twice the round at 10."""
+    import statistics
+    bridges = {corpus: _bridge_tools(str(tmp_path / f"bridge_{corpus}"), corpus) for corpus in (10, 200)}
+    for _, call in bridges.values():
+        call()  # warm up caches and the vector index
+    # Interleave the corpora so drift on the machine hits both sides alike, and keep
+    # the best of several repeats (as timeit does) so a burst of noise cannot decide it
+    medians = {corpus: float("inf") for corpus in bridges}
+    for _ in range(5):
+        timings = {corpus: [] for corpus in bridges}
+        for _ in range(20):
+            for corpus, (_, call) in bridges.items():
+                start = time.perf_counter()
+                call()
+                timings[corpus].append(time.perf_counter() - start)
+        for corpus, samples in timings.items():
+            medians[corpus] = min(medians[corpus], statistics.median(samples))
+    for mem, _ in bridges.values():
+        mem.close()
+    assert medians[200] < 2 * medians[10], medians
+
+def test_benchmark_import_decisions(tmp_path, benchmark):
+    """10k decisions through import_decisions; target is 10k/minute on a laptop."""
+    items = [{"title": f"Decision {i}", "target": f"target_{i}", "rationale": f"Rationale for decision {i} with sufficient length"}
+             for i in range(10_000)]
+
+    def setup():
+        return (Memory(storage_path=str(tmp_path / f"bench_import_{uuid.uuid4().hex[:8]}")),), {}
+
+    benchmark.pedantic(lambda mem: mem.import_decisions(items), setup=setup, rounds=1, iterations=1)
+
+def test_benchmark_decay_columns(tmp_path, benchmark):
+    """1M events pulled from SQLite and run through the columnar decay evaluation; target is well under a second."""
+    import sqlite3
+    from datetime import datetime, timedelta
+    from ledgermind.core.reasoning.decay import DecayEngine
+    from ledgermind.core.stores.episodic import EpisodicStore
+
+    db_path = str(tmp_path / "bench_decay.db")
+    store = EpisodicStore(db_path)
+    start = datetime.now() - timedelta(days=90)
+    with sqlite3.connect(db_path) as conn:
+        conn.executemany(
+            "INSERT INTO events (source, kind, content, context, timestamp, status, linked_id) VALUES ('agent', ?, ?, '{}', ?, ?, ?)",
+            (("decision" if i % 10 == 0 else "result", f"Event {i}", (start + timedelta(seconds=i * 7)).isoformat(),
+              "active" if i % 3 else "archived", "decision_1.md" if i % 20 == 0 else None) for i in range(1_000_000))
+        )
+    engine = DecayEngine(ttl_days=30)
+
+    def decay():
+        cols = store.decay_columns()
+        return engine.evaluate_columns(cols["ids"], cols["timestamps"], cols["active"], cols["immortal"])
+
+    archive, prune, _ = benchmark(decay)
+    assert len(archive) + len(prune) > 0
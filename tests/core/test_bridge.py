@@ -102,3 +102,42 @@ def test_extended_core_interactions(bridge):
     # 8. Forget
     bridge.forget(new_id)
     assert new_id not in bridge.get_decisions()
+
+def test_bridge_wraps_open_memory(temp_memory_path):
+    from ledgermind.core.api.memory import Memory
+    memory = Memory(storage_path=temp_memory_path)
+    bridge = IntegrationBridge(memory=memory)
+    assert bridge.memory is memory
+    assert bridge.memory_path == os.path.abspath(temp_memory_path)
+
+def test_prompt_cache_reuses_near_duplicate_prompts(bridge):
+    import numpy as np
+    bridge.record_decision(
+        title="Database Choice",
+        target="db_engine",
+        rationale="We use SQLite for simplicity in this project"
+    )
+    # Paraphrases map to nearly the same unit vector, other prompts do not
+    vectors = {
+        "What database should I use?": np.array([1.0, 0.0, 0.0], dtype=np.float32),
+        "Which database should I use?": np.array([0.999, 0.04, 0.0], dtype=np.float32),
+        "How do I deploy?": np.array([0.0, 1.0, 0.0], dtype=np.float32),
+    }
+    bridge.memory.vector.encode_query = lambda q: vectors[q] / np.linalg.norm(vectors[q])
+    calls = []
+    search = bridge.memory.search_decisions
+    bridge.memory.search_decisions = lambda *a, **kw: calls.append(a) or search(*a, **kw)
+
+    first = bridge.get_context_for_prompt("What database should I use?")
+    assert "Database Choice" in first
+    assert bridge.get_context_for_prompt("Which database should I use?") == first
+    assert len(calls) == 1
+    assert bridge.prompt_cache.stats()["hits"] == 1
+
+    bridge.get_context_for_prompt("How do I deploy?")
+    assert len(calls) == 2
+
+    # Any write moves the store generation and invalidates cached prompts
+    bridge.record_decision(title="Cache Policy", target="cache", rationale="Cache search results per generation")
+    bridge.get_context_for_prompt("Which database should I use?")
+    assert len(calls) == 3
@@ -13,15 +13,12 @@ def mock_memory():
 def merge_engine(mock_memory):
     return MergeEngine(mock_memory)
 
-@patch("os.path.join")
-@patch("builtins.open")
-@patch("ledgermind.core.stores.semantic_store.loader.MemoryLoader.parse")
-def test_scan_for_duplicates_creates_proposal(mock_parse, mock_open, mock_join, merge_engine, mock_memory):
+def test_scan_for_duplicates_creates_proposal(merge_engine, mock_memory):
     # Setup mock data
     mock_memory.get_decisions.return_value = ["dec1.md", "dec2.md"]
     
     # Mock file reading for dec1.md
-    mock_parse.return_value = ({"content": "Same content", "context": {"title": "T1"}}, "Body")
+    mock_memory.semantic.parse_cache.get.return_value = ({"content": "Same content", "context": {"title": "T1"}}, "Body")
     
     # Mock search results - found a duplicate
     mock_memory.search_decisions.return_value = [
@@ -46,12 +43,9 @@ def test_scan_for_duplicates_creates_proposal(mock_parse, mock_open, mock_join,
     assert "dec1.md" in kwargs["context"].suggested_supersedes
     assert "dec2.md" in kwargs["context"].suggested_supersedes
 
-@patch("os.path.join")
-@patch("builtins.open")
-@patch("ledgermind.core.stores.semantic_store.loader.MemoryLoader.parse")
-def test_scan_for_duplicates_no_duplicates(mock_parse, mock_open, mock_join, merge_engine, mock_memory):
+def test_scan_for_duplicates_no_duplicates(merge_engine, mock_memory):
     mock_memory.get_decisions.return_value = ["dec1.md"]
-    mock_parse.return_value = ({"content": "Unique content"}, "Body")
+    mock_memory.semantic.parse_cache.get.return_value = ({"content": "Unique content"}, "Body")
     mock_memory.search_decisions.return_value = []
     
     proposals = merge_engine.scan_for_duplicates()
@@ -72,3 +72,18 @@ def test_cli_verbose_logging(tmp_path):
     assert result.returncode == 0
     # Should see some DEBUG logs in stderr due to setup_logging
     assert "DEBUG" in result.stderr
+
+def test_cli_import(tmp_path):
+    memory_path = str(tmp_path / ".ledgermind")
+    source = tmp_path / "decisions.jsonl"
+    source.write_text(
+        '{"title": "Use Postgres", "target": "database", "rationale": "Need concurrent writers"}\n'
+        '\n'
+        '{not json\n'
+        '{"title": "Use Redis", "target": "cache_layer", "rationale": "Low latency lookups"}\n'
+    )
+
+    result = run_cli(["import", str(source), "--path", memory_path])
+    assert result.returncode == 0
+    assert "Imported 2 decisions" in result.stdout
+    assert "line 3: Invalid JSON" in result.stdout
@@ -101,3 +101,18 @@ def test_full_tool_registration(mock_memory):
     expected_tools = ["record_decision", "supersede_decision", "search_decisions", "accept_proposal", "sync_git_history"]
     for tool in expected_tools:
         assert tool in tools
+
+def test_bridge_tools_reuse_server_memory(mock_memory):
+    """Bridge tools run against the server's Memory instead of opening a new one per call."""
+    mock_memory.search_decisions.return_value = []
+    server = MCPServer(memory=mock_memory, start_worker=False)
+    tools = server.mcp._tool_manager._tools
+
+    with patch("ledgermind.core.api.bridge.Memory") as memory_cls:
+        tools["get_relevant_context"].fn(prompt="anything", limit=3)
+        tools["record_interaction"].fn(prompt="question", response="answer", success=True)
+        tools["get_relevant_context"].fn(prompt="again", limit=3)
+    memory_cls.assert_not_called()
+    assert server.bridge.memory is mock_memory
+    assert mock_memory.search_decisions.call_count == 2
+    assert mock_memory.process_event.called
@@ -49,3 +49,27 @@ def test_maintenance_loop_skips_if_locked():
         pass
     
     assert True # Placeholder as logic moved to integration tests
+
+def test_git_maintenance_retried_when_locked():
+    """A git maintenance cycle skipped on the lock asks for a retry; the scheduler handles the interval."""
+    from ledgermind.server.background import BackgroundWorker
+
+    mock_memory = MagicMock()
+    mock_memory.run_git_maintenance.return_value = {"actions": [], "skipped": "locked"}
+    worker = BackgroundWorker(mock_memory)
+    worker.running = True
+
+    assert worker._run_git_maintenance() is False
+    assert worker._run_git_maintenance() is False
+    assert mock_memory.run_git_maintenance.call_count == 2
+    assert "git_maintenance" not in worker.last_run
+
+    mock_memory.run_git_maintenance.return_value = {"actions": ["repack"], "skipped": None}
+    assert worker._run_git_maintenance() is None
+    assert mock_memory.run_git_maintenance.call_count == 3
+    assert "git_maintenance" in worker.last_run
+
+    should_stop = mock_memory.run_git_maintenance.call_args.kwargs["should_stop"]
+    assert should_stop() is False
+    worker.running = False
+    assert should_stop() is True
@@ -0,0 +1,126 @@
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from ledgermind.core.core.schemas import MemoryEvent
+from ledgermind.server.scheduler import MaintenanceScheduler, MaintenanceTask
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_scheduler_skips_idle_tasks_and_defers_over_budget():
+    clock = FakeClock()
+    calls = []
+
+    def cheap():
+        calls.append("cheap")
+        clock.now += 0.05
+
+    def expensive():
+        calls.append("expensive")
+        clock.now += 0.5
+
+    probe = MagicMock(return_value=False)
+    scheduler = MaintenanceScheduler([
+        MaintenanceTask("cheap", cheap, interval_seconds=60, cost_ms=50),
+        MaintenanceTask("idle", MagicMock(), has_work=probe, interval_seconds=60),
+        MaintenanceTask("expensive", expensive, interval_seconds=60, cost_ms=500),
+    ], clock=clock)
+
+    outcomes = scheduler.run_slice(budget_ms=100)
+    assert outcomes == {"cheap": "runs", "idle": "idle", "expensive": "deferred"}
+    assert calls == ["cheap"]
+
+    # The deferred task goes first on the next slice, so it cannot starve
+    assert scheduler.next_due_in() == 0.0
+    outcomes = scheduler.run_slice(budget_ms=100)
+    assert outcomes == {"expensive": "runs"}
+    assert calls == ["cheap", "expensive"]
+
+    # Nothing is due: neither runs nor probes happen
+    assert scheduler.run_slice(budget_ms=100) == {}
+    assert probe.call_count == 1
+    assert scheduler.next_due_in() > 0
+
+    stats = scheduler.stats()
+    assert stats["idle"]["idle"] == 1
+    assert stats["expensive"]["deferred"] == 1
+    assert stats["expensive"]["runs"] == 1
+
+
+def test_scheduler_retries_tasks_that_report_not_run():
+    clock = FakeClock()
+    run = MagicMock(return_value=False)
+    scheduler = MaintenanceScheduler([MaintenanceTask("locked", run, interval_seconds=3600)], clock=clock)
+
+    scheduler.run_slice(budget_ms=1000)
+    scheduler.run_slice(budget_ms=1000)
+    assert run.call_count == 2
+
+    run.return_value = None
+    scheduler.run_slice(budget_ms=1000)
+    scheduler.run_slice(budget_ms=1000)
+    assert run.call_count == 3
+    stats = scheduler.stats()["locked"]
+    assert (stats["retry"], stats["runs"]) == (2, 1)
+
+
+def test_worker_tasks_run_as_soon_as_the_scheduler_finds_them_due():
+    """The scheduler is the only interval gate: a due task runs on its first probe, once per interval."""
+    from ledgermind.server.background import BackgroundWorker
+
+    memory = MagicMock()
+    memory.run_git_maintenance.return_value = {"actions": [], "skipped": None}
+    worker = BackgroundWorker(memory)
+    worker.running = True
+    clock = FakeClock()
+    worker.scheduler.clock = clock
+    names = ("reflection", "decay", "git_maintenance")
+
+    outcomes = worker.scheduler.run_slice(budget_ms=60_000)
+    assert all(outcomes[name] == "runs" for name in names)
+    calls = lambda: (memory.run_reflection.call_count, memory.run_decay.call_count, memory.run_git_maintenance.call_count)
+    assert calls() == (1, 1, 1)
+
+    clock.now += 1
+    assert not any(name in worker.scheduler.run_slice(budget_ms=60_000) for name in names)
+    clock.now += worker.DECAY_INTERVAL
+    outcomes = worker.scheduler.run_slice(budget_ms=60_000)
+    assert all(outcomes[name] == "runs" for name in names)
+    assert calls() == (2, 2, 2)
+
+
+def test_idle_store_probes_report_no_work(tmp_path):
+    from ledgermind.core.api.memory import Memory
+    from ledgermind.server.background import BackgroundWorker
+
+    memory = Memory(storage_path=str(tmp_path / "mem"))
+    try:
+        assert not memory.has_reflection_work()
+        assert not memory.has_decay_work()
+        assert not memory.has_git_maintenance_work()
+
+        worker = BackgroundWorker(memory)
+        memory.has_git_sync_work = MagicMock(return_value=False)
+        memory.run_reflection = MagicMock()
+        memory.run_decay = MagicMock()
+        outcomes = worker.scheduler.run_slice(worker.slice_budget_ms)
+        assert outcomes["reflection"] == "idle"
+        assert outcomes["decay"] == "idle"
+        memory.run_reflection.assert_not_called()
+        memory.run_decay.assert_not_called()
+
+        memory.episodic.append(MemoryEvent(source="agent", kind="result", content="fresh"))
+        assert memory.has_reflection_work()
+        assert not memory.has_decay_work()
+
+        old = datetime.now() - timedelta(days=memory.decay_engine.ttl_days + 1)
+        memory.episodic.append(MemoryEvent(source="agent", kind="result", content="stale", timestamp=old))
+        assert memory.has_decay_work()
+    finally:
+        memory.close()